@@ -17,6 +17,8 @@ from uuid import UUID
 
 from botelier.database import get_db
 from botelier.models.assistant import Assistant
+from botelier.voice import call_cache
+from botelier.api.responses import ORJSONResponse
 
 
 router = APIRouter(prefix="/api/assistants", tags=["assistants"])
@@ -109,20 +111,21 @@ async def list_assistants(
     Returns:
     - List of assistants
     """
-    query = db.query(Assistant)
+    criteria = []
     
     if hotel_id:
-        query = query.filter(Assistant.hotel_id == hotel_id)
+        criteria.append(Assistant.hotel_id == hotel_id)
     
     if is_active is not None:
-        query = query.filter(Assistant.is_active == is_active)
+        criteria.append(Assistant.is_active == is_active)
     
-    assistants = query.order_by(Assistant.created_at.desc()).all()
+    # Column rows serialized straight to JSON - no ORM objects or to_dict() per row
+    assistants = Assistant.select_dicts(db, *criteria)
     
-    return {
-        "assistants": [assistant.to_dict() for assistant in assistants],
+    return ORJSONResponse({
+        "assistants": assistants,
         "total": len(assistants)
-    }
+    })
 
 
 @router.get("/{assistant_id}", response_model=AssistantResponse)
@@ -143,7 +146,7 @@ async def get_assistant(
     if not assistant:
         raise HTTPException(status_code=404, detail="Assistant not found")
     
-    return assistant.to_dict()
+    return ORJSONResponse(assistant.to_dict())
 
 
 @router.post("", response_model=AssistantResponse, status_code=201)
@@ -186,7 +189,7 @@ async def create_assistant(
     db.commit()
     db.refresh(assistant)
     
-    return assistant.to_dict()
+    return ORJSONResponse(assistant.to_dict(), status_code=201)
 
 
 @router.put("/{assistant_id}", response_model=AssistantResponse)
@@ -218,5 +221,6 @@ async def update_assistant(
     
     db.commit()
     db.refresh(assistant)
+    call_cache.invalidate_assistant(assistant.id)
     
-    return assistant.to_dict()
+    return ORJSONResponse(assistant.to_dict())
@@ -16,14 +16,16 @@ Endpoints:
 
 import csv
 import io
-from datetime import date, datetime
+from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile, File
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
+from botelier.api.responses import ORJSONResponse
 from botelier.database import get_db
 from botelier.models.knowledge_entry import KnowledgeEntry
+from botelier.voice.knowledge_handler import invalidate_hotel_knowledge
 
 
 router = APIRouter(prefix="/api/entries", tags=["entries"])
@@ -111,8 +113,9 @@ async def create_entry(
     db.add(entry)
     db.commit()
     db.refresh(entry)
+    invalidate_hotel_knowledge(entry.hotel_id)
     
-    return entry.to_dict()
+    return ORJSONResponse(entry.to_dict(), status_code=201)
 
 
 @router.get("", response_model=dict)
@@ -141,18 +144,14 @@ async def list_entries(
     
     # Filter expired entries unless explicitly included
     if not include_expired:
-        today = date.today()
-        query = query.filter(
-            (KnowledgeEntry.expiration_date.is_(None)) | 
-            (KnowledgeEntry.expiration_date >= today)
-        )
+        query = query.filter(~KnowledgeEntry.is_expired)
     
     entries = query.order_by(KnowledgeEntry.created_at.desc()).all()
     
-    return {
+    return ORJSONResponse({
         "entries": [entry.to_dict() for entry in entries],
         "total": len(entries)
-    }
+    })
 
 
 @router.delete("/bulk", status_code=200)
@@ -174,6 +173,8 @@ async def bulk_delete_entries(
     ).delete(synchronize_session=False)
     
     db.commit()
+    # Entries may span hotels
+    invalidate_hotel_knowledge()
     
     return {
         "success": True,
@@ -204,6 +205,7 @@ async def bulk_update_entries(
     )
     
     db.commit()
+    invalidate_hotel_knowledge()
     
     return {
         "success": True,
@@ -230,7 +232,7 @@ async def get_entry(
     if not entry:
         raise HTTPException(status_code=404, detail="Entry not found")
     
-    return entry.to_dict()
+    return ORJSONResponse(entry.to_dict())
 
 
 @router.put("/{entry_id}")
@@ -273,8 +275,9 @@ async def update_entry(
     
     db.commit()
     db.refresh(entry)
+    invalidate_hotel_knowledge(entry.hotel_id)
     
-    return entry.to_dict()
+    return ORJSONResponse(entry.to_dict())
 
 
 @router.delete("/{entry_id}", status_code=204)
@@ -298,6 +301,7 @@ async def delete_entry(
     
     db.delete(entry)
     db.commit()
+    invalidate_hotel_knowledge(entry.hotel_id)
 
 
 @router.post("/import-csv", status_code=201)
@@ -336,7 +340,7 @@ async def import_csv(
         )
     
     # Process rows
-    created_count = 0
+    new_rows = []
     error_count = 0
     errors = []
     
@@ -363,29 +367,27 @@ async def import_csv(
                     errors.append(f"Row {row_num}: Invalid date format '{exp_date_str}'")
                     continue
             
-            # Create entry
-            entry = KnowledgeEntry(
-                hotel_id=hotel_id,
-                question=question,
-                answer=answer,
-                category=category,
-                expiration_date=exp_date
-            )
-            
-            db.add(entry)
-            created_count += 1
+            new_rows.append({
+                "hotel_id": hotel_id,
+                "question": question,
+                "answer": answer,
+                "category": category,
+                "expiration_date": exp_date,
+            })
             
         except Exception as e:
             error_count += 1
             errors.append(f"Row {row_num}: {str(e)}")
     
-    # Commit all entries
-    if created_count > 0:
+    # Insert all valid rows in batched multi-row statements
+    if new_rows:
+        KnowledgeEntry.bulk_create(db, new_rows)
         db.commit()
+        invalidate_hotel_knowledge(hotel_id)
     
     return {
         "success": True,
-        "created": created_count,
+        "created": len(new_rows),
         "errors": error_count,
         "error_details": errors[:10]  # Limit to first 10 errors
     }
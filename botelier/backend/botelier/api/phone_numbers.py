@@ -16,12 +16,14 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from botelier.api.responses import ORJSONResponse
 from botelier.database import get_db
 from botelier.models.phone_number import PhoneNumber
 from botelier.models.hotel import Hotel
 from botelier.models.assistant import Assistant
 from botelier.integrations.twilio.phone_numbers import PhoneNumberManager
 from botelier.config.domain import get_public_base_url
+from botelier.voice import call_cache
 
 
 router = APIRouter(prefix="/api/phone-numbers", tags=["phone-numbers"])
@@ -144,10 +146,10 @@ async def list_phone_numbers(
     
     numbers = query.all()
     
-    return {
+    return ORJSONResponse({
         "phone_numbers": [num.to_dict() for num in numbers],
         "total": len(numbers)
-    }
+    })
 
 
 @router.post("/purchase", response_model=PhoneNumberResponse)
@@ -231,7 +233,7 @@ async def purchase_phone_number(
         db.commit()
         db.refresh(phone_number)
         
-        return phone_number.to_dict()
+        return ORJSONResponse(phone_number.to_dict())
         
     except Exception as e:
         db.rollback()
@@ -286,8 +288,9 @@ async def assign_to_assistant(
     
     db.commit()
     db.refresh(phone_number)
+    call_cache.invalidate_phone_number(phone_number.phone_number)
     
-    return phone_number.to_dict()
+    return ORJSONResponse(phone_number.to_dict())
 
 
 @router.delete("/{phone_number_id}")
@@ -329,6 +332,7 @@ async def release_phone_number(
             # Delete from database
             db.delete(phone_number)
             db.commit()
+            call_cache.invalidate_phone_number(phone_number.phone_number)
             
             return {"message": "Phone number released successfully"}
         else:
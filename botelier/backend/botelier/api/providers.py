@@ -5,31 +5,27 @@ This endpoint provides frontend with provider options, models, voices, and param
 """
 
 from typing import Optional
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from botelier.config.providers import (
     STT_PROVIDERS,
     LLM_PROVIDERS,
     TTS_PROVIDERS,
     PROVIDER_PARAMS,
+    PROVIDER_PARAMS_JSON,
     is_flux_model,
 )
+from botelier.models.serialization import dumps
 
 
 router = APIRouter(prefix="/api/providers", tags=["providers"])
 
 
-@router.get("/stt")
-async def get_stt_providers():
-    """
-    Get all available STT providers with their models and parameters.
-    
-    Returns provider configurations that map to Pipecat's STTService implementations.
-    """
+def _build_stt_providers() -> dict:
+    """Build the STT provider listing served by GET /api/providers/stt."""
     providers_data = {}
     
-    for provider_enum, config in STT_PROVIDERS.items():
-        provider_id = provider_enum.value
+    for provider_id, config in STT_PROVIDERS.items():
         provider_data = {
             "id": provider_id,
             "display_name": config.display_name,
@@ -56,17 +52,11 @@ async def get_stt_providers():
     return {"providers": providers_data}
 
 
-@router.get("/llm")
-async def get_llm_providers():
-    """
-    Get all available LLM providers with their models and parameters.
-    
-    Returns provider configurations that map to Pipecat's LLMService implementations.
-    """
+def _build_llm_providers() -> dict:
+    """Build the LLM provider listing served by GET /api/providers/llm."""
     providers_data = {}
     
-    for provider_enum, config in LLM_PROVIDERS.items():
-        provider_id = provider_enum.value
+    for provider_id, config in LLM_PROVIDERS.items():
         providers_data[provider_id] = {
             "id": provider_id,
             "display_name": config.display_name,
@@ -86,18 +76,11 @@ async def get_llm_providers():
     return {"providers": providers_data}
 
 
-@router.get("/tts")
-async def get_tts_providers(model: Optional[str] = Query(None, description="Filter voices by model")):
-    """
-    Get all available TTS providers with their models and voices.
-    
-    Returns provider configurations that map to Pipecat's TTSService implementations.
-    For providers like Deepgram Aura where voices are model-specific, voices are grouped by model.
-    """
+def _build_tts_providers() -> dict:
+    """Build the TTS provider listing served by GET /api/providers/tts."""
     providers_data = {}
     
-    for provider_enum, config in TTS_PROVIDERS.items():
-        provider_id = provider_enum.value
+    for provider_id, config in TTS_PROVIDERS.items():
         
         # Organize models
         models_list = [{"value": m, "label": m} for m in config.available_models]
@@ -161,19 +144,61 @@ async def get_tts_providers(model: Optional[str] = Query(None, description="Filt
     return {"providers": providers_data}
 
 
+# Provider configs are static, so the listings are built and JSON-encoded
+# once at import and served as raw bytes (skipping jsonable_encoder per request)
+STT_PROVIDERS_JSON: bytes = dumps(_build_stt_providers())
+LLM_PROVIDERS_JSON: bytes = dumps(_build_llm_providers())
+TTS_PROVIDERS_JSON: bytes = dumps(_build_tts_providers())
+
+
+@router.get("/stt")
+async def get_stt_providers():
+    """
+    Get all available STT providers with their models and parameters.
+    
+    Returns provider configurations that map to Pipecat's STTService implementations.
+    """
+    return Response(content=STT_PROVIDERS_JSON, media_type="application/json")
+
+
+@router.get("/llm")
+async def get_llm_providers():
+    """
+    Get all available LLM providers with their models and parameters.
+    
+    Returns provider configurations that map to Pipecat's LLMService implementations.
+    """
+    return Response(content=LLM_PROVIDERS_JSON, media_type="application/json")
+
+
+@router.get("/tts")
+async def get_tts_providers(model: Optional[str] = Query(None, description="Filter voices by model")):
+    """
+    Get all available TTS providers with their models and voices.
+    
+    Returns provider configurations that map to Pipecat's TTSService implementations.
+    For providers like Deepgram Aura where voices are model-specific, voices are grouped by model.
+    """
+    return Response(content=TTS_PROVIDERS_JSON, media_type="application/json")
+
+
+@router.get("/params")
+async def get_provider_params():
+    """
+    Get provider-specific parameter schemas used to build the settings UI.
+    
+    Served straight from the static provider_params.json bytes.
+    """
+    return Response(content=PROVIDER_PARAMS_JSON, media_type="application/json")
+
+
 @router.get("/stt/{provider_id}")
 async def get_stt_provider(provider_id: str):
     """Get detailed configuration for a specific STT provider."""
-    provider_enum = None
-    for p in STT_PROVIDERS.keys():
-        if p.value == provider_id:
-            provider_enum = p
-            break
+    config = STT_PROVIDERS.get(provider_id)
+    if not config:
+        raise HTTPException(status_code=404, detail="Provider not found")
     
-    if not provider_enum or provider_enum not in STT_PROVIDERS:
-        return {"error": "Provider not found"}, 404
-    
-    config = STT_PROVIDERS[provider_enum]
     return {
         "id": provider_id,
         "display_name": config.display_name,
@@ -188,16 +213,10 @@ async def get_stt_provider(provider_id: str):
 @router.get("/llm/{provider_id}")
 async def get_llm_provider(provider_id: str):
     """Get detailed configuration for a specific LLM provider."""
-    provider_enum = None
-    for p in LLM_PROVIDERS.keys():
-        if p.value == provider_id:
-            provider_enum = p
-            break
-    
-    if not provider_enum or provider_enum not in LLM_PROVIDERS:
-        return {"error": "Provider not found"}, 404
+    config = LLM_PROVIDERS.get(provider_id)
+    if not config:
+        raise HTTPException(status_code=404, detail="Provider not found")
     
-    config = LLM_PROVIDERS[provider_enum]
     return {
         "id": provider_id,
         "display_name": config.display_name,
@@ -211,16 +230,10 @@ async def get_llm_provider(provider_id: str):
 @router.get("/tts/{provider_id}")
 async def get_tts_provider(provider_id: str):
     """Get detailed configuration for a specific TTS provider."""
-    provider_enum = None
-    for p in TTS_PROVIDERS.keys():
-        if p.value == provider_id:
-            provider_enum = p
-            break
-    
-    if not provider_enum or provider_enum not in TTS_PROVIDERS:
-        return {"error": "Provider not found"}, 404
+    config = TTS_PROVIDERS.get(provider_id)
+    if not config:
+        raise HTTPException(status_code=404, detail="Provider not found")
     
-    config = TTS_PROVIDERS[provider_enum]
     return {
         "id": provider_id,
         "display_name": config.display_name,
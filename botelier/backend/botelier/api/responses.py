@@ -0,0 +1,21 @@
+"""
+Response classes shared by the API routers.
+"""
+
+from fastapi import Response
+
+from botelier.models import serialization
+
+
+class ORJSONResponse(Response):
+    """
+    JSON response rendered with orjson.
+    
+    Model to_dict() rows keep native UUIDs, dates and datetimes; they are
+    stringified here in one C pass (naive UTC datetimes get a "Z" suffix).
+    Returning this from a route also skips FastAPI's jsonable_encoder walk.
+    """
+    media_type = "application/json"
+    
+    def render(self, content) -> bytes:
+        return serialization.dumps(content)
@@ -6,8 +6,8 @@ Provides CRUD operations for managing AI assistant tools/functions.
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
-import uuid
+from typing import List, Optional
+from uuid import UUID
 
 from botelier.database import get_db
 from botelier.models.tool import Tool, ToolType as DBToolType
@@ -18,13 +18,14 @@ from botelier.schemas.tool_schemas import (
     ToolListResponse,
     ToolType
 )
+from botelier.voice import call_cache
 
 router = APIRouter(prefix="/api/tools", tags=["tools"])
 
 
 @router.get("", response_model=ToolListResponse)
 def list_tools(
-    assistant_id: str = None,
+    assistant_id: Optional[UUID] = None,
     tool_type: str = None,
     db: Session = Depends(get_db)
 ):
@@ -58,7 +59,7 @@ def list_tools(
 
 
 @router.get("/{tool_id}", response_model=ToolResponse)
-def get_tool(tool_id: str, db: Session = Depends(get_db)):
+def get_tool(tool_id: UUID, db: Session = Depends(get_db)):
     """Get a specific tool by ID."""
     tool = db.query(Tool).filter(Tool.id == tool_id).first()
     
@@ -87,33 +88,30 @@ def create_tool(tool_data: ToolCreate, db: Session = Depends(get_db)):
         }
     }
     """
-    # Generate unique ID
-    tool_id = str(uuid.uuid4())
-    
     # Convert Pydantic enum to SQLAlchemy enum
     db_tool_type = DBToolType(tool_data.tool_type.value)
     
     # Create database model
     new_tool = Tool(
-        id=tool_id,
         name=tool_data.name,
         description=tool_data.description,
         tool_type=db_tool_type,
         config=tool_data.config,
         assistant_id=tool_data.assistant_id,
-        is_active="true" if tool_data.is_active else "false"
+        is_active=tool_data.is_active
     )
     
     db.add(new_tool)
     db.commit()
     db.refresh(new_tool)
+    call_cache.invalidate_assistant_tools(new_tool.assistant_id)
     
     return ToolResponse(**new_tool.to_dict())
 
 
 @router.put("/{tool_id}", response_model=ToolResponse)
 def update_tool(
-    tool_id: str,
+    tool_id: UUID,
     tool_data: ToolUpdate,
     db: Session = Depends(get_db)
 ):
@@ -134,16 +132,17 @@ def update_tool(
     if tool_data.config is not None:
         tool.config = tool_data.config
     if tool_data.is_active is not None:
-        tool.is_active = "true" if tool_data.is_active else "false"
+        tool.is_active = tool_data.is_active
     
     db.commit()
     db.refresh(tool)
+    call_cache.invalidate_assistant_tools(tool.assistant_id)
     
     return ToolResponse(**tool.to_dict())
 
 
 @router.delete("/{tool_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_tool(tool_id: str, db: Session = Depends(get_db)):
+def delete_tool(tool_id: UUID, db: Session = Depends(get_db)):
     """Delete a tool."""
     tool = db.query(Tool).filter(Tool.id == tool_id).first()
     
@@ -155,5 +154,6 @@ def delete_tool(tool_id: str, db: Session = Depends(get_db)):
     
     db.delete(tool)
     db.commit()
+    call_cache.invalidate_assistant_tools(tool.assistant_id)
     
     return None
@@ -6,11 +6,11 @@ between Twilio and Pipecat voice pipelines.
 """
 
 import json
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
+from starlette.websockets import WebSocketState
 from loguru import logger
 
-from ..database import get_db
+from ..database import AsyncSessionLocal
 from ..voice.call_handler import CallHandler
 
 
@@ -22,7 +22,6 @@ async def websocket_call_endpoint(
     websocket: WebSocket,
     from_number: str = Query("", alias="from"),  # Binds to ?from=... query param
     to: str = Query("", alias="to"),  # Binds to ?to=... query param
-    db: Session = Depends(get_db)
 ):
     """
     WebSocket endpoint for Twilio Media Streams.
@@ -47,13 +46,13 @@ async def websocket_call_endpoint(
     URL format: wss://domain/ws/call?from=+1234567890&to=+0987654321
     """
     # Log WebSocket endpoint hit for debugging
-    logger.info(f"🔌 WebSocket endpoint /ws/call hit - From: {from_number} → To: {to}")
-    logger.info(f"WebSocket state: {websocket.client_state}")
+    logger.info("🔌 WebSocket endpoint /ws/call hit - From: {} → To: {}", from_number, to)
+    logger.debug("WebSocket state: {}", websocket.client_state)
     
     try:
         # Create call handler - it will accept WebSocket and orchestrate Pipecat pipeline
         # CallHandler validates phone number after accepting WebSocket (can't close before accept)
-        handler = CallHandler(db)
+        handler = CallHandler(AsyncSessionLocal)
         await handler.handle_call(
             websocket=websocket,
             from_number=from_number or "Unknown",
@@ -61,9 +60,9 @@ async def websocket_call_endpoint(
         )
         
     except Exception as e:
-        logger.exception(f"Error in WebSocket endpoint: {e}")
+        logger.exception("Error in WebSocket endpoint: {}", e)
         try:
-            if websocket.client_state.name == "CONNECTED":
+            if websocket.client_state is WebSocketState.CONNECTED:
                 await websocket.close()
         except:
             pass
@@ -5,9 +5,11 @@ This module defines all available STT, LLM, and TTS providers
 that hotels can choose from when configuring their voice agents.
 """
 
+import orjson
 from enum import Enum
-from typing import Dict, List, Any
-from pydantic import BaseModel, Field
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class STTProvider(str, Enum):
@@ -65,13 +67,23 @@ class TTSProvider(str, Enum):
     SARVAM = "sarvam"
 
 
+# Valid provider names for O(1) membership checks (no Enum(name) try/except)
+VALID_STT_PROVIDERS: frozenset[str] = frozenset(p.value for p in STTProvider)
+VALID_LLM_PROVIDERS: frozenset[str] = frozenset(p.value for p in LLMProvider)
+VALID_TTS_PROVIDERS: frozenset[str] = frozenset(p.value for p in TTSProvider)
+
+
 class ProviderConfig(BaseModel):
     """Base configuration for any AI provider"""
+    # Configs are static for the process lifetime; freezing them makes it
+    # safe to serialize once and share the result across requests
+    model_config = ConfigDict(frozen=True)
+    
     provider_type: str
     display_name: str
     description: str
     requires_api_key: bool = True
-    supported_languages: List[str] = Field(default_factory=list)
+    supported_languages: Tuple[str, ...] = ()
     default_model: str = ""
     available_models: List[str] = Field(default_factory=list)
 
@@ -99,13 +111,20 @@ class TTSConfig(ProviderConfig):
     supports_pitch_control: bool = False
 
 
-STT_PROVIDERS: Dict[STTProvider, STTConfig] = {
-    STTProvider.DEEPGRAM: STTConfig(
+# Shared language sets - most providers support one of these, so configs
+# reference the same immutable tuple instead of repeating list literals
+_LANGS_CORE = ("en", "es", "fr", "de", "pt", "ja", "ko", "zh")
+_LANGS_STANDARD = ("en", "es", "fr", "de", "it", "pt", "ja", "ko", "zh")
+_LANGS_EXTENDED = ("en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru", "ja", "ko", "zh")
+
+
+STT_PROVIDERS: Dict[str, STTConfig] = {
+    "deepgram": STTConfig(
         provider_type="stt",
         display_name="Deepgram",
         description="High-accuracy speech recognition with low latency",
         requires_api_key=True,
-        supported_languages=["en", "es", "fr", "de", "pt", "ja", "ko", "zh"],
+        supported_languages=_LANGS_CORE,
         default_model="nova-3-general",
         available_models=[
             "nova-3-general",
@@ -124,24 +143,24 @@ STT_PROVIDERS: Dict[STTProvider, STTConfig] = {
         supports_diarization=True,
         supports_interim_results=True,
     ),
-    STTProvider.OPENAI_WHISPER: STTConfig(
+    "openai_whisper": STTConfig(
         provider_type="stt",
         display_name="OpenAI Whisper",
         description="OpenAI's speech recognition model",
         requires_api_key=True,
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_EXTENDED,
         default_model="whisper-1",
         available_models=["whisper-1"],
         supports_vad=False,
         supports_diarization=False,
         supports_interim_results=False,
     ),
-    STTProvider.ASSEMBLYAI: STTConfig(
+    "assemblyai": STTConfig(
         provider_type="stt",
         display_name="AssemblyAI",
         description="Real-time speech recognition with advanced features",
         requires_api_key=True,
-        supported_languages=["en"],
+        supported_languages=("en",),
         default_model="universal-streaming-english",
         available_models=["universal-streaming-english", "universal-streaming-multilingual"],
         supports_vad=True,
@@ -150,13 +169,13 @@ STT_PROVIDERS: Dict[STTProvider, STTConfig] = {
     ),
 }
 
-LLM_PROVIDERS: Dict[LLMProvider, LLMConfig] = {
-    LLMProvider.OPENAI: LLMConfig(
+LLM_PROVIDERS: Dict[str, LLMConfig] = {
+    "openai": LLMConfig(
         provider_type="llm",
         display_name="OpenAI",
         description="GPT-4 and GPT-3.5 models for conversational AI",
         requires_api_key=True,
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ja", "ko", "zh"],
+        supported_languages=_LANGS_STANDARD,
         default_model="gpt-4o-mini",
         available_models=["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"],
         supports_function_calling=True,
@@ -164,12 +183,12 @@ LLM_PROVIDERS: Dict[LLMProvider, LLMConfig] = {
         max_context_tokens=128000,
         supports_vision=True,
     ),
-    LLMProvider.ANTHROPIC: LLMConfig(
+    "anthropic": LLMConfig(
         provider_type="llm",
         display_name="Anthropic Claude",
         description="Claude models with long context and strong reasoning",
         requires_api_key=True,
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ja", "ko", "zh"],
+        supported_languages=_LANGS_STANDARD,
         default_model="claude-3-5-sonnet-20241022",
         available_models=["claude-3-5-sonnet-20241022", "claude-3-opus-20240229", "claude-3-haiku-20240307"],
         supports_function_calling=True,
@@ -177,12 +196,12 @@ LLM_PROVIDERS: Dict[LLMProvider, LLMConfig] = {
         max_context_tokens=200000,
         supports_vision=True,
     ),
-    LLMProvider.GOOGLE_GEMINI: LLMConfig(
+    "google_gemini": LLMConfig(
         provider_type="llm",
         display_name="Google Gemini",
         description="Google's multimodal AI models",
         requires_api_key=True,
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ja", "ko", "zh"],
+        supported_languages=_LANGS_STANDARD,
         default_model="gemini-2.0-flash-exp",
         available_models=["gemini-2.0-flash-exp", "gemini-1.5-pro", "gemini-1.5-flash"],
         supports_function_calling=True,
@@ -192,13 +211,13 @@ LLM_PROVIDERS: Dict[LLMProvider, LLMConfig] = {
     ),
 }
 
-TTS_PROVIDERS: Dict[TTSProvider, TTSConfig] = {
-    TTSProvider.DEEPGRAM: TTSConfig(
+TTS_PROVIDERS: Dict[str, TTSConfig] = {
+    "deepgram": TTSConfig(
         provider_type="tts",
         display_name="Deepgram Aura",
         description="Fast, natural-sounding voice synthesis",
         requires_api_key=True,
-        supported_languages=["en", "es"],
+        supported_languages=("en", "es"),
         default_model="aura-2",
         available_models=["aura-2", "aura-1"],
         available_voices=[
@@ -226,12 +245,12 @@ TTS_PROVIDERS: Dict[TTSProvider, TTSConfig] = {
         supports_speed_control=True,
         supports_pitch_control=False,
     ),
-    TTSProvider.CARTESIA: TTSConfig(
+    "cartesia": TTSConfig(
         provider_type="tts",
         display_name="Cartesia",
         description="Ultra-low latency voice synthesis",
         requires_api_key=True,
-        supported_languages=["en", "es", "fr", "de", "pt", "ja", "ko", "zh"],
+        supported_languages=_LANGS_CORE,
         default_model="sonic-english",
         available_models=["sonic-english", "sonic-multilingual"],
         available_voices=[
@@ -244,12 +263,12 @@ TTS_PROVIDERS: Dict[TTSProvider, TTSConfig] = {
         supports_speed_control=True,
         supports_pitch_control=False,
     ),
-    TTSProvider.ELEVENLABS: TTSConfig(
+    "elevenlabs": TTSConfig(
         provider_type="tts",
         display_name="ElevenLabs",
         description="High-quality, expressive voice synthesis",
         requires_api_key=True,
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "pl", "hi", "ja", "ko", "zh"],
+        supported_languages=("en", "es", "fr", "de", "it", "pt", "pl", "hi", "ja", "ko", "zh"),
         default_model="eleven_flash_v2_5",
         available_models=["eleven_flash_v2_5", "eleven_turbo_v2_5", "eleven_multilingual_v2"],
         available_voices=[
@@ -262,12 +281,12 @@ TTS_PROVIDERS: Dict[TTSProvider, TTSConfig] = {
         supports_speed_control=True,
         supports_pitch_control=False,
     ),
-    TTSProvider.OPENAI: TTSConfig(
+    "openai": TTSConfig(
         provider_type="tts",
         display_name="OpenAI TTS",
         description="OpenAI's text-to-speech models",
         requires_api_key=True,
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "nl", "pl", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_EXTENDED,
         default_model="tts-1",
         available_models=["tts-1", "tts-1-hd"],
         available_voices=[
@@ -288,12 +307,17 @@ TTS_PROVIDERS: Dict[TTSProvider, TTSConfig] = {
 def get_provider_config(provider_type: str, provider_name: str) -> ProviderConfig:
     """Get configuration for a specific provider"""
     if provider_type == "stt":
-        return STT_PROVIDERS.get(STTProvider(provider_name))
+        valid_names, configs = VALID_STT_PROVIDERS, STT_PROVIDERS
     elif provider_type == "llm":
-        return LLM_PROVIDERS.get(LLMProvider(provider_name))
+        valid_names, configs = VALID_LLM_PROVIDERS, LLM_PROVIDERS
     elif provider_type == "tts":
-        return TTS_PROVIDERS.get(TTSProvider(provider_name))
-    raise ValueError(f"Unknown provider type: {provider_type}")
+        valid_names, configs = VALID_TTS_PROVIDERS, TTS_PROVIDERS
+    else:
+        raise ValueError(f"Unknown provider type: {provider_type}")
+    
+    if provider_name not in valid_names:
+        raise ValueError(f"Unknown {provider_type} provider: {provider_name}")
+    return configs.get(provider_name)
 
 
 def is_flux_model(model: str) -> bool:
@@ -301,95 +325,7 @@ def is_flux_model(model: str) -> bool:
     return model and model.startswith("flux-")
 
 
-# Provider-specific parameter schemas (matching Pipecat's InputParams)
-PROVIDER_PARAMS = {
-    "stt": {
-        "deepgram_standard": {
-            "punctuate": {"type": "boolean", "default": True, "label": "Punctuate"},
-            "profanity_filter": {"type": "boolean", "default": True, "label": "Profanity Filter"},
-            "smart_format": {"type": "boolean", "default": True, "label": "Smart Format"},
-            "vad_events": {"type": "boolean", "default": False, "label": "VAD Events"},
-        },
-        "deepgram_flux": {
-            "eager_eot_threshold": {
-                "type": "number",
-                "min": 0.0,
-                "max": 1.0,
-                "step": 0.1,
-                "default": None,
-                "label": "Eager End-of-Turn Threshold",
-                "description": "Lower = faster response, more LLM calls"
-            },
-            "eot_threshold": {
-                "type": "number",
-                "min": 0.0,
-                "max": 1.0,
-                "step": 0.1,
-                "default": 0.7,
-                "label": "End-of-Turn Threshold"
-            },
-            "eot_timeout_ms": {
-                "type": "number",
-                "min": 1000,
-                "max": 10000,
-                "step": 500,
-                "default": 5000,
-                "label": "End-of-Turn Timeout (ms)"
-            },
-        },
-    },
-    "llm": {
-        "openai": {
-            "frequency_penalty": {
-                "type": "number",
-                "min": -2.0,
-                "max": 2.0,
-                "step": 0.1,
-                "default": 0.0,
-                "label": "Frequency Penalty",
-                "description": "Reduces token repetition based on frequency"
-            },
-            "presence_penalty": {
-                "type": "number",
-                "min": -2.0,
-                "max": 2.0,
-                "step": 0.1,
-                "default": 0.0,
-                "label": "Presence Penalty",
-                "description": "Reduces repetition of any tokens"
-            },
-            "top_p": {
-                "type": "number",
-                "min": 0.0,
-                "max": 1.0,
-                "step": 0.05,
-                "default": 1.0,
-                "label": "Top P"
-            },
-        },
-        "anthropic": {
-            "top_k": {
-                "type": "number",
-                "min": 0,
-                "max": 500,
-                "step": 10,
-                "default": 0,
-                "label": "Top K"
-            },
-            "top_p": {
-                "type": "number",
-                "min": 0.0,
-                "max": 1.0,
-                "step": 0.05,
-                "default": 1.0,
-                "label": "Top P"
-            },
-            "enable_prompt_caching": {
-                "type": "boolean",
-                "default": False,
-                "label": "Enable Prompt Caching",
-                "description": "Cache system prompts for 50% cost savings"
-            },
-        },
-    },
-}
+# Provider-specific parameter schemas (matching Pipecat's InputParams).
+# Stored as static JSON so the raw bytes can be served to the frontend as-is.
+PROVIDER_PARAMS_JSON: bytes = (Path(__file__).parent / "provider_params.json").read_bytes()
+PROVIDER_PARAMS: Dict[str, Dict[str, Any]] = orjson.loads(PROVIDER_PARAMS_JSON)
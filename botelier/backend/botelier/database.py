@@ -5,7 +5,12 @@ Uses SQLAlchemy with PostgreSQL for multi-tenant data persistence.
 """
 
 import os
-from sqlalchemy import create_engine
+import shlex
+import ssl
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -25,6 +30,138 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+# libpq connection parameters and how the asyncpg engine takes them.
+# Negotiated by asyncpg itself or with no asyncpg equivalent; dropped
+_LIBPQ_IGNORED = frozenset((
+    "channel_binding",
+    "gssencmode",
+    "gsslib",
+    "keepalives",
+    "keepalives_count",
+    "keepalives_idle",
+    "keepalives_interval",
+    "krbsrvname",
+    "sslcompression",
+    "sslsni",
+))
+# Client certificate settings, folded into an SSLContext
+_LIBPQ_SSL_FILES = frozenset(("sslrootcert", "sslcert", "sslkey"))
+# asyncpg connect() arguments accepted as-is: name -> type
+_ASYNCPG_ARGS = {
+    "timeout": float,
+    "command_timeout": float,
+    "statement_cache_size": int,
+    "prepared_statement_cache_size": int,
+    "max_cached_statement_lifetime": float,
+    "max_cacheable_statement_size": int,
+    "target_session_attrs": str,
+}
+
+
+def _ssl_context(sslmode: Optional[str], files: Dict[str, str]) -> ssl.SSLContext:
+    """Build the SSLContext libpq would use for sslmode plus sslrootcert/sslcert/sslkey."""
+    rootcert = files.get("sslrootcert")
+    context = ssl.create_default_context(cafile=rootcert)
+    # As in libpq, sslmode=require with a root certificate verifies the CA
+    verify = sslmode in ("verify-ca", "verify-full") or (sslmode == "require" and rootcert)
+    context.check_hostname = sslmode == "verify-full"
+    if not verify:
+        context.verify_mode = ssl.CERT_NONE
+    if "sslcert" in files:
+        context.load_cert_chain(files["sslcert"], files.get("sslkey"))
+    return context
+
+
+def _server_settings(options: str) -> Dict[str, str]:
+    """Parse libpq's options parameter ("-c name=value --name=value") into server settings."""
+    settings = {}
+    tokens = shlex.split(options)
+    while tokens:
+        token = tokens.pop(0)
+        if token == "-c" and tokens:
+            token = tokens.pop(0)
+        elif token.startswith("-c"):
+            token = token[2:]
+        elif token.startswith("--"):
+            token = token[2:]
+        else:
+            raise ValueError(f"Unsupported option in DATABASE_URL options: {token}")
+        name, sep, value = token.partition("=")
+        if not sep:
+            raise ValueError(f"Unsupported option in DATABASE_URL options: {token}")
+        settings[name.replace("-", "_")] = value
+    return settings
+
+
+def _async_database_url(url: str) -> Tuple[URL, Dict[str, Any]]:
+    """
+    Point DATABASE_URL at the asyncpg driver.
+    
+    DATABASE_URL is written for libpq (psycopg2), and asyncpg rejects or
+    misreads most libpq query parameters, so each one is translated into
+    an asyncpg connect argument or explicitly dropped.
+    
+    Returns:
+        The query-less asyncpg URL and the engine's connect_args
+    
+    Raises:
+        ValueError: For a query parameter with no asyncpg translation
+    """
+    sync_url = make_url(url)
+    query = {
+        name: value if isinstance(value, str) else value[-1]
+        for name, value in sync_url.query.items()
+    }
+    connect_args: Dict[str, Any] = {}
+    server_settings: Dict[str, str] = {}
+    ssl_files: Dict[str, str] = {}
+    ssl_alias = query.pop("ssl", None)
+    sslmode = query.pop("sslmode", None) or ssl_alias
+    
+    for name, value in query.items():
+        if name in _LIBPQ_IGNORED:
+            continue
+        if name in _LIBPQ_SSL_FILES:
+            ssl_files[name] = value
+        elif name == "connect_timeout":
+            connect_args["timeout"] = float(value)
+        elif name == "application_name":
+            server_settings["application_name"] = value
+        elif name == "options":
+            server_settings.update(_server_settings(value))
+        elif name in _ASYNCPG_ARGS:
+            connect_args[name] = _ASYNCPG_ARGS[name](value)
+        else:
+            raise ValueError(f"DATABASE_URL parameter {name!r} is not supported by the async engine")
+    
+    if ssl_files:
+        connect_args["ssl"] = _ssl_context(sslmode, ssl_files)
+    elif sslmode:
+        # asyncpg spells libpq's sslmode as ssl
+        connect_args["ssl"] = sslmode
+    if server_settings:
+        connect_args["server_settings"] = server_settings
+    
+    async_url = sync_url.set(drivername="postgresql+asyncpg", query={})
+    return async_url, connect_args
+
+
+# Async engine for the voice call path, so DB round-trips don't block the
+# event loop that is also streaming audio for every other active call
+_async_url, _async_connect_args = _async_database_url(DATABASE_URL)
+async_engine = create_async_engine(
+    _async_url,
+    connect_args=_async_connect_args,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=300,
+)
+
+# Async session factory; objects stay readable after the session closes
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 # Base class for all models
 Base = declarative_base()
 
@@ -58,3 +195,50 @@ def init_db():
     from botelier.models import knowledge_entry  # noqa: F401
     
     Base.metadata.create_all(bind=engine)
+    _migrate_tool_columns()
+    _create_missing_indexes()
+
+
+# tools columns that used to be strings: column -> (type, USING expression)
+_TOOL_COLUMN_MIGRATIONS = {
+    "id": ("uuid", "id::uuid"),
+    "assistant_id": ("uuid", "assistant_id::uuid"),
+    "is_active": ("boolean", "is_active = 'true'"),
+}
+
+
+def _migrate_tool_columns():
+    """
+    Convert a pre-existing tools table to native uuid/boolean columns.
+    
+    create_all() leaves existing tables alone, so databases created before
+    Tool switched from String columns still have varchar ones. Columns that
+    already have the new type are skipped, making this a no-op after the
+    first run.
+    """
+    with engine.begin() as conn:
+        column_types = dict(conn.execute(text(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = 'tools'"
+        )).all())
+        for column, (new_type, using) in _TOOL_COLUMN_MIGRATIONS.items():
+            if column_types.get(column) not in ("character varying", "text"):
+                continue
+            # The old string default can't be cast along with the column
+            conn.execute(text(f"ALTER TABLE tools ALTER COLUMN {column} DROP DEFAULT"))
+            conn.execute(text(
+                f"ALTER TABLE tools ALTER COLUMN {column} TYPE {new_type} USING {using}"
+            ))
+
+
+def _create_missing_indexes():
+    """
+    Create any declared index an existing table doesn't have yet.
+    
+    create_all() only builds indexes along with a new table, so indexes
+    added to a model later never reach a database created before them.
+    Each index is checked first, so existing ones are left alone.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -6,11 +6,65 @@ hiding implementation details from the rest of the application.
 """
 
 import os
-from typing import Optional, List, Dict, Any
+import time
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Tuple
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from twilio.rest import Client as TwilioClient
+from twilio.http.http_client import TwilioHttpClient
 from twilio.base.exceptions import TwilioRestException
 
 
+# How long a credential check result is reused before hitting Twilio again
+CONNECTION_CHECK_TTL_SECONDS = 60
+
+# (account_sid, auth_token) -> (checked_at, is_valid)
+_connection_checks: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+
+
+def to_utc_iso(value: Optional[datetime]) -> Optional[str]:
+    """
+    Format a Twilio timestamp as a UTC ISO-8601 string, or None.
+    
+    The SDK parses dates into aware datetimes; normalizing here means each
+    value is converted once, when a response is formatted.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()
+
+
+def _build_http_client() -> TwilioHttpClient:
+    """
+    Create a Twilio HTTP client backed by a pooled keep-alive session.
+    
+    Connections are reused across calls made through the same client, and
+    idempotent requests are retried on transient 5xx errors. Once retries
+    run out the last response is returned, so the SDK still raises a
+    TwilioRestException. 429s are left to the rate_limited backoff, which
+    would otherwise retry on top of these retries.
+    """
+    http_client = TwilioHttpClient(pool_connections=True)
+    http_client.session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return http_client
+
+
 class BotelierTwilioClient:
     """
     Wrapper around Twilio REST API client.
@@ -30,6 +84,8 @@ class BotelierTwilioClient:
         numbers = sub_client.search_available_numbers(area_code="415")
     """
     
+    __slots__ = ("account_sid", "auth_token", "client")
+    
     def __init__(
         self,
         account_sid: Optional[str] = None,
@@ -51,17 +107,54 @@ class BotelierTwilioClient:
                 "TWILIO_AUTH_TOKEN environment variables or pass them explicitly."
             )
         
-        self.client = TwilioClient(self.account_sid, self.auth_token)
+        self.client = TwilioClient(
+            self.account_sid,
+            self.auth_token,
+            http_client=_build_http_client(),
+        )
     
     def test_connection(self) -> bool:
         """
         Test if Twilio credentials are valid.
         
+        Results are cached per credential pair for CONNECTION_CHECK_TTL_SECONDS
+        so repeated health checks don't refetch the full account resource.
+        
         Returns:
             True if credentials work, False otherwise
         """
+        key = (self.account_sid, self.auth_token)
+        now = time.monotonic()
+        cached = _connection_checks.get(key)
+        if cached and now - cached[0] < CONNECTION_CHECK_TTL_SECONDS:
+            return cached[1]
+        
         try:
             self.client.api.accounts(self.account_sid).fetch()
+            is_valid = True
+        except TwilioRestException:
+            logger.warning("Twilio credential check failed for {}", self.account_sid)
+            is_valid = False
+        
+        _connection_checks[key] = (now, is_valid)
+        return is_valid
+    
+    def end_call(self, call_sid: str) -> bool:
+        """
+        Complete an in-progress call via the REST API.
+        
+        Works from any worker: Twilio closes the call's media stream, which
+        ends the pipeline on whichever worker is serving it.
+        
+        Args:
+            call_sid: Twilio Call SID
+            
+        Returns:
+            True if Twilio accepted the update
+        """
+        try:
+            self.client.calls(call_sid).update(status="completed")
             return True
         except TwilioRestException:
+            logger.exception("Failed to end call {}", call_sid)
             return False
@@ -5,8 +5,19 @@ Handles searching, purchasing, and managing phone numbers for hotel sub-accounts
 """
 
 from typing import List, Dict, Any, Optional
+from loguru import logger
 from twilio.base.exceptions import TwilioRestException
-from .client import BotelierTwilioClient
+from .client import BotelierTwilioClient, to_utc_iso
+
+
+def _format_capabilities(capabilities: Dict[str, bool]) -> Dict[str, bool]:
+    """Normalize Twilio's capabilities map to voice/sms/mms flags."""
+    get = capabilities.get
+    return {
+        "voice": get("voice", False),
+        "sms": get("sms", False),
+        "mms": get("mms", False),
+    }
 
 
 class PhoneNumberManager:
@@ -29,6 +40,8 @@ class PhoneNumberManager:
         number = manager.purchase_number("+14155551234")
     """
     
+    __slots__ = ("client",)
+    
     def __init__(self, sub_account_sid: str, sub_auth_token: str):
         """
         Initialize manager for a specific hotel's sub-account.
@@ -90,26 +103,21 @@ class PhoneNumberManager:
                 .local.list(**search_params)
             
             # Format results
-            results = []
-            for number in available_numbers:
-                results.append({
+            return [
+                {
                     "phone_number": number.phone_number,
                     "friendly_name": number.friendly_name,
-                    "capabilities": {
-                        "voice": number.capabilities.get("voice", False),
-                        "sms": number.capabilities.get("sms", False),
-                        "mms": number.capabilities.get("mms", False),
-                    },
+                    "capabilities": _format_capabilities(number.capabilities),
                     "locality": number.locality,
                     "region": number.region,
                     "iso_country": number.iso_country,
                     "postal_code": number.postal_code,
-                })
-            
-            return results
+                }
+                for number in available_numbers
+            ]
             
-        except TwilioRestException as e:
-            print(f"Failed to search numbers: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to search numbers")
             raise
     
     def purchase_number(
@@ -163,16 +171,12 @@ class PhoneNumberManager:
                 "sid": purchased.sid,
                 "phone_number": purchased.phone_number,
                 "friendly_name": purchased.friendly_name,
-                "capabilities": {
-                    "voice": purchased.capabilities.get("voice", False),
-                    "sms": purchased.capabilities.get("sms", False),
-                    "mms": purchased.capabilities.get("mms", False),
-                },
-                "date_created": purchased.date_created.isoformat() if purchased.date_created else None,
+                "capabilities": _format_capabilities(purchased.capabilities),
+                "date_created": to_utc_iso(purchased.date_created),
             }
             
-        except TwilioRestException as e:
-            print(f"Failed to purchase number {phone_number}: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to purchase number {}", phone_number)
             raise
     
     def update_number_config(
@@ -215,8 +219,8 @@ class PhoneNumberManager:
                 "voice_url": updated.voice_url,
             }
             
-        except TwilioRestException as e:
-            print(f"Failed to update number {phone_number_sid}: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to update number {}", phone_number_sid)
             raise
     
     def release_number(self, phone_number_sid: str) -> bool:
@@ -233,8 +237,8 @@ class PhoneNumberManager:
             self.client.client.incoming_phone_numbers(phone_number_sid).delete()
             return True
             
-        except TwilioRestException as e:
-            print(f"Failed to release number {phone_number_sid}: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to release number {}", phone_number_sid)
             return False
     
     def list_numbers(self) -> List[Dict[str, Any]]:
@@ -247,23 +251,18 @@ class PhoneNumberManager:
         try:
             numbers = self.client.client.incoming_phone_numbers.list()
             
-            results = []
-            for number in numbers:
-                results.append({
+            return [
+                {
                     "sid": number.sid,
                     "phone_number": number.phone_number,
                     "friendly_name": number.friendly_name,
-                    "capabilities": {
-                        "voice": number.capabilities.get("voice", False),
-                        "sms": number.capabilities.get("sms", False),
-                        "mms": number.capabilities.get("mms", False),
-                    },
+                    "capabilities": _format_capabilities(number.capabilities),
                     "voice_url": number.voice_url,
-                    "date_created": number.date_created.isoformat() if number.date_created else None,
-                })
-            
-            return results
+                    "date_created": to_utc_iso(number.date_created),
+                }
+                for number in numbers
+            ]
             
-        except TwilioRestException as e:
-            print(f"Failed to list numbers: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to list numbers")
             raise
@@ -0,0 +1,160 @@
+"""
+Client-side rate limiting for Twilio API calls.
+
+Twilio enforces per-account request caps, and throttled (429) requests still
+count against the budget. Pacing calls locally keeps bursts under the cap
+instead of discovering it through 429 storms.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+from loguru import logger
+from twilio.base.exceptions import TwilioRestException
+
+
+# How many times a throttled (429) call is retried before giving up
+MAX_THROTTLE_RETRIES = 3
+
+# Initial backoff after a 429, doubled on each retry
+THROTTLE_BACKOFF_SECONDS = 1.0
+
+
+class ThrottledTwilioRestException(TwilioRestException):
+    """
+    TwilioRestException raised from a raw REST response, carrying the
+    response's Retry-After delay (seconds, or None if absent).
+
+    The SDK's own exceptions don't expose response headers; raw calls
+    raise this so rate_limited can wait as long as Twilio asked.
+    """
+
+    def __init__(self, *args, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _throttle_delay(error: TwilioRestException, backoff: float) -> float:
+    """Backoff before retrying a 429, stretched to the server's Retry-After."""
+    if isinstance(error, ThrottledTwilioRestException) and error.retry_after:
+        return max(backoff, error.retry_after)
+    return backoff
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Callers reserve a token up front and then wait until it is due, so
+    concurrent callers are queued in order rather than racing.
+
+    Usage:
+        bucket = TokenBucket(rate=1.0, capacity=5)
+        bucket.acquire()              # blocking
+        await bucket.acquire_async()  # from a coroutine
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long to wait before it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def rate_limited(bucket: TokenBucket) -> Callable:
+    """
+    Decorate a Twilio-calling function or coroutine with `bucket` pacing.
+
+    Each attempt takes a token first. Calls rejected with HTTP 429 are
+    retried with exponential backoff up to MAX_THROTTLE_RETRIES times,
+    waiting at least the response's Retry-After when the error has it.
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                backoff = THROTTLE_BACKOFF_SECONDS
+                for attempt in range(MAX_THROTTLE_RETRIES + 1):
+                    await bucket.acquire_async()
+                    try:
+                        return await func(*args, **kwargs)
+                    except TwilioRestException as e:
+                        if e.status != 429 or attempt == MAX_THROTTLE_RETRIES:
+                            raise
+                        delay = _throttle_delay(e, backoff)
+                        logger.warning("Twilio throttled {}, retrying in {}s", func.__name__, delay)
+                        await asyncio.sleep(delay)
+                        backoff *= 2
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            backoff = THROTTLE_BACKOFF_SECONDS
+            for attempt in range(MAX_THROTTLE_RETRIES + 1):
+                bucket.acquire()
+                try:
+                    return func(*args, **kwargs)
+                except TwilioRestException as e:
+                    if e.status != 429 or attempt == MAX_THROTTLE_RETRIES:
+                        raise
+                    delay = _throttle_delay(e, backoff)
+                    logger.warning("Twilio throttled {}, retrying in {}s", func.__name__, delay)
+                    time.sleep(delay)
+                    backoff *= 2
+
+        return wrapper
+
+    return decorator
@@ -5,9 +5,151 @@ Handles creation and management of Twilio sub-accounts for hotels.
 Each hotel gets its own isolated sub-account for billing and phone numbers.
 """
 
-from typing import Dict, Any
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Union
+import httpx
+from loguru import logger
+from twilio.rest import Client as TwilioClient
+from twilio.http.async_http_client import AsyncTwilioHttpClient
 from twilio.base.exceptions import TwilioRestException
-from .client import BotelierTwilioClient
+from .client import BotelierTwilioClient, to_utc_iso
+from .rate_limit import ThrottledTwilioRestException, TokenBucket, parse_retry_after, rate_limited
+
+
+class SubAccountInfo(NamedTuple):
+    """Sub-account details returned by SubAccountManager."""
+    sid: str
+    friendly_name: str
+    status: str
+    date_created: Optional[str]
+    auth_token: Optional[str] = None  # Only returned when the account is created
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses (auth_token only when known)."""
+        data = self._asdict()
+        if self.auth_token is None:
+            del data["auth_token"]
+        return data
+    
+    @classmethod
+    def from_account(cls, account, include_auth_token: bool = False) -> "SubAccountInfo":
+        """Build from a Twilio AccountInstance."""
+        return cls(
+            sid=account.sid,
+            friendly_name=account.friendly_name,
+            status=account.status,
+            date_created=to_utc_iso(account.date_created),
+            auth_token=account.auth_token if include_auth_token else None,
+        )
+
+
+# Main-account client shared by all managers so its connection pool stays warm
+_shared_client: Optional[BotelierTwilioClient] = None
+_shared_client_lock = threading.Lock()
+
+# Paces main-account API calls under Twilio's default ~1 request/second cap,
+# allowing short bursts
+_BUCKET = TokenBucket(rate=1.0, capacity=5)
+
+# Accounts resource base for raw REST calls that bypass the SDK
+_ACCOUNTS_BASE = "https://api.twilio.com/2010-04-01/Accounts/"
+
+# Single-connection HTTP/2 client for bulk status updates; requests are
+# multiplexed as streams over one TLS connection (created on first use)
+_http2_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http2_client() -> httpx.AsyncClient:
+    """Return the shared HTTP/2 client used for bulk account updates."""
+    global _http2_client
+    if _http2_client is None or _http2_client.is_closed:
+        _http2_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+        )
+    return _http2_client
+
+
+async def close_http2_client() -> None:
+    """Close the bulk-update HTTP/2 connection (application shutdown)."""
+    global _http2_client
+    if _http2_client is not None:
+        await _http2_client.aclose()
+        _http2_client = None
+
+
+def _raise_for_twilio_error(response, uri: str, method: str = "POST") -> None:
+    """
+    Raise TwilioRestException for an error response from a raw REST call.
+    
+    The exception carries the response's Retry-After, which rate_limited
+    honours when backing off a 429.
+    """
+    if response.status_code < 400:
+        return
+    try:
+        error = response.json()
+    except ValueError:
+        error = {}
+    raise ThrottledTwilioRestException(
+        response.status_code,
+        uri,
+        msg=error.get("message", response.text),
+        code=error.get("code"),
+        method=method,
+        retry_after=parse_retry_after(response.headers.get("Retry-After")),
+    )
+
+
+# Sub-account metadata changes rarely, so get_sub_account() results are
+# cached in-process (LRU with TTL) and dropped when the status changes here
+SUB_ACCOUNT_CACHE_TTL_SECONDS = 300
+SUB_ACCOUNT_CACHE_MAX_SIZE = 1024
+
+# sub_account_sid -> (cached_at, details)
+_sub_account_cache: "OrderedDict[str, Tuple[float, SubAccountInfo]]" = OrderedDict()
+_sub_account_cache_lock = threading.RLock()
+
+
+def _get_cached_sub_account(sub_account_sid: str) -> Optional[SubAccountInfo]:
+    """Return cached sub-account details if still fresh."""
+    with _sub_account_cache_lock:
+        cached = _sub_account_cache.get(sub_account_sid)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= SUB_ACCOUNT_CACHE_TTL_SECONDS:
+            del _sub_account_cache[sub_account_sid]
+            return None
+        _sub_account_cache.move_to_end(sub_account_sid)
+        return cached[1]
+
+
+def _cache_sub_account(sub_account_sid: str, details: SubAccountInfo) -> None:
+    """Store sub-account details, evicting the least recently used entry if full."""
+    with _sub_account_cache_lock:
+        _sub_account_cache[sub_account_sid] = (time.monotonic(), details)
+        _sub_account_cache.move_to_end(sub_account_sid)
+        if len(_sub_account_cache) > SUB_ACCOUNT_CACHE_MAX_SIZE:
+            _sub_account_cache.popitem(last=False)
+
+
+def _invalidate_sub_account(sub_account_sid: str) -> None:
+    """Drop cached details for a sub-account."""
+    with _sub_account_cache_lock:
+        _sub_account_cache.pop(sub_account_sid, None)
+
+
+def _get_client() -> BotelierTwilioClient:
+    """Return the process-wide main-account client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = BotelierTwilioClient()
+    return _shared_client
 
 
 class SubAccountManager:
@@ -17,14 +159,15 @@ class SubAccountManager:
     Usage:
         manager = SubAccountManager()
         sub_account = manager.create_sub_account("Grand Hotel")
-        # Returns: {"sid": "AC...", "auth_token": "...", "friendly_name": "..."}
+        # Returns: SubAccountInfo(sid="AC...", auth_token="...", friendly_name="...", ...)
     """
     
     def __init__(self):
         """Initialize with main Botelier account credentials."""
-        self.client = BotelierTwilioClient()
+        self.client = _get_client()
+        self._auth = (self.client.account_sid, self.client.auth_token)
     
-    def create_sub_account(self, hotel_name: str) -> Dict[str, Any]:
+    def create_sub_account(self, hotel_name: str) -> SubAccountInfo:
         """
         Create a new Twilio sub-account for a hotel.
         
@@ -32,13 +175,14 @@ class SubAccountManager:
             hotel_name: Name of the hotel (used as friendly name)
             
         Returns:
-            Dictionary with sub-account details:
-            {
-                "sid": "AC...",
-                "auth_token": "...",
-                "friendly_name": "Botelier - Hotel Name",
-                "status": "active"
-            }
+            SubAccountInfo with sub-account details, including auth_token:
+            SubAccountInfo(
+                sid="AC...",
+                friendly_name="Botelier - Hotel Name",
+                status="active",
+                date_created="...",
+                auth_token="...",
+            )
             
         Raises:
             TwilioRestException: If sub-account creation fails
@@ -47,44 +191,112 @@ class SubAccountManager:
             # Create sub-account with Botelier prefix
             friendly_name = f"Botelier - {hotel_name}"
             
-            sub_account = self.client.client.api.accounts.create(
-                friendly_name=friendly_name
+            sub_account = self._create_account(friendly_name)
+            
+            return SubAccountInfo.from_account(sub_account, include_auth_token=True)
+            
+        except TwilioRestException:
+            logger.exception("Failed to create sub-account for {}", hotel_name)
+            raise
+    
+    async def create_sub_account_async(
+        self,
+        hotel_name: str,
+        async_client: Optional[TwilioClient] = None
+    ) -> SubAccountInfo:
+        """
+        Create a new Twilio sub-account for a hotel without blocking the event loop.
+        
+        Args:
+            hotel_name: Name of the hotel (used as friendly name)
+            async_client: Twilio client backed by an AsyncTwilioHttpClient
+                (a short-lived one is created if not provided)
+            
+        Returns:
+            Same SubAccountInfo as create_sub_account()
+            
+        Raises:
+            TwilioRestException: If sub-account creation fails
+        """
+        if async_client is None:
+            async with AsyncTwilioHttpClient() as http_client:
+                return await self.create_sub_account_async(
+                    hotel_name,
+                    async_client=self._create_async_client(http_client),
+                )
+        
+        try:
+            sub_account = await self._create_account_async(
+                async_client,
+                f"Botelier - {hotel_name}",
             )
             
-            return {
-                "sid": sub_account.sid,
-                "auth_token": sub_account.auth_token,
-                "friendly_name": sub_account.friendly_name,
-                "status": sub_account.status,
-                "date_created": sub_account.date_created.isoformat() if sub_account.date_created else None,
-            }
+            return SubAccountInfo.from_account(sub_account, include_auth_token=True)
             
-        except TwilioRestException as e:
-            print(f"Failed to create sub-account for {hotel_name}: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to create sub-account for {}", hotel_name)
             raise
     
-    def get_sub_account(self, sub_account_sid: str) -> Dict[str, Any]:
+    async def create_many(
+        self,
+        hotel_names: List[str]
+    ) -> List[Union[SubAccountInfo, BaseException]]:
+        """
+        Create sub-accounts for several hotels concurrently.
+        
+        All creations share one async HTTP session, so total wall time is
+        roughly a single round-trip rather than one per hotel.
+        
+        Args:
+            hotel_names: Names of the hotels to provision
+            
+        Returns:
+            One entry per hotel, in order: the SubAccountInfo on success,
+            or the raised exception on failure
+        """
+        async with AsyncTwilioHttpClient() as http_client:
+            async_client = self._create_async_client(http_client)
+            return await asyncio.gather(
+                *(
+                    self.create_sub_account_async(name, async_client=async_client)
+                    for name in hotel_names
+                ),
+                return_exceptions=True,
+            )
+    
+    def _create_async_client(self, http_client: AsyncTwilioHttpClient) -> TwilioClient:
+        """Build a main-account Twilio client that uses the given async HTTP client."""
+        return TwilioClient(
+            self.client.account_sid,
+            self.client.auth_token,
+            http_client=http_client,
+        )
+    
+    def get_sub_account(self, sub_account_sid: str) -> SubAccountInfo:
         """
         Get sub-account details.
         
+        Results are cached for SUB_ACCOUNT_CACHE_TTL_SECONDS.
+        
         Args:
             sub_account_sid: Sub-account SID
             
         Returns:
-            Dictionary with sub-account details
+            SubAccountInfo with sub-account details (auth_token is None)
         """
+        cached = _get_cached_sub_account(sub_account_sid)
+        if cached is not None:
+            return cached
+        
         try:
-            sub_account = self.client.client.api.accounts(sub_account_sid).fetch()
+            sub_account = self._fetch_account(sub_account_sid)
             
-            return {
-                "sid": sub_account.sid,
-                "friendly_name": sub_account.friendly_name,
-                "status": sub_account.status,
-                "date_created": sub_account.date_created.isoformat() if sub_account.date_created else None,
-            }
+            details = SubAccountInfo.from_account(sub_account)
+            _cache_sub_account(sub_account_sid, details)
+            return details
             
-        except TwilioRestException as e:
-            print(f"Failed to fetch sub-account {sub_account_sid}: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to fetch sub-account {}", sub_account_sid)
             raise
     
     def suspend_sub_account(self, sub_account_sid: str) -> bool:
@@ -98,13 +310,12 @@ class SubAccountManager:
             True if successful
         """
         try:
-            self.client.client.api.accounts(sub_account_sid).update(
-                status="suspended"
-            )
+            self._update_account_status(sub_account_sid, "suspended")
+            _invalidate_sub_account(sub_account_sid)
             return True
             
-        except TwilioRestException as e:
-            print(f"Failed to suspend sub-account {sub_account_sid}: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to suspend sub-account {}", sub_account_sid)
             return False
     
     def close_sub_account(self, sub_account_sid: str) -> bool:
@@ -118,11 +329,80 @@ class SubAccountManager:
             True if successful
         """
         try:
-            self.client.client.api.accounts(sub_account_sid).update(
-                status="closed"
-            )
+            self._update_account_status(sub_account_sid, "closed")
+            _invalidate_sub_account(sub_account_sid)
             return True
             
-        except TwilioRestException as e:
-            print(f"Failed to close sub-account {sub_account_sid}: {e}")
+        except TwilioRestException:
+            logger.exception("Failed to close sub-account {}", sub_account_sid)
             return False
+    
+    async def bulk_update_status(
+        self,
+        sub_account_sids: List[str],
+        status: str
+    ) -> Dict[str, bool]:
+        """
+        Suspend, close, or reactivate many sub-accounts at once.
+        
+        Updates are pipelined as concurrent streams over one HTTP/2
+        connection and still paced by the shared rate limiter, with the
+        same 429 backoff as the other account calls.
+        
+        Args:
+            sub_account_sids: Sub-account SIDs to update
+            status: New status ("suspended", "closed", or "active")
+            
+        Returns:
+            Mapping of sub-account SID to whether its update succeeded
+        """
+        client = _get_http2_client()
+        
+        async def update(sub_account_sid: str) -> bool:
+            try:
+                await self._update_account_status_async(client, sub_account_sid, status)
+            except (TwilioRestException, httpx.HTTPError):
+                logger.exception("Failed to set sub-account {} to {}", sub_account_sid, status)
+                return False
+            _invalidate_sub_account(sub_account_sid)
+            return True
+        
+        results = await asyncio.gather(*(update(sid) for sid in sub_account_sids))
+        return dict(zip(sub_account_sids, results))
+    
+    # Raw Twilio calls, paced by the shared token bucket
+    
+    @rate_limited(_BUCKET)
+    def _create_account(self, friendly_name: str):
+        return self.client.client.api.accounts.create(friendly_name=friendly_name)
+    
+    @rate_limited(_BUCKET)
+    async def _create_account_async(self, async_client: TwilioClient, friendly_name: str):
+        return await async_client.api.accounts.create_async(friendly_name=friendly_name)
+    
+    @rate_limited(_BUCKET)
+    def _fetch_account(self, sub_account_sid: str):
+        return self.client.client.api.accounts(sub_account_sid).fetch()
+    
+    @rate_limited(_BUCKET)
+    def _update_account_status(self, sub_account_sid: str, status: str) -> None:
+        # Plain form POST on the pooled session - skips building the SDK's
+        # AccountContext/AccountInstance graph for a one-field update
+        uri = _ACCOUNTS_BASE + sub_account_sid + ".json"
+        response = self.client.client.http_client.session.post(
+            uri,
+            data={"Status": status},
+            auth=self._auth,
+        )
+        _raise_for_twilio_error(response, uri)
+    
+    @rate_limited(_BUCKET)
+    async def _update_account_status_async(
+        self,
+        client: httpx.AsyncClient,
+        sub_account_sid: str,
+        status: str,
+    ) -> None:
+        uri = _ACCOUNTS_BASE + sub_account_sid + ".json"
+        response = await client.post(uri, data={"Status": status}, auth=self._auth)
+        _raise_for_twilio_error(response, uri)
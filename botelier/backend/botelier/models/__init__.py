@@ -1,19 +1,28 @@
 """
 Database models for Botelier platform.
 
-All SQLAlchemy models should be imported here for database initialization.
+All SQLAlchemy models should be listed here for database initialization.
+Models are imported lazily on first attribute access (PEP 562), so importing
+the package doesn't pay for every model module up front.
 """
 
-from botelier.models.hotel import Hotel
-from botelier.models.phone_number import PhoneNumber
-from botelier.models.tool import Tool
-from botelier.models.assistant import Assistant
-from botelier.models.knowledge_entry import KnowledgeEntry
+import importlib
 
-__all__ = [
-    "Hotel",
-    "PhoneNumber",
-    "Tool",
-    "Assistant",
-    "KnowledgeEntry",
-]
+_LAZY = {
+    "Hotel": "botelier.models.hotel",
+    "PhoneNumber": "botelier.models.phone_number",
+    "Tool": "botelier.models.tool",
+    "Assistant": "botelier.models.assistant",
+    "KnowledgeEntry": "botelier.models.knowledge_entry",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
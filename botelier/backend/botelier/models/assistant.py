@@ -10,9 +10,14 @@ Each assistant has:
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Float, Integer
+from typing import Any, Dict, List
+from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Float, Integer, Index
+from sqlalchemy import cast, func, literal, select
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.ext.hybrid import hybrid_method
+from sqlalchemy.orm import relationship
 from botelier.database import Base
+from botelier.models.serialization import dict_from_spec, dict_or_empty
 
 
 class Assistant(Base):
@@ -26,6 +31,9 @@ class Assistant(Base):
     - Has tools/functions for actions
     """
     __tablename__ = "assistants"
+    __table_args__ = (
+        Index("ix_assistants_hotel_active", "hotel_id", "is_active"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -69,32 +77,83 @@ class Assistant(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=True, onupdate=datetime.utcnow)
     
+    # Enabled tools (read-only; tools.assistant_id has no FK constraint)
+    active_tools = relationship(
+        "Tool",
+        primaryjoin="and_(foreign(Tool.assistant_id) == Assistant.id, Tool.is_active.is_(True))",
+        viewonly=True,
+    )
+    
     def __repr__(self):
         return f"<Assistant {self.name}>"
     
+    @hybrid_method
+    def config_value(self, config_name: str, key: str):
+        """
+        Read a single provider setting, e.g. config_value("llm_config", "top_p").
+        
+        On instances this reads the already-loaded JSONB dict. In queries it
+        compiles to `llm_config ->> 'top_p'`, so callers that need one setting
+        can select or filter on it without loading the whole blob.
+        """
+        return (getattr(self, config_name) or {}).get(key)
+    
+    @config_value.expression
+    def config_value(cls, config_name: str, key: str):
+        return getattr(cls, config_name)[key].astext
+    
+    # Field layout for to_dict(): (response key, attribute, coercer)
+    _DICT_SPEC = (
+        ("id", "id", None),
+        ("hotel_id", "hotel_id", None),
+        ("name", "name", None),
+        ("description", "description", None),
+        ("stt_provider", "stt_provider", None),
+        ("llm_provider", "llm_provider", None),
+        ("tts_provider", "tts_provider", None),
+        ("stt_model", "stt_model", None),
+        ("llm_model", "llm_model", None),
+        ("tts_model", "tts_model", None),
+        ("tts_voice", "tts_voice", None),
+        ("system_prompt", "system_prompt", None),
+        ("first_message", "first_message", None),
+        ("language", "language", None),
+        ("temperature", "temperature", None),
+        ("max_tokens", "max_tokens", None),
+        ("stt_config", "stt_config", dict_or_empty),
+        ("llm_config", "llm_config", dict_or_empty),
+        ("tts_config", "tts_config", dict_or_empty),
+        ("is_active", "is_active", None),
+        ("created_at", "created_at", None),
+        ("updated_at", "updated_at", None),
+    )
+    
     def to_dict(self):
         """Convert to dictionary for API responses."""
-        return {
-            "id": str(self.id),
-            "hotel_id": str(self.hotel_id),
-            "name": self.name,
-            "description": self.description,
-            "stt_provider": self.stt_provider,
-            "llm_provider": self.llm_provider,
-            "tts_provider": self.tts_provider,
-            "stt_model": self.stt_model,
-            "llm_model": self.llm_model,
-            "tts_model": self.tts_model,
-            "tts_voice": self.tts_voice,
-            "system_prompt": self.system_prompt,
-            "first_message": self.first_message,
-            "language": self.language,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "stt_config": self.stt_config or {},
-            "llm_config": self.llm_config or {},
-            "tts_config": self.tts_config or {},
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() + "Z" if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() + "Z" if self.updated_at else None,
-        }
+        return dict_from_spec(self, self._DICT_SPEC)
+    
+    @classmethod
+    def select_dicts(cls, session, *criteria) -> List[Dict[str, Any]]:
+        """
+        Fetch assistants as plain row dicts, newest first, without loading ORM objects.
+        
+        Rows have the same keys and native values as to_dict(), ready for
+        serialization.dumps() to encode.
+        
+        Args:
+            session: SQLAlchemy session
+            *criteria: Optional WHERE clauses (e.g. Assistant.hotel_id == ...)
+        """
+        columns = [
+            func.coalesce(getattr(cls, attr), cast(literal("{}"), JSONB)).label(key)
+            if coerce is dict_or_empty
+            else getattr(cls, attr).label(key)
+            for key, attr, coerce in cls._DICT_SPEC
+        ]
+        stmt = (
+            select(*columns)
+            .where(*criteria)
+            .order_by(cls.created_at.desc())
+            .execution_options(yield_per=500)
+        )
+        return [dict(row._mapping) for row in session.execute(stmt)]
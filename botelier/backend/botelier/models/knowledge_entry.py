@@ -10,9 +10,16 @@ Each entry:
 
 import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, String, Text, DateTime, Date, ForeignKey
+from typing import Any, Dict, List
+from sqlalchemy import Column, String, Text, DateTime, Date, ForeignKey, Index, and_, func, insert
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from botelier.database import Base
+from botelier.models.serialization import dict_from_spec
+
+
+# Rows folded into each multi-row INSERT ... RETURNING statement
+BULK_INSERT_PAGE_SIZE = 1000
 
 
 class KnowledgeEntry(Base):
@@ -26,6 +33,10 @@ class KnowledgeEntry(Base):
     - Optionally expires for time-sensitive information
     """
     __tablename__ = "knowledge_entries"
+    __table_args__ = (
+        Index("ix_knowledge_entries_hotel_expiry", "hotel_id", "expiration_date"),
+        Index("ix_knowledge_entries_hotel_category", "hotel_id", "category"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -49,23 +60,60 @@ class KnowledgeEntry(Base):
     def __repr__(self):
         return f"<KnowledgeEntry {self.question[:50]}...>"
     
-    @property
+    @hybrid_property
     def is_expired(self):
         """Check if entry is expired."""
         if not self.expiration_date:
             return False
         return date.today() > self.expiration_date
     
+    @is_expired.expression
+    def is_expired(cls):
+        """SQL form of is_expired, so queries can filter with ~KnowledgeEntry.is_expired."""
+        return and_(
+            cls.expiration_date.isnot(None),
+            cls.expiration_date < func.current_date(),
+        )
+    
+    # Field layout for to_dict(): (response key, attribute, coercer)
+    _DICT_SPEC = (
+        ("id", "id", None),
+        ("hotel_id", "hotel_id", None),
+        ("question", "question", None),
+        ("answer", "answer", None),
+        ("category", "category", None),
+        ("expiration_date", "expiration_date", None),
+        ("is_expired", "is_expired", None),
+        ("created_at", "created_at", None),
+        ("updated_at", "updated_at", None),
+    )
+    
     def to_dict(self):
         """Convert to dictionary for API responses."""
-        return {
-            "id": str(self.id),
-            "hotel_id": str(self.hotel_id),
-            "question": self.question,
-            "answer": self.answer,
-            "category": self.category,
-            "expiration_date": self.expiration_date.isoformat() if self.expiration_date else None,
-            "is_expired": self.is_expired,
-            "created_at": self.created_at.isoformat() + "Z" if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() + "Z" if self.updated_at else None,
-        }
+        return dict_from_spec(self, self._DICT_SPEC)
+    
+    @classmethod
+    def bulk_create(cls, session, rows: List[Dict[str, Any]]) -> List[uuid.UUID]:
+        """
+        Insert many entries in as few round-trips as possible.
+        
+        Uses SQLAlchemy 2.0's "insertmanyvalues" batching, so N rows become
+        a handful of multi-row INSERT ... RETURNING statements instead of N
+        separate inserts. Column defaults (id, timestamps) are still applied.
+        
+        Args:
+            session: Active SQLAlchemy session (caller commits)
+            rows: Column-name dicts, e.g. {"hotel_id": ..., "question": ..., "answer": ...}
+        
+        Returns:
+            IDs of the created entries, in input order
+        """
+        if not rows:
+            return []
+        
+        stmt = (
+            insert(cls)
+            .returning(cls.id, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=BULK_INSERT_PAGE_SIZE)
+        )
+        return list(session.scalars(stmt, rows))
@@ -9,10 +9,11 @@ Each phone number is:
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from botelier.database import Base
+from botelier.models.serialization import dict_from_spec
 
 
 class PhoneNumber(Base):
@@ -26,6 +27,10 @@ class PhoneNumber(Base):
     4. Incoming calls routed to that assistant
     """
     __tablename__ = "phone_numbers"
+    __table_args__ = (
+        Index("ix_phone_numbers_hotel_active", "hotel_id", "is_active"),
+        Index("ix_phone_numbers_assistant_id", "assistant_id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -43,6 +48,11 @@ class PhoneNumber(Base):
     
     # Assignment to voice assistant
     assistant_id = Column(UUID(as_uuid=True), nullable=True)  # Which assistant handles calls
+    assistant = relationship(
+        "Assistant",
+        primaryjoin="foreign(PhoneNumber.assistant_id) == Assistant.id",
+        viewonly=True,
+    )
     
     # Status
     is_active = Column(Boolean, default=True)
@@ -54,17 +64,20 @@ class PhoneNumber(Base):
     def __repr__(self):
         return f"<PhoneNumber {self.phone_number}>"
     
+    # Field layout for to_dict(): (response key, attribute, coercer)
+    _DICT_SPEC = (
+        ("id", "id", None),
+        ("phone_number", "phone_number", None),
+        ("friendly_name", "friendly_name", None),
+        ("country_code", "country_code", None),
+        ("twilio_sid", "twilio_sid", None),
+        ("hotel_id", "hotel_id", None),
+        ("assistant_id", "assistant_id", None),
+        ("is_active", "is_active", None),
+        ("created_at", "created_at", None),
+        ("updated_at", "updated_at", None),
+    )
+    
     def to_dict(self):
         """Convert to dictionary for API responses."""
-        return {
-            "id": str(self.id),
-            "phone_number": self.phone_number,
-            "friendly_name": self.friendly_name,
-            "country_code": self.country_code,
-            "twilio_sid": self.twilio_sid,
-            "hotel_id": str(self.hotel_id),
-            "assistant_id": str(self.assistant_id) if self.assistant_id else None,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() + "Z" if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() + "Z" if self.updated_at else None,
-        }
+        return dict_from_spec(self, self._DICT_SPEC)
@@ -0,0 +1,42 @@
+"""
+Serialization helpers shared by model to_dict() methods.
+
+Models declare a class-level spec of (key, attribute, coercer) tuples once,
+and to_dict() walks it instead of hand-building a dict literal per call.
+Coercers are None-safe so a spec entry can be applied unconditionally.
+UUIDs, dates and datetimes are left native; dumps() renders them.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+
+
+DictSpec = Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+
+# orjson serializes UUIDs natively; these options render our naive UTC
+# datetimes as ISO-8601 with a "Z" suffix
+JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def str_or_none(value) -> Optional[str]:
+    """String form of a value (e.g. UUID), or None."""
+    return str(value) if value else None
+
+
+def dict_or_empty(value) -> Dict[str, Any]:
+    """The value itself, or an empty dict when unset."""
+    return value or {}
+
+
+def dict_from_spec(obj, spec: DictSpec) -> Dict[str, Any]:
+    """Build an API response dict for `obj` from its precomputed field spec."""
+    return {
+        key: getattr(obj, attr) if coerce is None else coerce(getattr(obj, attr))
+        for key, attr, coerce in spec
+    }
+
+
+def dumps(obj) -> bytes:
+    """Serialize an API payload (rows with UUIDs/datetimes allowed) to JSON bytes."""
+    return orjson.dumps(obj, option=JSON_OPTIONS)
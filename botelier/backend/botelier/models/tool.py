@@ -5,12 +5,15 @@ Tools define what actions the AI can perform during conversations
 (API calls, call transfers, sending messages, etc.)
 """
 
-from sqlalchemy import Column, String, Text, JSON, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, JSON, DateTime, Boolean, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
+import uuid
 
 from botelier.database import Base
+from botelier.models.serialization import dict_from_spec, str_or_none
 
 
 class ToolType(str, enum.Enum):
@@ -23,6 +26,10 @@ class ToolType(str, enum.Enum):
     SEND_EMAIL = "send_email"
 
 
+def _enum_value(value):
+    return value.value
+
+
 class Tool(Base):
     """
     Tool configuration for AI assistant function calling.
@@ -50,9 +57,15 @@ class Tool(Base):
     """
     
     __tablename__ = "tools"
+    __table_args__ = (
+        Index("ix_tools_assistant_type", "assistant_id", "tool_type"),
+        # Call setup loads an assistant's active tools (created on existing
+        # databases by init_db)
+        Index("ix_tools_assistant_active", "assistant_id", "is_active"),
+    )
     
     # Primary key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Tool metadata
     name = Column(String(255), nullable=False, index=True)
@@ -63,28 +76,31 @@ class Tool(Base):
     config = Column(JSON, nullable=False, default={})
     
     # Multi-tenancy (future: associate with specific hotel/assistant)
-    assistant_id = Column(String(36), nullable=True, index=True)
+    assistant_id = Column(UUID(as_uuid=True), nullable=True, index=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Status
-    is_active = Column(String(10), default="true")  # "true" or "false" as string
+    is_active = Column(Boolean, default=True)
     
     def __repr__(self):
         return f"<Tool(id={self.id}, name={self.name}, type={self.tool_type})>"
     
+    # Field layout for to_dict(): (response key, attribute, coercer)
+    _DICT_SPEC = (
+        ("id", "id", str),
+        ("name", "name", None),
+        ("description", "description", None),
+        ("tool_type", "tool_type", _enum_value),
+        ("config", "config", None),
+        ("assistant_id", "assistant_id", str_or_none),
+        ("is_active", "is_active", None),
+        ("created_at", "created_at", None),
+        ("updated_at", "updated_at", None),
+    )
+    
     def to_dict(self):
         """Convert model to dictionary for API responses."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "tool_type": self.tool_type.value,
-            "config": self.config,
-            "assistant_id": self.assistant_id,
-            "is_active": self.is_active == "true",
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return dict_from_spec(self, self._DICT_SPEC)
@@ -4,12 +4,22 @@ Pydantic schemas for Tool API validation.
 These schemas validate request/response data for the Tools API.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, Dict, Any
+from uuid import UUID
 from datetime import datetime
 from enum import Enum
 
 
+# Formatting characters allowed in transfer phone numbers, stripped in one pass
+_PHONE_STRIP_TBL = str.maketrans('', '', '+- ()')
+
+# HTTP methods accepted for API request tools
+_METHOD_ORDER = ("GET", "POST", "PUT", "DELETE", "PATCH")
+_ALLOWED_METHODS = frozenset(_METHOD_ORDER)
+_ALLOWED_METHODS_MSG = f"Method must be one of: {', '.join(_METHOD_ORDER)}"
+
+
 class ToolType(str, Enum):
     """Tool types available for creation."""
     
@@ -31,11 +41,12 @@ class TransferCallConfig(BaseModel):
         description="Message AI says before transferring"
     )
     
-    @validator('phone_number')
+    @field_validator('phone_number')
+    @classmethod
     def validate_phone(cls, v):
         """Basic phone number validation."""
         # Remove common formatting
-        cleaned = v.replace("+", "").replace("-", "").replace(" ", "").replace("(", "").replace(")", "")
+        cleaned = v.translate(_PHONE_STRIP_TBL)
         if not cleaned.isdigit():
             raise ValueError("Phone number must contain only digits and formatting characters")
         return v
@@ -46,17 +57,22 @@ class ApiRequestConfig(BaseModel):
     
     url: str = Field(..., description="API endpoint URL")
     method: str = Field("GET", description="HTTP method (GET, POST, PUT, DELETE)")
-    headers: Optional[Dict[str, str]] = Field(default={}, description="HTTP headers")
-    parameters: Optional[Dict[str, Any]] = Field(default={}, description="Request parameters")
+    headers: Dict[str, str] = Field(default_factory=dict, description="HTTP headers")
+    parameters: Dict[str, Any] = Field(default_factory=dict, description="Request parameters")
     body: Optional[Dict[str, Any]] = Field(default=None, description="Request body (for POST/PUT)")
+    response_path: Optional[str] = Field(
+        default=None,
+        description="Dotted path to the part of the JSON response given to the AI (e.g. data.rooms)",
+    )
     
-    @validator('method')
+    @field_validator('method')
+    @classmethod
     def validate_method(cls, v):
         """Validate HTTP method."""
-        allowed = ["GET", "POST", "PUT", "DELETE", "PATCH"]
-        if v.upper() not in allowed:
-            raise ValueError(f"Method must be one of: {', '.join(allowed)}")
-        return v.upper()
+        method = v.upper()
+        if method not in _ALLOWED_METHODS:
+            raise ValueError(_ALLOWED_METHODS_MSG)
+        return method
 
 
 class EndCallConfig(BaseModel):
@@ -77,11 +93,11 @@ class ToolCreate(BaseModel):
     description: str = Field(..., min_length=1, description="What this tool does (helps AI decide when to use it)")
     tool_type: ToolType
     config: Dict[str, Any] = Field(..., description="Tool-specific configuration")
-    assistant_id: Optional[str] = Field(None, description="Associated assistant ID")
+    assistant_id: Optional[UUID] = Field(None, description="Associated assistant ID")
     is_active: bool = Field(True, description="Whether tool is enabled")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "transfer_to_front_desk",
                 "description": "Transfer call to hotel front desk when guest needs human assistance",
@@ -93,6 +109,7 @@ class ToolCreate(BaseModel):
                 "is_active": True
             }
         }
+    )
 
 
 class ToolUpdate(BaseModel):
@@ -119,8 +136,10 @@ class ToolResponse(BaseModel):
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
     
-    class Config:
-        from_attributes = True  # Allows creation from SQLAlchemy models
+    model_config = ConfigDict(
+        from_attributes=True,  # Allows creation from SQLAlchemy models
+        frozen=True,  # Responses are built once and never mutated
+    )
 
 
 class ToolListResponse(BaseModel):
@@ -6,7 +6,7 @@ Hotels interact with this clean API instead of framework internals.
 """
 
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -21,6 +21,9 @@ class AgentStatus(str, Enum):
 class VoiceAgentConfig(BaseModel):
     """Configuration for a Botelier voice agent"""
     
+    # Assignments (VoiceAgent.update_config) are not re-validated
+    model_config = ConfigDict(validate_assignment=False, frozen=False)
+    
     agent_id: str
     hotel_id: str
     name: str
@@ -53,6 +56,9 @@ class VoiceAgentConfig(BaseModel):
     enable_interruptions: bool = True
     enable_vad: bool = True
     
+    # Caller audio running further behind real time than this is dropped
+    max_audio_backlog_ms: int = 200
+    
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -64,10 +70,24 @@ class VoiceAgent:
     This is the main interface hotels use to create conversational AI.
     """
     
+    __slots__ = ("config", "_pipeline", "_transport", "_summary")
+    
+    # Config field names accepted by update_config
+    _FIELDS = frozenset(VoiceAgentConfig.model_fields)
+    
+    # (failing check, error message) pairs applied by validate()
+    _VALIDATIONS = (
+        (lambda c: not c.name, "Agent name is required"),
+        (lambda c: not c.system_prompt, "System prompt is required"),
+        (lambda c: not 0 <= c.llm_temperature <= 2, "LLM temperature must be between 0 and 2"),
+        (lambda c: not 0.5 <= c.tts_speed <= 2.0, "TTS speed must be between 0.5 and 2.0"),
+    )
+    
     def __init__(self, config: VoiceAgentConfig):
         self.config = config
         self._pipeline = None
         self._transport = None
+        self._summary: Optional[Dict[str, Any]] = None
         
     def to_dict(self) -> Dict[str, Any]:
         """Export agent configuration as dictionary"""
@@ -82,8 +102,10 @@ class VoiceAgent:
     def update_config(self, **kwargs) -> None:
         """Update agent configuration"""
         for key, value in kwargs.items():
-            if hasattr(self.config, key):
+            if key in self._FIELDS:
                 setattr(self.config, key, value)
+        # Drop the memoized summary so it is rebuilt from the new config
+        self._summary = None
     
     def validate(self) -> List[str]:
         """
@@ -92,30 +114,23 @@ class VoiceAgent:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
-        
-        if not self.config.name:
-            errors.append("Agent name is required")
-        
-        if not self.config.system_prompt:
-            errors.append("System prompt is required")
-        
-        if self.config.llm_temperature < 0 or self.config.llm_temperature > 2:
-            errors.append("LLM temperature must be between 0 and 2")
-        
-        if self.config.tts_speed < 0.5 or self.config.tts_speed > 2.0:
-            errors.append("TTS speed must be between 0.5 and 2.0")
-        
-        return errors
+        return [message for failed, message in self._VALIDATIONS if failed(self.config)]
+    
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Agent summary for display, built once until the config is updated"""
+        if self._summary is None:
+            self._summary = {
+                "id": self.config.agent_id,
+                "name": self.config.name,
+                "status": self.config.status,
+                "stt": self.config.stt_provider,
+                "llm": f"{self.config.llm_provider}/{self.config.llm_model}",
+                "tts": self.config.tts_provider,
+                "language": self.config.stt_language,
+            }
+        return self._summary
     
     def get_summary(self) -> Dict[str, Any]:
         """Get agent summary for display"""
-        return {
-            "id": self.config.agent_id,
-            "name": self.config.name,
-            "status": self.config.status,
-            "stt": self.config.stt_provider,
-            "llm": f"{self.config.llm_provider}/{self.config.llm_model}",
-            "tts": self.config.tts_provider,
-            "language": self.config.stt_language,
-        }
+        return self.summary
@@ -0,0 +1,100 @@
+"""
+Call Cache - Short-lived caches for call setup lookups.
+
+Every incoming call resolves its phone number to an assistant and then
+loads that assistant's tools. Both are read-mostly, so results are kept
+for CALL_LOOKUP_TTL_SECONDS and call setup skips the database on a hit.
+
+Values are plain snapshots (no ORM instances), so they are safe to share
+across sessions and threads. Admin write endpoints invalidate entries
+explicitly; the TTL bounds staleness for anything they miss.
+"""
+
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+
+# How long a phone → assistant or assistant → tools lookup is reused
+CALL_LOOKUP_TTL_SECONDS = 60
+
+
+class CallTarget(NamedTuple):
+    """Everything call setup needs about the assistant behind a phone number."""
+    assistant_id: Any
+    assistant_name: str
+    config: Any  # VoiceAgentConfig
+
+
+class ToolSnapshot(NamedTuple):
+    """Detached copy of the Tool columns FunctionMapper reads."""
+    id: Any
+    name: str
+    description: str
+    tool_type: Any
+    config: Dict[str, Any]
+    updated_at: Any
+    
+    @classmethod
+    def from_tool(cls, tool) -> "ToolSnapshot":
+        return cls(tool.id, tool.name, tool.description, tool.tool_type, tool.config, tool.updated_at)
+
+
+_call_targets: Dict[str, Tuple[float, CallTarget]] = {}
+_assistant_tools: Dict[Any, Tuple[float, Tuple[ToolSnapshot, ...]]] = {}
+_lock = threading.Lock()
+
+
+def _get_fresh(cache: Dict, key) -> Optional[Any]:
+    """Return a cached value if still fresh, dropping it if expired."""
+    with _lock:
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= CALL_LOOKUP_TTL_SECONDS:
+            del cache[key]
+            return None
+        return cached[1]
+
+
+def get_call_target(phone_number: str) -> Optional[CallTarget]:
+    """Cached assistant details for a Botelier phone number, if fresh."""
+    return _get_fresh(_call_targets, phone_number)
+
+
+def cache_call_target(phone_number: str, target: CallTarget) -> None:
+    """Remember which assistant answers a phone number."""
+    with _lock:
+        _call_targets[phone_number] = (time.monotonic(), target)
+
+
+def get_assistant_tools(assistant_id) -> Optional[Tuple[ToolSnapshot, ...]]:
+    """Cached active tools for an assistant, if fresh."""
+    return _get_fresh(_assistant_tools, assistant_id)
+
+
+def cache_assistant_tools(assistant_id, tools: Tuple[ToolSnapshot, ...]) -> None:
+    """Remember an assistant's active tools."""
+    with _lock:
+        _assistant_tools[assistant_id] = (time.monotonic(), tools)
+
+
+def invalidate_phone_number(phone_number: str) -> None:
+    """Drop the cached assistant for a phone number (reassigned or released)."""
+    with _lock:
+        _call_targets.pop(phone_number, None)
+
+
+def invalidate_assistant(assistant_id) -> None:
+    """Drop every cached phone number routed to an assistant (assistant edited)."""
+    with _lock:
+        stale = [number for number, (_, target) in _call_targets.items()
+                 if target.assistant_id == assistant_id]
+        for number in stale:
+            del _call_targets[number]
+
+
+def invalidate_assistant_tools(assistant_id) -> None:
+    """Drop the cached tools for an assistant (tool created, edited or deleted)."""
+    with _lock:
+        _assistant_tools.pop(assistant_id, None)
@@ -6,22 +6,107 @@ Pipecat pipelines with TwilioFrameSerializer for real-time audio streaming.
 """
 
 import os
-import json
+import sys
 import asyncio
-from typing import Optional, Dict, Any
+import weakref
+from collections import OrderedDict
+from contextlib import suppress
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
 from fastapi import WebSocket
-from sqlalchemy.orm import Session
+from starlette.websockets import WebSocketState
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import joinedload, load_only
 from loguru import logger
+import orjson
 
 from pipecat.transports.websocket.fastapi import FastAPIWebsocketTransport
-from pipecat.serializers.twilio import TwilioFrameSerializer
 from pipecat.frames.frames import TTSSpeakFrame
+from pipecat.adapters.schemas.tools_schema import ToolsSchema
 
+from . import call_cache
+from .call_cache import CallTarget, ToolSnapshot
 from .engine import VoiceEngineFactory
-from .agent import VoiceAgentConfig
-from .function_mapper import FunctionMapper
+from .serializers import FastTwilioFrameSerializer
+from .agent import AgentStatus, VoiceAgentConfig
+from .function_mapper import bind_call, register_tools
 from ..models.assistant import Assistant
 from ..models.phone_number import PhoneNumber
+from ..models.tool import Tool
+from ..integrations.twilio.client import BotelierTwilioClient
+
+
+# Provider API keys and Twilio credentials, read from the environment once
+# at import instead of on every call
+_API_KEYS: Mapping[str, Optional[str]] = MappingProxyType({
+    "deepgram_api_key": os.environ.get("DEEPGRAM_API_KEY"),
+    "openai_api_key": os.environ.get("OPENAI_API_KEY"),
+    "anthropic_api_key": os.environ.get("ANTHROPIC_API_KEY"),
+    "cartesia_api_key": os.environ.get("CARTESIA_API_KEY"),
+    "elevenlabs_api_key": os.environ.get("ELEVENLABS_API_KEY"),
+    "google_api_key": os.environ.get("GOOGLE_API_KEY"),
+    "assemblyai_api_key": os.environ.get("ASSEMBLYAI_API_KEY"),
+})
+TWILIO_ACCOUNT_SID = os.environ.get("TWILIO_ACCOUNT_SID")
+TWILIO_AUTH_TOKEN = os.environ.get("TWILIO_AUTH_TOKEN")
+
+# Main-account client for completing calls running on other workers;
+# created on first use and reused so its pooled session stays warm
+_twilio_client: Optional[BotelierTwilioClient] = None
+
+# Agent configs keyed by (assistant id, updated_at); an edit to the
+# assistant bumps updated_at, so stale entries are simply never hit again
+AGENT_CONFIG_CACHE_MAX_SIZE = 256
+_agent_config_cache: "OrderedDict[Tuple[Any, Any], VoiceAgentConfig]" = OrderedDict()
+
+# Calls running in this process by call SID. A CallHandler is created per
+# WebSocket, so the registry is module-level to let any handler find any
+# call. Weak values: a call drops out on its own once handle_call returns
+# and releases its task, so no manual cleanup is needed.
+_active_calls: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+
+# Tool columns FunctionMapper reads; everything else is left unloaded
+_TOOL_COLUMNS = (Tool.id, Tool.name, Tool.description, Tool.tool_type, Tool.config, Tool.updated_at)
+
+
+def _get_twilio_client() -> BotelierTwilioClient:
+    """Return the process-wide main-account client, creating it on first use."""
+    global _twilio_client
+    if _twilio_client is None:
+        _twilio_client = BotelierTwilioClient(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+    return _twilio_client
+
+
+def preload_provider_services() -> None:
+    """
+    Import the provider services active assistants use, so the first call
+    doesn't pay for cold module imports, and report any API keys those
+    providers need that aren't configured. Blocking; run it off the event loop.
+    """
+    from ..database import SessionLocal
+    
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(Assistant.stt_provider, Assistant.llm_provider, Assistant.tts_provider)
+            .where(Assistant.is_active.is_(True))
+            .distinct()
+        ).all()
+    
+    missing = sorted({
+        name
+        for row in rows
+        for name in VoiceEngineFactory.required_api_keys(row.stt_provider, row.llm_provider, row.tts_provider)
+        if not _API_KEYS.get(name)
+    })
+    if missing:
+        logger.error("Active assistants need API keys that are not set: {}", ", ".join(missing))
+    
+    VoiceEngineFactory.preload_services(
+        stt_providers=(row.stt_provider for row in rows),
+        llm_providers=(row.llm_provider for row in rows),
+        tts_providers=(row.tts_provider for row in rows),
+    )
 
 
 class CallHandler:
@@ -36,15 +121,24 @@ class CallHandler:
     - Function calling and knowledge base integration
     """
     
-    def __init__(self, db: Session):
+    __slots__ = ("sessionmaker",)
+    
+    def __init__(self, sessionmaker: async_sessionmaker):
         """
-        Initialize call handler with database session.
+        Initialize call handler with an async session factory.
+        
+        Each lookup checks a pooled connection out only for the duration
+        of its query, rather than holding one for the whole call.
         
         Args:
-            db: SQLAlchemy database session for lookups
+            sessionmaker: SQLAlchemy async_sessionmaker for lookups
         """
-        self.db = db
-        self.active_calls: Dict[str, asyncio.Task] = {}
+        self.sessionmaker = sessionmaker
+    
+    @property
+    def active_calls(self) -> "weakref.WeakValueDictionary[str, Any]":
+        """Calls running in this process, by call SID."""
+        return _active_calls
     
     async def handle_call(
         self,
@@ -61,18 +155,21 @@ class CallHandler:
             to_number: Botelier phone number that received the call
         
         Flow:
-            1. Look up phone number → assistant (BEFORE accepting WebSocket)
-            2. Accept WebSocket and receive Twilio 'start' event to get stream_sid
+            1. Accept WebSocket
+            2. Look up phone number → assistant while waiting for Twilio's
+               'start' event (which carries stream_sid), so the DB round-trip
+               overlaps the handshake
             3. Create Pipecat pipeline with TwilioFrameSerializer
             4. Let Pipecat transport handle all subsequent WebSocket messages
             5. Run pipeline (blocking until call ends)
             6. Cleanup
         """
         call_sid = None
+        lookup_task = None
         try:
             # 1. Accept WebSocket FIRST (required before we can close it on error)
             await websocket.accept()
-            logger.info("WebSocket accepted from Twilio")
+            logger.debug("WebSocket accepted from Twilio")
             
             # 2. Validate phone number parameter
             if not to_number:
@@ -80,39 +177,21 @@ class CallHandler:
                 await websocket.close(code=1008, reason="Missing phone number")
                 return
             
-            # 3. Look up which assistant is assigned to this phone number
-            phone_record = self.db.query(PhoneNumber).filter(
-                PhoneNumber.phone_number == to_number
-            ).first()
+            # 3. Start looking up the assistant assigned to this phone number
+            # (cached; on a miss, one async JOIN query). It runs while we wait
+            # for Twilio's 'start' event and is awaited once both are needed.
+            lookup_task = asyncio.create_task(self._resolve_call_target(to_number))
             
-            if not phone_record or not phone_record.assistant_id:
-                logger.warning(f"No assistant assigned to phone number: {to_number}")
-                await websocket.close(code=1008, reason="No assistant assigned")
-                return
-            
-            # 4. Fetch assistant configuration
-            assistant = self.db.query(Assistant).filter(
-                Assistant.id == phone_record.assistant_id
-            ).first()
-            
-            if not assistant:
-                logger.error(f"Assistant not found: {phone_record.assistant_id}")
-                await websocket.close(code=1008, reason="Assistant not found")
-                return
-            
-            logger.info(f"Handling call for assistant '{assistant.name}' (ID: {assistant.id})")
-            
-            # 5. Receive Twilio's 'start' event to extract stream_sid and call_sid
+            # 4. Receive Twilio's 'start' event to extract stream_sid and call_sid
             # We MUST manually parse it because TwilioFrameSerializer:
             # - Requires stream_sid in constructor (not Optional, line 60 in serializer)
             # - deserialize() ignores 'start' events (returns None, line 279)
-            logger.info("Waiting for Twilio 'start' event...")
+            logger.debug("Waiting for Twilio 'start' event...")
             
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(await websocket.receive_text())
             
             if message.get("event") != "start":
-                logger.error(f"Expected 'start' event, got: {message.get('event')}")
+                logger.error("Expected 'start' event, got: {}", message.get("event"))
                 await websocket.close()
                 return
             
@@ -121,25 +200,40 @@ class CallHandler:
             call_sid = start_data.get("callSid")
             
             if not stream_sid or not call_sid:
-                logger.error(f"Missing stream_sid or call_sid in start event")
+                logger.error("Missing stream_sid or call_sid in start event")
                 await websocket.close()
                 return
             
-            logger.info(f"Twilio call started - Stream: {stream_sid}, Call: {call_sid}")
+            # Tag the rest of this call's records with its SID (for structured sinks)
+            log = logger.bind(call_sid=call_sid)
+            log.info("Twilio call started - Stream: {}, Call: {}", stream_sid, call_sid)
             
-            # 4. Convert database model to VoiceAgentConfig
-            config = self._create_agent_config(assistant)
+            target = await lookup_task
             
-            # 5. Get API keys from environment
+            if not target:
+                log.warning("No assistant assigned to phone number: {}", to_number)
+                await websocket.close(code=1008, reason="No assistant assigned")
+                return
+            
+            config = target.config
+            log.info("Handling call for assistant '{}' (ID: {})", target.assistant_name, target.assistant_id)
+            
+            # 5. Get API keys from environment; reject the call now if the
+            # assistant's providers can't authenticate
             api_keys = self._get_api_keys()
+            missing_keys = VoiceEngineFactory.missing_api_keys(config, api_keys)
+            if missing_keys:
+                log.error("Cannot start call, missing API keys: {}", ", ".join(missing_keys))
+                await websocket.close(code=1011, reason="Voice providers not configured")
+                return
             
             # 6. Create TwilioFrameSerializer (Pipecat component - hidden from hotels)
-            serializer = TwilioFrameSerializer(
+            serializer = FastTwilioFrameSerializer(
                 stream_sid=stream_sid,
                 call_sid=call_sid,
-                account_sid=os.environ.get("TWILIO_ACCOUNT_SID"),
-                auth_token=os.environ.get("TWILIO_AUTH_TOKEN"),
-                params=TwilioFrameSerializer.InputParams(
+                account_sid=TWILIO_ACCOUNT_SID,
+                auth_token=TWILIO_AUTH_TOKEN,
+                params=FastTwilioFrameSerializer.InputParams(
                     auto_hang_up=True,  # Automatically hang up when pipeline ends
                 )
             )
@@ -154,62 +248,151 @@ class CallHandler:
                 params=transport_params,
             )
             
-            # 8. Create Pipecat pipeline
-            pipeline, task = VoiceEngineFactory.create_pipeline(
+            # 8. Create Pipecat pipeline in a worker thread - provider imports
+            # and client construction would otherwise stall other calls' setup
+            voice = await asyncio.to_thread(
+                VoiceEngineFactory.create_pipeline,
                 config=config,
                 api_keys=api_keys,
                 transport=transport,
             )
             
+            # Let tool handlers (transfer) find this call from their LLM service
+            bind_call(voice.llm, call_sid, serializer)
+            
             # 9. Set up function calling if enabled
             if config.enable_function_calling:
-                await self._setup_function_calling(assistant, task, api_keys)
+                await self._setup_function_calling(target, voice.llm, voice.context, api_keys)
             
             # 10. Track active call
-            self.active_calls[call_sid] = task
-            
-            # 11. Queue greeting message
-            await task.queue_frames([
-                TTSSpeakFrame(text=config.greeting_message)
-            ])
-            
-            logger.info(f"Starting Pipecat pipeline for call {call_sid}")
-            logger.info(f"Pipeline: STT ({config.stt_provider}) → LLM ({config.llm_provider}) → TTS ({config.tts_provider})")
+            task = voice.task
+            _active_calls[sys.intern(call_sid)] = task
+            
+            @transport.event_handler("on_client_disconnected")
+            async def on_client_disconnected(transport, client):
+                # Twilio closes the stream when the caller hangs up and
+                # after a transfer redirects the call
+                await task.cancel()
+            
+            # 11. Queue greeting message (replayed from cache after the first
+            # call with this voice and greeting, without a TTS request)
+            if not voice.greeting.cached:
+                await task.queue_frames([
+                    TTSSpeakFrame(text=config.greeting_message)
+                ])
+            
+            log.info(
+                "Starting Pipecat pipeline for call {}: STT ({}) → LLM ({}) → TTS ({})",
+                call_sid, config.stt_provider, config.llm_provider, config.tts_provider,
+            )
             
             # 12. Run pipeline (blocks until call ends)
             # Pipecat's FastAPIWebsocketTransport now handles all Twilio messages (media, stop, etc.)
             await task.run()
             
-            logger.info(f"Call {call_sid} ended")
+            log.info("Call {} ended", call_sid)
             
         except Exception as e:
-            logger.exception(f"Error handling call {call_sid}: {e}")
-            if websocket.client_state.name == "CONNECTED":
+            logger.exception("Error handling call {}: {}", call_sid, e)
+            if websocket.client_state is WebSocketState.CONNECTED:
                 await websocket.close()
         finally:
-            # Cleanup
-            if call_sid in self.active_calls:
-                del self.active_calls[call_sid]
+            # Don't leave the lookup running if we bailed out before using
+            # it, and retrieve a failure nobody awaited so asyncio doesn't
+            # log "exception was never retrieved"
+            if lookup_task is not None:
+                if lookup_task.done():
+                    if not lookup_task.cancelled():
+                        lookup_task.exception()
+                else:
+                    lookup_task.cancel()
+                    with suppress(asyncio.CancelledError, Exception):
+                        await lookup_task
+    
+    async def _resolve_call_target(self, to_number: str) -> Optional[CallTarget]:
+        """
+        Resolve a phone number to its assistant and agent config.
+        
+        Served from call_cache when fresh; otherwise queried and cached.
+        The same query also loads the assistant's active tools, which are
+        cached for _setup_function_calling. Unassigned numbers are not
+        cached, so a new assignment takes effect on the next call.
+        """
+        target = call_cache.get_call_target(to_number)
+        if target is not None:
+            return target
+        
+        assistant = await self._find_assistant_for_number(to_number)
+        if not assistant:
+            return None
+        
+        call_cache.cache_assistant_tools(
+            assistant.id,
+            tuple(ToolSnapshot.from_tool(tool) for tool in assistant.active_tools),
+        )
+        target = CallTarget(
+            assistant_id=assistant.id,
+            assistant_name=assistant.name,
+            config=self._create_agent_config(assistant),
+        )
+        call_cache.cache_call_target(to_number, target)
+        return target
+    
+    async def _find_assistant_for_number(self, to_number: str) -> Optional[Assistant]:
+        """
+        Fetch phone number, assistant and active tools in a single query.
+        
+        Args:
+            to_number: Botelier phone number (E.164) that received the call
+            
+        Returns:
+            Assigned Assistant (detached, with active_tools loaded), or None
+            if the number is unknown or unassigned
+        """
+        stmt = (
+            select(PhoneNumber)
+            .options(
+                joinedload(PhoneNumber.assistant)
+                .joinedload(Assistant.active_tools)
+                .load_only(*_TOOL_COLUMNS)
+            )
+            .where(PhoneNumber.phone_number == to_number)
+        )
+        async with self.sessionmaker() as session:
+            result = await session.execute(stmt)
+            phone_record = result.unique().scalars().first()
+            return phone_record.assistant if phone_record else None
     
     def _create_agent_config(self, assistant: Assistant) -> VoiceAgentConfig:
         """
         Convert database Assistant model to VoiceAgentConfig.
         
+        Configs are cached per (assistant.id, assistant.updated_at) and built
+        with model_construct(): the row is trusted DB data, so per-field
+        validation is skipped. Cached configs are shared between calls and
+        must be treated as read-only.
+        
         Args:
             assistant: Database assistant model
             
         Returns:
             VoiceAgentConfig for pipeline creation
         """
-        return VoiceAgentConfig(
+        key = (assistant.id, assistant.updated_at)
+        config = _agent_config_cache.get(key)
+        if config is not None:
+            _agent_config_cache.move_to_end(key)
+            return config
+        
+        config = VoiceAgentConfig.model_construct(
             agent_id=str(assistant.id),
             hotel_id=str(assistant.hotel_id),
             name=assistant.name,
             description=assistant.description,
-            status=assistant.status,
+            status=AgentStatus.ACTIVE if assistant.is_active else AgentStatus.PAUSED,
             stt_provider=assistant.stt_provider,
             stt_model=assistant.stt_model,
-            stt_language=assistant.stt_language or "en",
+            stt_language=assistant.language or "en",
             stt_config=assistant.stt_config or {},
             llm_provider=assistant.llm_provider,
             llm_model=assistant.llm_model,
@@ -219,95 +402,108 @@ class CallHandler:
             tts_provider=assistant.tts_provider,
             tts_voice_id=assistant.tts_voice or "",  # Note: field is 'tts_voice' in DB
             tts_model=assistant.tts_model,
-            tts_speed=assistant.tts_speed or 1.0,
             tts_config=assistant.tts_config or {},
             system_prompt=assistant.system_prompt or "You are a friendly hotel assistant.",
-            greeting_message=assistant.greeting_message or "Hello! How can I help you today?",
+            greeting_message=assistant.first_message or "Hello! How can I help you today?",
             enable_function_calling=True,  # Always enable for tool support
             enable_interruptions=True,
             enable_vad=True,
         )
+        
+        _agent_config_cache[key] = config
+        if len(_agent_config_cache) > AGENT_CONFIG_CACHE_MAX_SIZE:
+            _agent_config_cache.popitem(last=False)
+        return config
     
-    def _get_api_keys(self) -> Dict[str, str]:
+    @staticmethod
+    def _get_api_keys() -> Mapping[str, Optional[str]]:
         """
-        Get API keys from environment variables.
+        Get provider API keys.
         
         Returns:
-            Dictionary of provider API keys
+            Read-only mapping of provider API keys, shared across calls
         """
-        return {
-            "deepgram_api_key": os.environ.get("DEEPGRAM_API_KEY"),
-            "openai_api_key": os.environ.get("OPENAI_API_KEY"),
-            "anthropic_api_key": os.environ.get("ANTHROPIC_API_KEY"),
-            "cartesia_api_key": os.environ.get("CARTESIA_API_KEY"),
-            "elevenlabs_api_key": os.environ.get("ELEVENLABS_API_KEY"),
-            "google_api_key": os.environ.get("GOOGLE_API_KEY"),
-        }
+        return _API_KEYS
+    
+    async def _load_active_tools(self, assistant_id) -> Tuple[ToolSnapshot, ...]:
+        """
+        Fetch the assistant's active tools, loading only the columns mapping needs.
+        
+        Only needed when the tool cache was invalidated or expired
+        independently of the call target; otherwise tools come preloaded
+        from _find_assistant_for_number.
+        
+        Returns:
+            Detached snapshots, safe to cache beyond this session
+        """
+        stmt = (
+            select(Tool)
+            .options(load_only(*_TOOL_COLUMNS))
+            .where(
+                Tool.assistant_id == assistant_id,
+                Tool.is_active.is_(True),
+            )
+        )
+        async with self.sessionmaker() as session:
+            result = await session.execute(stmt)
+            return tuple(ToolSnapshot.from_tool(tool) for tool in result.scalars())
     
     async def _setup_function_calling(
         self,
-        assistant: Assistant,
-        task,
+        target: CallTarget,
+        llm,
+        context,
         api_keys: Dict[str, str]
     ):
         """
         Set up function calling with hotel's configured tools.
         
         Args:
-            assistant: Database assistant model
-            task: Pipecat PipelineTask
+            target: Assistant resolved for this call
+            llm: Pipecat LLM service from the call's pipeline
+            context: The call's LLM context, which carries the tool schemas
             api_keys: API keys for external services
         """
         try:
-            # Import Tool model
-            from ..models.tool import Tool
-            
-            # Fetch active tools for this hotel
-            tools = self.db.query(Tool).filter(
-                Tool.hotel_id == assistant.hotel_id,
-                Tool.is_active == True
-            ).all()
+            # Fetch active tools for this assistant (cached; async query on a miss)
+            tools = call_cache.get_assistant_tools(target.assistant_id)
+            if tools is None:
+                tools = await self._load_active_tools(target.assistant_id)
+                call_cache.cache_assistant_tools(target.assistant_id, tools)
             
             if not tools:
-                logger.debug(f"No active tools found for hotel {assistant.hotel_id}")
+                logger.debug("No active tools found for assistant {}", target.assistant_id)
                 return
             
-            # Create function mapper
-            mapper = FunctionMapper()
-            
-            # Get LLM from pipeline
-            llm = task.pipeline.processors[3]  # LLM is at index 3 in pipeline
+            schemas = register_tools(llm, tools)
+            if schemas:
+                context.set_tools(ToolsSchema(standard_tools=schemas))
             
-            # Register each tool as a function
-            for tool in tools:
-                try:
-                    function_schema, handler = mapper.map_tool_to_function(tool)
-                    
-                    # Register with LLM
-                    llm.register_function(
-                        function_name=function_schema["name"],
-                        handler=handler,
-                    )
-                    
-                    logger.info(f"Registered tool: {tool.name}")
-                except Exception as e:
-                    logger.error(f"Failed to register tool {tool.name}: {e}")
-            
-            logger.info(f"Registered {len(tools)} tools for assistant {assistant.name}")
+            logger.info("Registered {}/{} tools for assistant {}", len(schemas), len(tools), target.assistant_name)
             
         except Exception as e:
-            logger.error(f"Error setting up function calling: {e}")
+            logger.error("Error setting up function calling: {}", e)
     
     async def hangup_call(self, call_sid: str):
         """
         Terminate an active call.
         
+        Calls running in this process are cancelled directly. Otherwise the
+        call is on another worker (or already over), so ask Twilio to
+        complete it; closing the media stream ends it wherever it runs.
+        
         Args:
             call_sid: Twilio Call SID to terminate
         """
-        if call_sid in self.active_calls:
-            task = self.active_calls[call_sid]
-            task.cancel()
-            logger.info(f"Terminated call {call_sid}")
-        else:
-            logger.warning(f"Call {call_sid} not found in active calls")
+        task = _active_calls.get(sys.intern(call_sid))
+        if task is not None:
+            await task.cancel()
+            logger.info("Terminated call {}", call_sid)
+            return
+        
+        if not TWILIO_ACCOUNT_SID or not TWILIO_AUTH_TOKEN:
+            logger.warning("Call {} not found in active calls", call_sid)
+            return
+        
+        if await asyncio.to_thread(_get_twilio_client().end_call, call_sid):
+            logger.info("Call {} not local; completed it via Twilio", call_sid)
@@ -11,17 +11,26 @@ Key Design Principle:
 """
 
 import os
-from typing import Optional, Dict, Any
+import json
+import hashlib
+import weakref
+from functools import partial
+import importlib
+from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Dict, Any, Set, Tuple
 
-# Lazy imports for provider services to avoid startup issues with optional dependencies
-# Services will be imported only when actually used
+from loguru import logger
+
+# Provider services are imported lazily (see _service_classes) to avoid
+# startup issues with optional dependencies
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.task import PipelineTask, PipelineParams
 from pipecat.processors.aggregators.llm_context import LLMContext
 from pipecat.processors.aggregators.llm_response_universal import LLMContextAggregatorPair
 from pipecat.transcriptions.language import Language
+from pipecat.transports.base_transport import TransportParams
 
 from .agent import VoiceAgentConfig
+from .processors import AudioDelayGuard, CachedGreeting
 from ..config.providers import is_flux_model
 
 try:
@@ -30,6 +39,365 @@ except ImportError:
     LiveOptions = None
 
 
+# Twilio plays 8kHz audio. TTS is asked for that rate directly so output
+# audio is never resampled, rather than synthesizing 24kHz and converting
+# every packet down in the serializer
+TWILIO_SAMPLE_RATE = 8000
+
+# Outgoing audio is coalesced into 10ms * N packets before each transport
+# write; 5 gives 50ms (400 bytes of 8kHz mu-law on Twilio) per send
+AUDIO_OUT_10MS_CHUNKS = 5
+
+# (module, class) pairs each provider needs, imported on first use or
+# ahead of time by VoiceEngineFactory.preload_services()
+_STT_SERVICES = {
+    "deepgram": (
+        # Connects without blocking pipeline start (see services.py)
+        ("botelier.voice.services", "BackgroundConnectDeepgramSTTService"),
+        ("pipecat.services.deepgram.flux.stt", "DeepgramFluxSTTService"),
+    ),
+    "openai_whisper": (("botelier.voice.services", "PooledOpenAISTTService"),),
+    "assemblyai": (("pipecat.services.assemblyai", "AssemblyAISTTService"),),
+}
+_LLM_SERVICES = {
+    "openai": (
+        # Shares one HTTP connection pool across calls (see services.py)
+        ("botelier.voice.services", "PooledOpenAILLMService"),
+        ("pipecat.services.openai.base_llm", "BaseOpenAILLMService"),
+    ),
+    "google_gemini": (("pipecat.services.google.llm", "GoogleLLMService"),),
+}
+_TTS_SERVICES = {
+    "deepgram": (("pipecat.services.deepgram.tts", "DeepgramTTSService"),),
+    "cartesia": (("pipecat.services.cartesia.tts", "CartesiaTTSService"),),
+    "elevenlabs": (("pipecat.services.elevenlabs.tts", "ElevenLabsTTSService"),),
+    "openai": (("botelier.voice.services", "PooledOpenAITTSService"),),
+}
+# VAD pulls in onnxruntime, so it is also loaded lazily. The analyzers
+# share one ONNX session per model across calls (see vad.py).
+_VAD_MODULE = "botelier.voice.vad"
+_VAD_CLASSES = (
+    (_VAD_MODULE, "SharedSileroVADAnalyzer"),
+    (_VAD_MODULE, "VADParams"),
+    (_VAD_MODULE, "SharedSmartTurnAnalyzer"),
+)
+
+# api_keys entry each provider authenticates with
+_STT_API_KEYS = {
+    "deepgram": "deepgram_api_key",
+    "openai_whisper": "openai_api_key",
+    "assemblyai": "assemblyai_api_key",
+}
+_LLM_API_KEYS = {
+    "openai": "openai_api_key",
+    "google_gemini": "google_api_key",
+}
+_TTS_API_KEYS = {
+    "deepgram": "deepgram_api_key",
+    "cartesia": "cartesia_api_key",
+    "elevenlabs": "elevenlabs_api_key",
+    "openai": "openai_api_key",
+}
+
+# Resolved classes by (module, class); reads after the first are a dict hit
+_class_registry: Dict[Tuple[str, str], type] = {}
+
+
+class VoicePipeline(NamedTuple):
+    """A built call pipeline with its services addressable by name."""
+    pipeline: Pipeline
+    task: PipelineTask
+    stt: Any
+    llm: Any
+    tts: Any
+    greeting: CachedGreeting
+    context: LLMContext
+
+
+def _service_classes(pairs: Iterable[Tuple[str, str]]) -> Tuple[type, ...]:
+    """Resolve (module, class) pairs through the registry, importing on a miss."""
+    classes = []
+    for pair in pairs:
+        cls = _class_registry.get(pair)
+        if cls is None:
+            module_name, class_name = pair
+            cls = getattr(importlib.import_module(module_name), class_name)
+            _class_registry[pair] = cls
+        classes.append(cls)
+    return tuple(classes)
+
+
+# Provider parameter objects (LiveOptions / InputParams) are pure functions
+# of the assistant's settings, so they are built once and shared; only the
+# service instances themselves are per call
+PARAMS_CACHE_MAX_SIZE = 256
+_params_cache: Dict[Tuple, Any] = {}
+
+
+def _settings_key(settings: Dict[str, Any]) -> str:
+    """Hashable form of a provider config dict (values may be lists)."""
+    return json.dumps(settings, sort_keys=True, default=str)
+
+
+def _cached_params(key: Tuple, build: Callable[[], Any]) -> Any:
+    """Return the params object for `key`, building it on first use."""
+    params = _params_cache.get(key)
+    if params is None:
+        params = build()
+        if len(_params_cache) >= PARAMS_CACHE_MAX_SIZE:
+            _params_cache.clear()
+        _params_cache[key] = params
+    return params
+
+
+class ServiceBuilders(NamedTuple):
+    """Ready-to-call constructors for one agent config's services."""
+    stt: Callable[[], Any]
+    llm: Callable[[], Any]
+    tts: Callable[[], Any]
+
+
+# Service constructors per agent config. Call setup reuses the config
+# object for an assistant until it is edited, so provider dispatch,
+# params lookups and settings keys are resolved once per assistant
+# version instead of on every call. Pydantic models aren't hashable, so
+# entries are keyed by id() and dropped by a weakref callback when the
+# config is collected.
+_builders: Dict[int, Tuple["weakref.ref[VoiceAgentConfig]", ServiceBuilders]] = {}
+
+
+def _service_builders(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> ServiceBuilders:
+    """Return the cached service constructors for `config`, resolving them on first use."""
+    key = id(config)
+    cached = _builders.get(key)
+    if cached is not None and cached[0]() is config:
+        return cached[1]
+    
+    builders = ServiceBuilders(
+        stt=VoiceEngineFactory.stt_builder(config, api_keys),
+        llm=VoiceEngineFactory.llm_builder(config, api_keys),
+        tts=VoiceEngineFactory.tts_builder(config, api_keys),
+    )
+    _builders[key] = (weakref.ref(config, lambda _, key=key: _builders.pop(key, None)), builders)
+    return builders
+
+
+def _prompt_cache_key(config: VoiceAgentConfig) -> Optional[str]:
+    """
+    OpenAI prompt_cache_key for this assistant's system prompt.
+    
+    OpenAI caches prompt prefixes automatically; requests sharing a key are
+    routed to the same cache, so every turn of every call with this system
+    prompt reads the prefix from cache instead of re-prefilling it.
+    Disable with llm_config["enable_prompt_caching"] = False.
+    """
+    if not config.llm_config.get("enable_prompt_caching", True):
+        return None
+    return config.llm_config.get("prompt_cache_key") or (
+        "botelier-" + hashlib.sha256(config.system_prompt.encode()).hexdigest()[:32]
+    )
+
+
+def _greeting_key(config: VoiceAgentConfig) -> str:
+    """Cache key for greeting audio: everything that changes how it sounds."""
+    return hashlib.sha256(_settings_key({
+        "provider": config.tts_provider,
+        "voice": config.tts_voice_id,
+        "model": config.tts_model,
+        "speed": config.tts_speed,
+        "config": config.tts_config,
+        "text": config.greeting_message,
+    }).encode()).hexdigest()
+
+
+# Per-provider service builders. Each takes (config, api_keys) and returns
+# a constructor with the service class and arguments resolved.
+
+def _build_deepgram_stt(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    DeepgramSTTService, DeepgramFluxSTTService = _service_classes(_STT_SERVICES["deepgram"])
+    model = config.stt_model or "nova-3-general"
+    
+    # Check if using Flux model (advanced turn detection)
+    if is_flux_model(model):
+        # Use Deepgram Flux with proper InputParams
+        params = _cached_params(
+            ("deepgram_flux", _settings_key(config.stt_config)),
+            lambda: DeepgramFluxSTTService.InputParams(
+                eager_eot_threshold=config.stt_config.get("eager_eot_threshold"),
+                eot_threshold=config.stt_config.get("eot_threshold", 0.7),
+                eot_timeout_ms=config.stt_config.get("eot_timeout_ms", 5000),
+                keyterm=config.stt_config.get("keyterm", []),
+                tag=config.stt_config.get("tag", []),
+            ),
+        )
+        return partial(
+            DeepgramFluxSTTService,
+            api_key=api_keys.get("deepgram_api_key"),
+            model=model,
+            params=params,
+        )
+    
+    # Use standard Deepgram with LiveOptions
+    live_options = _cached_params(
+        ("deepgram_live", model, config.stt_language, _settings_key(config.stt_config)),
+        lambda: LiveOptions(
+            model=model,
+            language=config.stt_language,
+            punctuate=config.stt_config.get("punctuate", True),
+            smart_format=config.stt_config.get("smart_format", True),
+            profanity_filter=config.stt_config.get("profanity_filter", True),
+            vad_events=config.stt_config.get("vad_events", False),
+            interim_results=True,
+        ),
+    )
+    return partial(
+        DeepgramSTTService,
+        api_key=api_keys.get("deepgram_api_key"),
+        live_options=live_options,
+    )
+
+
+def _build_openai_stt(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    OpenAISTTService, = _service_classes(_STT_SERVICES["openai_whisper"])
+    return partial(
+        OpenAISTTService,
+        api_key=api_keys.get("openai_api_key"),
+        model=config.stt_model or "whisper-1",
+        language=config.stt_language,
+    )
+
+
+def _build_assemblyai_stt(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    AssemblyAISTTService, = _service_classes(_STT_SERVICES["assemblyai"])
+    return partial(
+        AssemblyAISTTService,
+        api_key=api_keys.get("assemblyai_api_key"),
+    )
+
+
+def _build_openai_llm(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    OpenAILLMService, BaseOpenAILLMService = _service_classes(_LLM_SERVICES["openai"])
+    # Use OpenAI's InputParams with provider-specific parameters
+    cache_key = _prompt_cache_key(config)
+    params = _cached_params(
+        (
+            "openai_llm",
+            config.llm_temperature,
+            config.llm_max_tokens,
+            cache_key,
+            _settings_key(config.llm_config),
+        ),
+        lambda: BaseOpenAILLMService.InputParams(
+            temperature=config.llm_temperature,
+            max_completion_tokens=config.llm_max_tokens,
+            frequency_penalty=config.llm_config.get("frequency_penalty", 0.0),
+            presence_penalty=config.llm_config.get("presence_penalty", 0.0),
+            top_p=config.llm_config.get("top_p", 1.0),
+            # extra_body works with any openai SDK version
+            extra={"extra_body": {"prompt_cache_key": cache_key}} if cache_key else {},
+        ),
+    )
+    return partial(
+        OpenAILLMService,
+        api_key=api_keys.get("openai_api_key"),
+        model=config.llm_model,
+        params=params,
+    )
+
+
+def _build_anthropic_llm(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    # TODO: Anthropic support temporarily disabled due to SDK installation issues
+    # Will be re-enabled once anthropic package is properly installed in Replit environment
+    raise ValueError(
+        "Anthropic LLM provider is temporarily unavailable. "
+        "Please use OpenAI or Google Gemini instead."
+    )
+
+
+def _build_gemini_llm(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    GoogleLLMService, = _service_classes(_LLM_SERVICES["google_gemini"])
+    return partial(
+        GoogleLLMService,
+        api_key=api_keys.get("google_api_key"),
+        model=config.llm_model,
+    )
+
+
+def _build_deepgram_tts(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    DeepgramTTSService, = _service_classes(_TTS_SERVICES["deepgram"])
+    return partial(
+        DeepgramTTSService,
+        api_key=api_keys.get("deepgram_api_key"),
+        voice=config.tts_voice_id or "aura-2-helena-en",
+        encoding=config.tts_config.get("encoding", "linear16"),
+    )
+
+
+def _build_cartesia_tts(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    CartesiaTTSService, = _service_classes(_TTS_SERVICES["cartesia"])
+    return partial(
+        CartesiaTTSService,
+        api_key=api_keys.get("cartesia_api_key"),
+        voice_id=config.tts_voice_id,
+    )
+
+
+def _build_elevenlabs_tts(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    ElevenLabsTTSService, = _service_classes(_TTS_SERVICES["elevenlabs"])
+    return partial(
+        ElevenLabsTTSService,
+        api_key=api_keys.get("elevenlabs_api_key"),
+        voice_id=config.tts_voice_id,
+    )
+
+
+def _build_openai_tts(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+    OpenAITTSService, = _service_classes(_TTS_SERVICES["openai"])
+    return partial(
+        OpenAITTSService,
+        api_key=api_keys.get("openai_api_key"),
+        voice=config.tts_voice_id or "alloy",
+        # OpenAI only synthesizes 24kHz; the output transport resamples
+        sample_rate=OpenAITTSService.OPENAI_SAMPLE_RATE,
+    )
+
+
+Builder = Callable[[VoiceAgentConfig, Dict[str, str]], Callable[[], Any]]
+
+_STT_BUILDERS: Dict[str, Builder] = {
+    "deepgram": _build_deepgram_stt,
+    "openai_whisper": _build_openai_stt,
+    "assemblyai": _build_assemblyai_stt,
+}
+_LLM_BUILDERS: Dict[str, Builder] = {
+    "openai": _build_openai_llm,
+    "anthropic": _build_anthropic_llm,
+    "google_gemini": _build_gemini_llm,
+}
+_TTS_BUILDERS: Dict[str, Builder] = {
+    "deepgram": _build_deepgram_tts,
+    "cartesia": _build_cartesia_tts,
+    "elevenlabs": _build_elevenlabs_tts,
+    "openai": _build_openai_tts,
+}
+
+
+def _dispatch(
+    builders: Dict[str, Builder],
+    kind: str,
+    provider: str,
+    config: VoiceAgentConfig,
+    api_keys: Dict[str, str],
+) -> Callable[[], Any]:
+    """Look up and run the builder for `provider`."""
+    provider = provider.lower()
+    try:
+        build = builders[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported {kind} provider: {provider}") from None
+    return build(config, api_keys)
+
+
 class VoiceEngineFactory:
     """
     Factory for creating voice AI pipelines
@@ -41,144 +409,54 @@ class VoiceEngineFactory:
     @staticmethod
     def create_stt_service(config: VoiceAgentConfig, api_keys: Dict[str, str]):
         """Create STT service using Pipecat's proper configuration classes"""
-        provider = config.stt_provider.lower()
-        model = config.stt_model or "nova-3-general"
-        
-        if provider == "deepgram":
-            from pipecat.services.deepgram.stt import DeepgramSTTService
-            from pipecat.services.deepgram.flux.stt import DeepgramFluxSTTService
-            
-            # Check if using Flux model (advanced turn detection)
-            if is_flux_model(model):
-                # Use Deepgram Flux with proper InputParams
-                params = DeepgramFluxSTTService.InputParams(
-                    eager_eot_threshold=config.stt_config.get("eager_eot_threshold"),
-                    eot_threshold=config.stt_config.get("eot_threshold", 0.7),
-                    eot_timeout_ms=config.stt_config.get("eot_timeout_ms", 5000),
-                    keyterm=config.stt_config.get("keyterm", []),
-                    tag=config.stt_config.get("tag", []),
-                )
-                return DeepgramFluxSTTService(
-                    api_key=api_keys.get("deepgram_api_key"),
-                    model=model,
-                    params=params,
-                )
-            else:
-                # Use standard Deepgram with LiveOptions
-                live_options = LiveOptions(
-                    model=model,
-                    language=config.stt_language,
-                    punctuate=config.stt_config.get("punctuate", True),
-                    smart_format=config.stt_config.get("smart_format", True),
-                    profanity_filter=config.stt_config.get("profanity_filter", True),
-                    vad_events=config.stt_config.get("vad_events", False),
-                    interim_results=True,
-                )
-                return DeepgramSTTService(
-                    api_key=api_keys.get("deepgram_api_key"),
-                    live_options=live_options,
-                )
-        elif provider == "openai_whisper":
-            from pipecat.services.openai.stt import OpenAISTTService
-            return OpenAISTTService(
-                api_key=api_keys.get("openai_api_key"),
-                model=model or "whisper-1",
-                language=config.stt_language,
-            )
-        elif provider == "assemblyai":
-            from pipecat.services.assemblyai import AssemblyAISTTService
-            return AssemblyAISTTService(
-                api_key=api_keys.get("assemblyai_api_key"),
-            )
-        else:
-            raise ValueError(f"Unsupported STT provider: {provider}")
+        return VoiceEngineFactory.stt_builder(config, api_keys)()
     
     @staticmethod
     def create_llm_service(config: VoiceAgentConfig, api_keys: Dict[str, str]):
         """Create LLM service using Pipecat's proper InputParams classes"""
-        provider = config.llm_provider.lower()
-        
-        if provider == "openai":
-            from pipecat.services.openai.llm import OpenAILLMService
-            from pipecat.services.openai.base_llm import BaseOpenAILLMService
-            # Use OpenAI's InputParams with provider-specific parameters
-            params = BaseOpenAILLMService.InputParams(
-                temperature=config.llm_temperature,
-                max_completion_tokens=config.llm_max_tokens,
-                frequency_penalty=config.llm_config.get("frequency_penalty", 0.0),
-                presence_penalty=config.llm_config.get("presence_penalty", 0.0),
-                top_p=config.llm_config.get("top_p", 1.0),
-            )
-            return OpenAILLMService(
-                api_key=api_keys.get("openai_api_key"),
-                model=config.llm_model,
-                params=params,
-            )
-        elif provider == "anthropic":
-            # TODO: Anthropic support temporarily disabled due to SDK installation issues
-            # Will be re-enabled once anthropic package is properly installed in Replit environment
-            raise ValueError(
-                "Anthropic LLM provider is temporarily unavailable. "
-                "Please use OpenAI or Google Gemini instead."
-            )
-        elif provider == "google_gemini":
-            from pipecat.services.google.llm import GoogleLLMService
-            return GoogleLLMService(
-                api_key=api_keys.get("google_api_key"),
-                model=config.llm_model,
-            )
-        else:
-            raise ValueError(f"Unsupported LLM provider: {provider}")
+        return VoiceEngineFactory.llm_builder(config, api_keys)()
     
     @staticmethod
     def create_tts_service(config: VoiceAgentConfig, api_keys: Dict[str, str]):
         """Create TTS service using Pipecat's configuration"""
-        provider = config.tts_provider.lower()
-        
-        if provider == "deepgram":
-            from pipecat.services.deepgram.tts import DeepgramTTSService
-            return DeepgramTTSService(
-                api_key=api_keys.get("deepgram_api_key"),
-                voice=config.tts_voice_id or "aura-2-helena-en",
-                encoding=config.tts_config.get("encoding", "linear16"),
-            )
-        elif provider == "cartesia":
-            from pipecat.services.cartesia.tts import CartesiaTTSService
-            return CartesiaTTSService(
-                api_key=api_keys.get("cartesia_api_key"),
-                voice_id=config.tts_voice_id,
-            )
-        elif provider == "elevenlabs":
-            from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
-            return ElevenLabsTTSService(
-                api_key=api_keys.get("elevenlabs_api_key"),
-                voice_id=config.tts_voice_id,
-            )
-        elif provider == "openai":
-            from pipecat.services.openai.tts import OpenAITTSService
-            return OpenAITTSService(
-                api_key=api_keys.get("openai_api_key"),
-                voice=config.tts_voice_id or "alloy",
-            )
-        else:
-            raise ValueError(f"Unsupported TTS provider: {provider}")
+        return VoiceEngineFactory.tts_builder(config, api_keys)()
+    
+    @staticmethod
+    def stt_builder(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+        """Resolve the STT service class and arguments; call the result to construct it"""
+        return _dispatch(_STT_BUILDERS, "STT", config.stt_provider, config, api_keys)
+    
+    @staticmethod
+    def llm_builder(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+        """Resolve the LLM service class and arguments; call the result to construct it"""
+        return _dispatch(_LLM_BUILDERS, "LLM", config.llm_provider, config, api_keys)
+    
+    @staticmethod
+    def tts_builder(config: VoiceAgentConfig, api_keys: Dict[str, str]) -> Callable[[], Any]:
+        """Resolve the TTS service class and arguments; call the result to construct it"""
+        return _dispatch(_TTS_BUILDERS, "TTS", config.tts_provider, config, api_keys)
     
     @staticmethod
     def create_pipeline(
         config: VoiceAgentConfig,
         api_keys: Dict[str, str],
         transport
-    ) -> tuple[Pipeline, PipelineTask]:
+    ) -> VoicePipeline:
         """
         Create complete voice pipeline from agent configuration
         
         This is where Pipecat is actually used, but it's completely hidden
         from the hotel-facing API.
+        
+        Returns:
+            VoicePipeline - services are returned by name so callers can
+            register functions on the LLM without indexing processors
         """
         
-        stt = VoiceEngineFactory.create_stt_service(config, api_keys)
-        llm = VoiceEngineFactory.create_llm_service(config, api_keys)
-        tts = VoiceEngineFactory.create_tts_service(config, api_keys)
+        builders = _service_builders(config, api_keys)
+        stt = builders.stt()
+        llm = builders.llm()
+        tts = builders.tts()
         
         messages = [
             {
@@ -189,14 +467,17 @@ class VoiceEngineFactory:
         
         context = LLMContext(messages)
         context_aggregator = LLMContextAggregatorPair(context)
+        greeting = CachedGreeting(_greeting_key(config))
         
         pipeline = Pipeline(
             [
                 transport.input(),
+                AudioDelayGuard(max_backlog_ms=config.max_audio_backlog_ms),
                 stt,
                 context_aggregator.user(),
                 llm,
                 tts,
+                greeting,
                 transport.output(),
                 context_aggregator.assistant(),
             ]
@@ -205,36 +486,101 @@ class VoiceEngineFactory:
         task = PipelineTask(
             pipeline,
             params=PipelineParams(
+                audio_out_sample_rate=TWILIO_SAMPLE_RATE,
                 enable_metrics=True,
                 enable_usage_metrics=True,
             ),
         )
         
-        return pipeline, task
+        return VoicePipeline(pipeline, task, stt, llm, tts, greeting, context)
     
     @staticmethod
     def create_transport_params(config: VoiceAgentConfig):
         """Create transport parameters based on agent config"""
-        from pipecat.transports.base_transport import TransportParams
-        
         params = TransportParams(
             audio_in_enabled=True,
             audio_out_enabled=True,
+            audio_out_10ms_chunks=config.tts_config.get("audio_out_10ms_chunks", AUDIO_OUT_10MS_CHUNKS),
         )
         
         if config.enable_vad:
             # Lazy import VAD to avoid onnxruntime dependency at startup
             try:
-                from pipecat.audio.vad.silero import SileroVADAnalyzer
-                from pipecat.audio.vad.vad_analyzer import VADParams
-                from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+                SileroVADAnalyzer, VADParams, SmartTurnAnalyzer = _service_classes(_VAD_CLASSES)
                 
                 params.vad_analyzer = SileroVADAnalyzer(
                     params=VADParams(stop_secs=0.2)
                 )
-                params.turn_analyzer = LocalSmartTurnAnalyzerV3()
+                params.turn_analyzer = SmartTurnAnalyzer()
             except ImportError as e:
                 # VAD not available, disable it
                 logger.warning(f"VAD disabled due to missing dependencies: {e}")
         
         return params
+    
+    @staticmethod
+    def required_api_keys(stt_provider: str, llm_provider: str, tts_provider: str) -> Set[str]:
+        """api_keys entries the given providers need (unknown providers need none)."""
+        return {
+            name
+            for table, provider in (
+                (_STT_API_KEYS, stt_provider),
+                (_LLM_API_KEYS, llm_provider),
+                (_TTS_API_KEYS, tts_provider),
+            )
+            if (name := table.get(provider.lower()))
+        }
+    
+    @staticmethod
+    def missing_api_keys(config: VoiceAgentConfig, api_keys: Mapping[str, Optional[str]]) -> List[str]:
+        """
+        API keys this config's providers need that aren't set.
+        
+        Checked before building the pipeline, so a misconfigured deployment
+        rejects the call up front instead of failing inside a provider SDK
+        after setup work is done.
+        """
+        required = VoiceEngineFactory.required_api_keys(
+            config.stt_provider, config.llm_provider, config.tts_provider
+        )
+        return sorted(name for name in required if not api_keys.get(name))
+    
+    @staticmethod
+    def preload_services(
+        stt_providers: Iterable[str],
+        llm_providers: Iterable[str],
+        tts_providers: Iterable[str],
+        include_vad: bool = True,
+    ) -> None:
+        """
+        Import provider service classes (and load the shared VAD models)
+        ahead of the first call.
+        
+        Blocking (cold imports can take hundreds of ms); run it in a
+        background thread at startup. Providers whose dependencies are not
+        installed are skipped with a warning.
+        """
+        groups = [
+            pairs
+            for table, providers in (
+                (_STT_SERVICES, stt_providers),
+                (_LLM_SERVICES, llm_providers),
+                (_TTS_SERVICES, tts_providers),
+            )
+            for provider in {provider.lower() for provider in providers}
+            if (pairs := table.get(provider))
+        ]
+        if include_vad:
+            groups.append(_VAD_CLASSES)
+        
+        for pairs in groups:
+            try:
+                _service_classes(pairs)
+            except ImportError as e:
+                logger.warning("Skipping preload of {}: {}", pairs[0][0], e)
+        
+        if include_vad and _VAD_CLASSES[0] in _class_registry:
+            # Load the shared ONNX sessions too, not just the module
+            importlib.import_module(_VAD_MODULE).preload_models()
+        
+        logger.info("Preloaded {} voice provider classes", len(_class_registry))
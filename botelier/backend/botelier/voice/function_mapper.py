@@ -6,12 +6,99 @@ and the actual Pipecat function calling system during voice conversations.
 """
 
 import os
+import string
+import weakref
 import httpx
-from typing import Dict, Any, List, Callable
-from pipecat.frames.frames import EndFrame, TTSSpeakFrame
-from twilio.rest import Client as TwilioClient
+import orjson
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Callable, NamedTuple, Optional, Set, Tuple
+from loguru import logger
+from pipecat.adapters.schemas.function_schema import FunctionSchema
+from pipecat.frames.frames import EndTaskFrame, TTSSpeakFrame
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.services.llm_service import FunctionCallParams, FunctionCallResultProperties
 
 from botelier.models.tool import Tool, ToolType
+from botelier.voice.serializers import FastTwilioFrameSerializer
+
+
+# Methods whose tool config body is sent as JSON
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
+_FORMATTER = string.Formatter()
+
+TWILIO_CALLS_URL = "https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Calls/{call_sid}.json"
+
+# Calls with a transfer request in flight; a repeated transfer tool call
+# for the same call is ignored rather than redirecting it twice
+_transfers_in_flight: Set[str] = set()
+
+
+class CallInfo(NamedTuple):
+    """The Twilio call behind an LLM service, for tools that act on the call."""
+    call_sid: str
+    serializer: FastTwilioFrameSerializer
+
+
+# Per-call LLM service -> its call. Handlers are shared across calls and only
+# get the LLM service, whatever provider class it is; weak keys drop an
+# entry with its call's pipeline.
+_calls: "weakref.WeakKeyDictionary[Any, CallInfo]" = weakref.WeakKeyDictionary()
+
+
+def bind_call(llm, call_sid: str, serializer: FastTwilioFrameSerializer) -> None:
+    """Record which Twilio call a call's LLM service is serving."""
+    _calls[llm] = CallInfo(call_sid, serializer)
+
+
+def _compile_template(template: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    Pre-parse a str.format template into a renderer over an arguments dict.
+    
+    The template is parsed once when the tool is mapped, so each tool call
+    only looks up and joins its fields. Templates using format specs,
+    conversions or attribute/index lookups fall back to str.format_map.
+    """
+    parts = list(_FORMATTER.parse(template))
+    if all(field is None for _, field, _, _ in parts):
+        return lambda arguments: template
+    if any(
+        field is not None and (spec or conversion or not field.isidentifier())
+        for _, field, spec, conversion in parts
+    ):
+        return template.format_map
+    
+    def render(arguments: Dict[str, Any]) -> str:
+        return "".join(
+            literal if field is None else literal + str(arguments[field])
+            for literal, field, _, _ in parts
+        )
+    return render
+
+
+def _compile_response_path(path: Optional[str]) -> Callable[[Any], Any]:
+    """
+    Pre-split a dotted response path ("data.rooms.0") into an extractor.
+    
+    Lets a tool hand the LLM only the part of a large response it needs,
+    which keeps it out of the context (and every later prompt). Numeric
+    segments index into lists. If the path doesn't match the response,
+    the whole response is returned.
+    """
+    if not path:
+        return lambda data: data
+    segments = [int(part) if part.lstrip("-").isdigit() else part for part in path.split(".")]
+    
+    def extract(data: Any) -> Any:
+        value = data
+        try:
+            for segment in segments:
+                value = value[segment]
+        except (KeyError, IndexError, TypeError):
+            logger.debug("Response path {} not found in API response", path)
+            return data
+        return value
+    return extract
 
 
 class FunctionMapper:
@@ -20,7 +107,7 @@ class FunctionMapper:
     
     Usage:
         # At voice agent initialization
-        tools = db.query(Tool).filter(Tool.is_active == "true").all()
+        tools = db.query(Tool).filter(Tool.is_active.is_(True)).all()
         mapper = FunctionMapper()
         
         # Register all tools with LLM
@@ -31,13 +118,40 @@ class FunctionMapper:
     
     def __init__(self):
         """Initialize function mapper with necessary clients."""
-        # Twilio client for call transfers
-        self.twilio_client = None
+        # Twilio credentials for call transfers (sent over the pooled client)
+        self.twilio_auth: Optional[Tuple[str, str]] = None
         if os.environ.get("TWILIO_ACCOUNT_SID") and os.environ.get("TWILIO_AUTH_TOKEN"):
-            self.twilio_client = TwilioClient(
+            self.twilio_auth = (
                 os.environ.get("TWILIO_ACCOUNT_SID"),
                 os.environ.get("TWILIO_AUTH_TOKEN")
             )
+        # Shared HTTP client for API request tools, created on first use
+        self._http: Optional[httpx.AsyncClient] = None
+    
+    def _client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled HTTP client for API request tools and transfers.
+        
+        Reused across tool calls (and calls) so each request skips the
+        DNS/TCP/TLS handshake; HTTP/2 multiplexes parallel tool calls to
+        the same host over one connection. Every connection the pool may
+        open is also kept alive, so a burst of concurrent tool calls doesn't
+        close and re-dial connections (new DNS lookup, TLS handshake) once
+        it subsides.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+                timeout=httpx.Timeout(5.0, connect=1.0),
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (application shutdown)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     def map_tool_to_function(self, tool: Tool) -> tuple[Dict[str, Any], Callable]:
         """
@@ -77,8 +191,8 @@ class FunctionMapper:
         
         Handler function:
         - Says pre-transfer message
-        - Transfers call to configured number
-        - Ends bot's session
+        - Redirects the call to the configured number
+        - Bot's session ends when Twilio closes the media stream
         """
         phone_number = tool.config.get("phone_number")
         pre_message = tool.config.get("pre_transfer_message", "One moment please...")
@@ -95,51 +209,86 @@ class FunctionMapper:
         }
         
         # Handler function
-        async def transfer_handler(function_name, tool_call_id, arguments, llm, context_aggregator, result_callback):
+        async def transfer_handler(params: FunctionCallParams):
             """
             Handler called when LLM decides to transfer call.
             
             Flow:
                 1. AI says pre-transfer message
-                2. Transfer call via Twilio/Daily
-                3. End bot session
+                2. Call is redirected via Twilio to the configured number
+                3. Twilio closes the media stream, which ends the bot session
+            
+            The call SID and serializer come from bind_call, which the call
+            handler runs for each call's LLM service.
             """
-            # Tell user what's happening
-            await context_aggregator.push_frame(
-                TTSSpeakFrame(pre_message)
-            )
+            llm = params.llm
+            call = _calls.get(llm)
             
-            # Transfer call
-            # Option 1: Twilio REST API (update call with new TwiML)
-            if self.twilio_client and hasattr(context_aggregator, 'call_sid'):
-                try:
-                    call_sid = context_aggregator.call_sid
-                    self.twilio_client.calls(call_sid).update(
-                        twiml=f'<Response><Dial>{phone_number}</Dial></Response>'
-                    )
-                except Exception as e:
-                    print(f"Twilio transfer error: {e}")
+            if not self.twilio_auth or call is None:
+                logger.error("Cannot transfer call: no Twilio credentials or bound call")
+                await params.result_callback({
+                    "status": "failed",
+                    "error": "Call transfer is not available"
+                })
+                return
+            call_sid, serializer = call
+            if call_sid in _transfers_in_flight:
+                # A repeated transfer tool call; the first one is redirecting the call
+                await params.result_callback({
+                    "status": "in_progress",
+                    "to": phone_number
+                })
+                return
             
-            # Option 2: Daily SIP transfer (if using Daily transport)
-            elif hasattr(context_aggregator, 'transport') and hasattr(context_aggregator.transport, 'sip_call_transfer'):
-                try:
-                    await context_aggregator.transport.sip_call_transfer({
-                        "to": phone_number
-                    })
-                except Exception as e:
-                    print(f"Daily SIP transfer error: {e}")
+            # Tell user what's happening (the LLM service sits just upstream of TTS)
+            await llm.push_frame(TTSSpeakFrame(pre_message))
             
-            # End bot's session
-            await context_aggregator.push_frame(EndFrame())
+            # The stream can close before Twilio's API response arrives, so
+            # hang-up on pipeline end is turned off before the redirect
+            serializer.set_auto_hang_up(False)
+            _transfers_in_flight.add(call_sid)
+            try:
+                await self._twilio_transfer(call_sid, phone_number)
+            except Exception:
+                logger.exception("Twilio transfer failed for call {}", call_sid)
+                serializer.set_auto_hang_up(True)
+                await params.result_callback({
+                    "status": "failed",
+                    "error": "Transfer failed"
+                })
+                return
+            finally:
+                _transfers_in_flight.discard(call_sid)
             
-            # Return success to LLM
-            await result_callback({
-                "status": "transferred",
-                "to": phone_number
-            })
+            # The call has left the bot; nothing more for the LLM to say
+            await params.result_callback(
+                {"status": "transferred", "to": phone_number},
+                properties=FunctionCallResultProperties(run_llm=False),
+            )
         
         return function_schema, transfer_handler
     
+    async def _twilio_transfer(self, call_sid: str, phone_number: str) -> None:
+        """
+        Redirect a live call to `phone_number` via Twilio's REST API.
+        
+        Sent on the pooled async client rather than the blocking Twilio SDK,
+        so the request doesn't stall the event loop every call shares.
+        The redirect keeps the call SID, so the caller must turn off the
+        serializer's hang-up first; Twilio may close the media stream
+        (ending the pipeline) before this request returns.
+        
+        Raises:
+            httpx.HTTPError: If the request fails or Twilio rejects it
+        """
+        account_sid, _ = self.twilio_auth
+        response = await self._client().post(
+            TWILIO_CALLS_URL.format(account_sid=account_sid, call_sid=call_sid),
+            data={"Twiml": f"<Response><Dial>{phone_number}</Dial></Response>"},
+            auth=self.twilio_auth,
+        )
+        response.raise_for_status()
+    
     def _map_api_request(self, tool: Tool) -> tuple[Dict[str, Any], Callable]:
         """
         Map API request tool to Pipecat function.
@@ -148,10 +297,11 @@ class FunctionMapper:
         Parameters are extracted from the API config.
         """
         url = tool.config.get("url")
-        method = tool.config.get("method", "GET")
+        method = tool.config.get("method", "GET").upper()
         headers = tool.config.get("headers", {})
         parameters = tool.config.get("parameters", {})
         body = tool.config.get("body")
+        extract = _compile_response_path(tool.config.get("response_path"))
         
         # Build function schema with parameters from config
         function_schema = {
@@ -164,39 +314,42 @@ class FunctionMapper:
             }
         }
         
-        async def api_handler(function_name, tool_call_id, arguments, llm, context_aggregator, result_callback):
+        # Parse URL/header templates and pick the JSON payload once, not per tool call
+        render_url = _compile_template(url)
+        header_renderers = [(name, _compile_template(value)) for name, value in headers.items()]
+        json_payload = body if method in _BODY_METHODS else None
+        
+        async def api_handler(params: FunctionCallParams):
             """
             Handler that makes HTTP request to external API.
             
             The LLM extracts parameter values from conversation and passes them here.
             """
-            # Substitute argument values into URL/body
-            formatted_url = url.format(**arguments)
-            formatted_headers = {k: v.format(**arguments) for k, v in headers.items()}
+            arguments = params.arguments
+            
+            # Substitute argument values into URL/headers
+            formatted_url = render_url(arguments)
+            formatted_headers = {name: render(arguments) for name, render in header_renderers}
             
             # Make API request
-            async with httpx.AsyncClient() as client:
-                try:
-                    if method == "GET":
-                        response = await client.get(formatted_url, headers=formatted_headers)
-                    elif method == "POST":
-                        response = await client.post(formatted_url, headers=formatted_headers, json=body)
-                    elif method == "PUT":
-                        response = await client.put(formatted_url, headers=formatted_headers, json=body)
-                    elif method == "DELETE":
-                        response = await client.delete(formatted_url, headers=formatted_headers)
-                    
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Return result to LLM so it can continue conversation
-                    await result_callback(data)
-                    
-                except httpx.HTTPError as e:
-                    await result_callback({
-                        "error": str(e),
-                        "status": "failed"
-                    })
+            try:
+                response = await self._client().request(
+                    method,
+                    formatted_url,
+                    headers=formatted_headers,
+                    json=json_payload,
+                )
+                response.raise_for_status()
+                data = extract(orjson.loads(response.content))
+                
+                # Return result to LLM so it can continue conversation
+                await params.result_callback(data)
+                
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                await params.result_callback({
+                    "error": str(e),
+                    "status": "failed"
+                })
         
         return function_schema, api_handler
     
@@ -214,17 +367,19 @@ class FunctionMapper:
             }
         }
         
-        async def end_call_handler(function_name, tool_call_id, arguments, llm, context_aggregator, result_callback):
+        async def end_call_handler(params: FunctionCallParams):
             """End the call gracefully."""
             # Say goodbye
-            await context_aggregator.push_frame(
-                TTSSpeakFrame(goodbye_message)
-            )
+            await params.llm.push_frame(TTSSpeakFrame(goodbye_message))
             
-            # End session
-            await context_aggregator.push_frame(EndFrame())
+            # End session once the goodbye has been spoken
+            await params.llm.push_frame(EndTaskFrame(), FrameDirection.UPSTREAM)
             
-            await result_callback({"status": "call_ended"})
+            # The call is ending; another completion would only race the EndFrame
+            await params.result_callback(
+                {"status": "call_ended"},
+                properties=FunctionCallResultProperties(run_llm=False),
+            )
         
         return function_schema, end_call_handler
     
@@ -239,6 +394,96 @@ class FunctionMapper:
         raise NotImplementedError("Email sending not yet implemented")
 
 
+class ToolRegistration(NamedTuple):
+    """What a call needs to offer one tool: its schema and handler."""
+    schema: FunctionSchema
+    handler: Callable
+
+
+# Mapped (function_schema, handler) pairs keyed by (tool id, updated_at).
+# Handlers take all per-call state as arguments, so they can be reused.
+TOOL_FUNCTION_CACHE_MAX_SIZE = 1024
+_tool_function_cache: "OrderedDict[Tuple[Any, Any], Tuple[Dict[str, Any], Callable]]" = OrderedDict()
+_tool_registration_cache: "OrderedDict[Tuple[Any, Any], ToolRegistration]" = OrderedDict()
+_function_mapper: Optional[FunctionMapper] = None
+
+
+def get_function_mapper() -> FunctionMapper:
+    """Return the process-wide FunctionMapper, creating it on first use."""
+    global _function_mapper
+    if _function_mapper is None:
+        _function_mapper = FunctionMapper()
+    return _function_mapper
+
+
+async def close_function_mapper() -> None:
+    """Release the FunctionMapper's pooled HTTP connections (app shutdown)."""
+    if _function_mapper is not None:
+        await _function_mapper.aclose()
+
+
+def map_tool_cached(tool) -> Tuple[Dict[str, Any], Callable]:
+    """Map a tool to its Pipecat function, reusing the result until the tool changes."""
+    key = (tool.id, tool.updated_at)
+    mapped = _tool_function_cache.get(key)
+    if mapped is not None:
+        _tool_function_cache.move_to_end(key)
+        return mapped
+    
+    mapped = get_function_mapper().map_tool_to_function(tool)
+    _tool_function_cache[key] = mapped
+    if len(_tool_function_cache) > TOOL_FUNCTION_CACHE_MAX_SIZE:
+        _tool_function_cache.popitem(last=False)
+    return mapped
+
+
+def tool_registration_cached(tool) -> ToolRegistration:
+    """The tool's FunctionSchema and handler, built once per tool version."""
+    key = (tool.id, tool.updated_at)
+    registration = _tool_registration_cache.get(key)
+    if registration is not None:
+        _tool_registration_cache.move_to_end(key)
+        return registration
+    
+    function_schema, handler = map_tool_cached(tool)
+    parameters = function_schema["parameters"]
+    registration = ToolRegistration(
+        schema=FunctionSchema(
+            name=function_schema["name"],
+            description=function_schema["description"],
+            properties=parameters["properties"],
+            required=parameters["required"],
+        ),
+        handler=handler,
+    )
+    _tool_registration_cache[key] = registration
+    if len(_tool_registration_cache) > TOOL_FUNCTION_CACHE_MAX_SIZE:
+        _tool_registration_cache.popitem(last=False)
+    return registration
+
+
+def register_tools(llm, tools: Iterable) -> List[FunctionSchema]:
+    """
+    Register tools with a call's LLM service.
+    
+    Schemas and handlers come from the per-tool-version cache; a tool that
+    fails to map is logged and skipped.
+    
+    Returns:
+        Schemas of the registered tools, for the LLM context
+    """
+    schemas: List[FunctionSchema] = []
+    for tool in tools:
+        try:
+            registration = tool_registration_cached(tool)
+        except Exception as e:
+            logger.error("Failed to register tool {}: {}", tool.name, e)
+            continue
+        llm.register_function(registration.schema.name, registration.handler)
+        schemas.append(registration.schema)
+    return schemas
+
+
 # Helper function to load tools for a voice agent
 def load_tools_for_assistant(assistant_id: str, db_session) -> List[tuple[Dict[str, Any], Callable]]:
     """
@@ -248,11 +493,7 @@ def load_tools_for_assistant(assistant_id: str, db_session) -> List[tuple[Dict[s
         # In voice agent initialization
         from botelier.voice.function_mapper import load_tools_for_assistant
         
-        tools = load_tools_for_assistant("assistant-123", db)
-        mapper = FunctionMapper()
-        
-        for tool in tools:
-            schema, handler = mapper.map_tool_to_function(tool)
+        for schema, handler in load_tools_for_assistant("assistant-123", db):
             llm.register_function(schema['name'], handler)
     
     Args:
@@ -262,14 +503,37 @@ def load_tools_for_assistant(assistant_id: str, db_session) -> List[tuple[Dict[s
     Returns:
         List of (function_schema, handler) tuples ready for LLM registration
     """
-    from botelier.models.tool import Tool
+    return bulk_load_tools([assistant_id], db_session).get(assistant_id, [])
+
+
+def bulk_load_tools(
+    assistant_ids: Iterable[str],
+    db_session,
+) -> Dict[Any, List[tuple[Dict[str, Any], Callable]]]:
+    """
+    Load active tools for many assistants in one query.
+    
+    Tools are fetched with a single IN (...) query and mapped through the
+    process-wide cache, so unchanged tools reuse their schema and handler.
+    
+    Args:
+        assistant_ids: Assistant IDs to load tools for
+        db_session: SQLAlchemy database session
+        
+    Returns:
+        Dict of assistant ID -> (function_schema, handler) tuples; assistants
+        without active tools are absent. Keys are the IDs as passed in.
+    """
+    keys = {str(assistant_id): assistant_id for assistant_id in assistant_ids}
+    if not keys:
+        return {}
     
-    # Query active tools
     tools = db_session.query(Tool).filter(
-        Tool.assistant_id == assistant_id,
-        Tool.is_active == "true"
+        Tool.assistant_id.in_(list(keys.values())),
+        Tool.is_active.is_(True)
     ).all()
     
-    # Convert to Pipecat functions
-    mapper = FunctionMapper()
-    return [mapper.map_tool_to_function(tool) for tool in tools]
+    functions: Dict[Any, List[tuple[Dict[str, Any], Callable]]] = {}
+    for tool in tools:
+        functions.setdefault(keys[str(tool.assistant_id)], []).append(map_tool_cached(tool))
+    return functions
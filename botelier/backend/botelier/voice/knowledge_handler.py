@@ -6,20 +6,94 @@ that Pipecat voice assistants can call to answer guest questions using
 the hotel's knowledge base Q&A entries.
 
 Pattern follows Pipecat's function calling standard (FunctionCallParams).
+The RAG model's answer is written to be spoken, so it is streamed straight
+to TTS as it generates instead of going back through the voice LLM.
 """
 
+import asyncio
 import os
-from typing import Dict, Any
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Any, Optional, Tuple
 from loguru import logger
-from openai import AsyncOpenAI
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
+from pipecat.frames.frames import (
+    FunctionCallResultProperties,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+)
 from pipecat.services.llm_service import FunctionCallParams
 
+from .services import shared_openai_client
+from ..database import AsyncSessionLocal
+from ..models.knowledge_entry import KnowledgeEntry
+
 
 RAG_MODEL = "gpt-4o-mini"
 RAG_MAX_TOKENS = 100
+# Concurrent RAG completions per process; a burst of questions queues here
+# rather than tripping OpenAI rate limits for every call at once
+RAG_MAX_CONCURRENCY = 20
+_rag_slots = asyncio.Semaphore(RAG_MAX_CONCURRENCY)
 MAX_KNOWLEDGE_CHARS = 50000  # ~12.5k tokens - safe limit for context window
 
+# RAG system prompt: these instructions followed by the hotel's knowledge
+# text. The question goes in its own user message, so a hotel's requests
+# share an identical prefix that OpenAI's prompt cache can serve.
+RAG_SYSTEM_PREFIX = """
+You are a helpful hotel assistant answering guest questions based on the hotel's FAQ knowledge base.
+
+**Instructions:**
+1. Answer questions ONLY using information from the Q&A Knowledge Base below
+2. Keep responses under 50 words - this will be spoken aloud
+3. Use natural, conversational language (no bullet points or special characters)
+4. If the answer isn't in the knowledge base, say "I don't have that information available."
+5. Do not introduce your response - just provide the answer directly
+
+**Q&A Knowledge Base:**
+"""
+
+# Combined Q&A text per hotel, reused across questions for this long.
+# Entry endpoints invalidate explicitly; the TTL also picks up expirations.
+KNOWLEDGE_TTL_SECONDS = 60
+_knowledge_cache: Dict[str, Tuple[float, str]] = {}
+
+# Answers by (hotel, normalized question), each tagged with the hash of the
+# knowledge text it was generated from; a changed knowledge base misses
+ANSWER_CACHE_MAX_SIZE = 512
+_answer_cache: "OrderedDict[Tuple[str, str], Tuple[int, str]]" = OrderedDict()
+
+
+# "[category] Q: ...\nA: ..." per entry; the tag is omitted without a category
+_category_tag = func.coalesce(literal("[") + func.nullif(KnowledgeEntry.category, "") + "] ", "")
+_qa_block = _category_tag + "Q: " + KnowledgeEntry.question + "\nA: " + KnowledgeEntry.answer
+# Stable order, so the RAG prompt prefix stays identical across reloads
+_combined = func.string_agg(aggregate_order_by(_qa_block, KnowledgeEntry.created_at, KnowledgeEntry.id), "\n\n")
+
+# Non-expired entries' count, full length and capped text; built once,
+# each load only adds its hotel filter
+_KNOWLEDGE_QUERY = select(
+    func.count(),
+    func.length(_combined),
+    func.left(_combined, MAX_KNOWLEDGE_CHARS),
+).where(~KnowledgeEntry.is_expired)
+
+
+def _normalize_question(question: str) -> str:
+    """Fold case, whitespace and trailing punctuation so repeat FAQs match."""
+    return " ".join(question.lower().split()).rstrip("?.! ")
+
+
+def invalidate_hotel_knowledge(hotel_id: Optional[Any] = None) -> None:
+    """Drop a hotel's cached knowledge (entries changed), or every hotel's if None."""
+    if hotel_id is None:
+        _knowledge_cache.clear()
+    else:
+        _knowledge_cache.pop(str(hotel_id), None)
+
 
 async def query_hotel_knowledge(params: FunctionCallParams) -> None:
     """
@@ -50,23 +124,57 @@ async def query_hotel_knowledge(params: FunctionCallParams) -> None:
         await params.result_callback({"answer": "I'm sorry, I don't have access to hotel information right now."})
         return
     
-    logger.info(f"Querying knowledge base for hotel {hotel_id}: {question}")
+    logger.info("Querying knowledge base for hotel {}: {}", hotel_id, question)
     
     try:
         knowledge_content = await load_hotel_knowledge(hotel_id)
         
         if not knowledge_content:
-            logger.warning(f"No knowledge base content found for hotel {hotel_id}")
+            logger.warning("No knowledge base content found for hotel {}", hotel_id)
             await params.result_callback({"answer": "I don't have that information available. Let me connect you with our front desk."})
             return
         
-        answer = await query_with_rag(knowledge_content, question)
+        answer_key = (str(hotel_id), _normalize_question(question))
+        # str caches its hash, so this is computed once per loaded knowledge text
+        knowledge_hash = hash(knowledge_content)
         
-        logger.info(f"Knowledge base answered: {answer[:100]}...")
-        await params.result_callback({"answer": answer})
+        speaking = False
+        
+        async def speak(text: str) -> None:
+            # Same frames the voice LLM emits, so TTS starts on the first
+            # sentence and the assistant aggregator records the answer
+            nonlocal speaking
+            if not speaking:
+                speaking = True
+                await params.llm.push_frame(LLMFullResponseStartFrame())
+            await params.llm.push_frame(LLMTextFrame(text))
+        
+        cached = _answer_cache.get(answer_key)
+        try:
+            if cached is not None and cached[0] == knowledge_hash:
+                _answer_cache.move_to_end(answer_key)
+                answer = cached[1]
+                await speak(answer)
+            else:
+                answer = await query_with_rag(
+                    knowledge_content, question, cache_key=f"rag:{hotel_id}", on_text=speak
+                )
+                _answer_cache[answer_key] = (knowledge_hash, answer)
+                if len(_answer_cache) > ANSWER_CACHE_MAX_SIZE:
+                    _answer_cache.popitem(last=False)
+        finally:
+            if speaking:
+                await params.llm.push_frame(LLMFullResponseEndFrame())
+        
+        logger.opt(lazy=True).info("Knowledge base answered: {}...", lambda: answer[:100])
+        # Already spoken; record the result without another LLM turn
+        await params.result_callback(
+            {"answer": answer},
+            properties=FunctionCallResultProperties(run_llm=False),
+        )
         
     except Exception as e:
-        logger.error(f"Error querying knowledge base: {e}")
+        logger.error("Error querying knowledge base: {}", e)
         await params.result_callback({"answer": "I'm having trouble accessing that information. Please ask the front desk for assistance."})
 
 
@@ -74,7 +182,9 @@ async def load_hotel_knowledge(hotel_id: str) -> str:
     """
     Load all active (non-expired) Q&A entries for a hotel.
     
-    Simplified architecture: Entries belong directly to hotels.
+    Simplified architecture: Entries belong directly to hotels. The
+    formatted text is cached per hotel, so follow-up questions in a call
+    (and other calls to the same hotel) skip the database.
     
     Args:
         hotel_id: Hotel UUID
@@ -82,47 +192,49 @@ async def load_hotel_knowledge(hotel_id: str) -> str:
     Returns:
         Formatted Q&A entries ready for RAG context
     """
-    from datetime import date
-    from botelier.database import SessionLocal
-    from botelier.models.knowledge_entry import KnowledgeEntry
+    key = str(hotel_id)
+    cached = _knowledge_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < KNOWLEDGE_TTL_SECONDS:
+        return cached[1]
     
-    db = SessionLocal()
+    combined_content = await _read_hotel_knowledge(hotel_id)
+    _knowledge_cache[key] = (time.monotonic(), combined_content)
+    return combined_content
+
+
+async def _read_hotel_knowledge(hotel_id: str) -> str:
+    """
+    Query and format a hotel's active Q&A entries (uncached).
     
-    try:
-        # Load only non-expired entries for this hotel
-        today = date.today()
-        entries = db.query(KnowledgeEntry).filter(
-            KnowledgeEntry.hotel_id == hotel_id,
-            (KnowledgeEntry.expiration_date.is_(None)) | 
-            (KnowledgeEntry.expiration_date >= today)
-        ).all()
-        
-        if not entries:
-            return ""
-        
-        # Format as Q&A pairs with optional categories
-        qa_blocks = []
-        for entry in entries:
-            category_tag = f"[{entry.category}] " if entry.category else ""
-            qa_block = f"{category_tag}Q: {entry.question}\nA: {entry.answer}"
-            qa_blocks.append(qa_block)
-        
-        combined_content = "\n\n".join(qa_blocks)
-        
-        # Apply safety limit
-        if len(combined_content) > MAX_KNOWLEDGE_CHARS:
-            logger.warning(f"Knowledge base too large ({len(combined_content)} chars), truncating to {MAX_KNOWLEDGE_CHARS}")
-            combined_content = combined_content[:MAX_KNOWLEDGE_CHARS] + "\n\n[... content truncated for length]"
-        
-        logger.info(f"Loaded {len(entries)} active Q&A entries ({len(combined_content)} chars) for hotel {hotel_id}")
-        
-        return combined_content
-        
-    finally:
-        db.close()
+    Formatting, joining and truncation all happen in Postgres, so one
+    row comes back: the entry count, the full length, and at most
+    MAX_KNOWLEDGE_CHARS of text, rather than every entry row.
+    """
+    stmt = _KNOWLEDGE_QUERY.where(KnowledgeEntry.hotel_id == hotel_id)
+    
+    # Async session: this runs on the event loop that streams every call's audio
+    async with AsyncSessionLocal() as db:
+        entry_count, total_chars, combined_content = (await db.execute(stmt)).one()
+    
+    if not entry_count:
+        return ""
+    
+    # Apply safety limit (text is already cut to the limit)
+    if total_chars > MAX_KNOWLEDGE_CHARS:
+        logger.warning("Knowledge base too large ({} chars), truncating to {}", total_chars, MAX_KNOWLEDGE_CHARS)
+        combined_content += "\n\n[... content truncated for length]"
+    
+    logger.info("Loaded {} active Q&A entries ({} chars) for hotel {}", entry_count, len(combined_content), hotel_id)
+    
+    return combined_content
 
 
-async def query_with_rag(knowledge_content: str, question: str) -> str:
+async def query_with_rag(
+    knowledge_content: str,
+    question: str,
+    cache_key: Optional[str] = None,
+    on_text: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> str:
     """
     Query the knowledge base using OpenAI for RAG.
     
@@ -134,6 +246,9 @@ async def query_with_rag(knowledge_content: str, question: str) -> str:
     Args:
         knowledge_content: Formatted Q&A entries
         question: Guest's question
+        cache_key: OpenAI prompt_cache_key, so requests sharing this
+            knowledge base are routed to the same prompt cache
+        on_text: Awaited with each piece of the answer as it streams in
     
     Returns:
         Concise answer (max 100 words for voice)
@@ -144,34 +259,31 @@ async def query_with_rag(knowledge_content: str, question: str) -> str:
         logger.error("OPENAI_API_KEY not set for RAG queries")
         raise ValueError("OpenAI API key not configured")
     
-    client = AsyncOpenAI(api_key=api_key)
-    
-    rag_prompt = f"""
-You are a helpful hotel assistant answering guest questions based on the hotel's FAQ knowledge base.
-
-**Instructions:**
-1. Answer questions ONLY using information from the Q&A Knowledge Base below
-2. Keep responses under 50 words - this will be spoken aloud
-3. Use natural, conversational language (no bullet points or special characters)
-4. If the answer isn't in the knowledge base, say "I don't have that information available."
-5. Do not introduce your response - just provide the answer directly
-
-**Q&A Knowledge Base:**
-{knowledge_content}
-
-**Guest Question:**
-{question}
-"""
-    
-    response = await client.chat.completions.create(
-        model=RAG_MODEL,
-        messages=[
-            {"role": "user", "content": rag_prompt}
-        ],
-        temperature=0.1,
-        max_tokens=RAG_MAX_TOKENS,
-    )
+    # Same pool as the calls' OpenAI services, so RAG lookups ride their
+    # warm keep-alive connections instead of a TLS handshake per question
+    client = shared_openai_client(api_key)
     
-    answer = response.choices[0].message.content.strip()
+    async with _rag_slots:
+        stream = await client.chat.completions.create(
+            model=RAG_MODEL,
+            messages=[
+                # Byte-identical per hotel while its knowledge is unchanged
+                {"role": "system", "content": RAG_SYSTEM_PREFIX + knowledge_content},
+                {"role": "user", "content": question},
+            ],
+            temperature=0.1,
+            max_tokens=RAG_MAX_TOKENS,
+            extra_body={"prompt_cache_key": cache_key} if cache_key else None,
+            stream=True,
+        )
+        
+        parts = []
+        async for chunk in stream:
+            text = chunk.choices[0].delta.content if chunk.choices else None
+            if not text:
+                continue
+            parts.append(text)
+            if on_text is not None:
+                await on_text(text)
     
-    return answer
+    return "".join(parts).strip()
@@ -20,6 +20,8 @@ class AgentOrchestrator:
     def __init__(self):
         self.active_sessions: Dict[str, VoiceSession] = {}
         self.agents: Dict[str, VoiceAgent] = {}
+        # agent_id -> {session_id: session}, kept in step with active_sessions
+        self._sessions_by_agent: Dict[str, Dict[str, VoiceSession]] = {}
     
     def register_agent(self, agent: VoiceAgent) -> None:
         """Register a voice agent"""
@@ -52,14 +54,22 @@ class AgentOrchestrator:
         )
         
         self.active_sessions[session_id] = session
+        self._sessions_by_agent.setdefault(agent_id, {})[session_id] = session
         return session
     
     def end_session(self, session_id: str) -> None:
         """End a voice session"""
-        if session_id in self.active_sessions:
-            session = self.active_sessions[session_id]
-            session.end()
-            del self.active_sessions[session_id]
+        session = self.active_sessions.pop(session_id, None)
+        if session is None:
+            return
+        
+        session.end()
+        agent_id = session.agent.config.agent_id
+        agent_sessions = self._sessions_by_agent.get(agent_id)
+        if agent_sessions is not None:
+            agent_sessions.pop(session_id, None)
+            if not agent_sessions:
+                del self._sessions_by_agent[agent_id]
     
     def get_session(self, session_id: str) -> Optional[VoiceSession]:
         """Get active session by ID"""
@@ -71,7 +81,4 @@ class AgentOrchestrator:
     
     def get_sessions_for_agent(self, agent_id: str) -> list[VoiceSession]:
         """Get all active sessions for a specific agent"""
-        return [
-            session for session in self.active_sessions.values()
-            if session.agent.config.agent_id == agent_id
-        ]
+        return list(self._sessions_by_agent.get(agent_id, {}).values())
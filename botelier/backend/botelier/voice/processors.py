@@ -0,0 +1,168 @@
+"""
+Botelier pipeline processors.
+
+Small Pipecat FrameProcessors that VoiceEngineFactory inserts into call
+pipelines. Like engine.py, this is internal - hotels never see it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from loguru import logger
+from pipecat.frames.frames import (
+    Frame,
+    InputAudioRawFrame,
+    InterruptionFrame,
+    StartFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+DEFAULT_MAX_AUDIO_BACKLOG_MS = 200
+
+# Synthesized greetings by voice/text key; each is a few hundred KB of PCM
+GREETING_CACHE_MAX_SIZE = 64
+_greeting_audio: "OrderedDict[str, Tuple[Tuple[bytes, int, int], ...]]" = OrderedDict()
+_greeting_lock = threading.Lock()
+
+
+class AudioDelayGuard(FrameProcessor):
+    """
+    Sheds stale caller audio when the pipeline falls behind real time.
+
+    Twilio streams audio at a steady real-time pace. If the event loop
+    stalls, frames pile up and are then delivered in a burst; passing them
+    all to STT makes the assistant answer speech from seconds ago.
+
+    The guard keeps an audio clock (seconds of audio seen) against the
+    wall clock. A frame whose arrival lags the audio clock by more than
+    the budget is part of a backlog and is dropped, until the burst has
+    caught up. If frames keep arriving late but at a normal pace, audio
+    was lost upstream rather than queued, so the clock is re-anchored
+    instead of dropping indefinitely.
+    """
+
+    def __init__(self, max_backlog_ms: int = DEFAULT_MAX_AUDIO_BACKLOG_MS, **kwargs):
+        """
+        Args:
+            max_backlog_ms: How far behind real time audio may run before
+                old frames are dropped
+        """
+        super().__init__(**kwargs)
+        self._budget = max_backlog_ms / 1000
+        self._clock_start: Optional[float] = None
+        self._audio_seconds = 0.0
+        self._last_arrival: Optional[float] = None
+        self._late_at_pace = False
+        self._dropped = 0
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, InputAudioRawFrame) and not self._admit(frame):
+            return
+
+        await self.push_frame(frame, direction)
+
+    def _admit(self, frame: InputAudioRawFrame) -> bool:
+        """Advance the audio clock and decide whether to pass this frame on."""
+        now = time.monotonic()
+        duration = frame.num_frames / frame.sample_rate if frame.sample_rate else 0.0
+
+        if self._clock_start is None:
+            self._clock_start = now
+
+        lateness = (now - self._clock_start) - self._audio_seconds
+        bursting = self._last_arrival is not None and (now - self._last_arrival) < duration / 2
+        self._last_arrival = now
+        self._audio_seconds += duration
+
+        if lateness <= self._budget:
+            self._late_at_pace = False
+            if self._dropped:
+                logger.debug("Audio backlog cleared after dropping {} frames", self._dropped)
+                self._dropped = 0
+            return True
+
+        if not bursting and self._late_at_pace:
+            # Steady but late: a gap upstream, not a queue. Start a new clock.
+            self._clock_start = now - (self._audio_seconds - duration)
+            self._late_at_pace = False
+            return True
+
+        self._late_at_pace = not bursting
+        self._dropped += 1
+        return False
+
+
+class CachedGreeting(FrameProcessor):
+    """
+    Replays an assistant's greeting from cache instead of re-synthesizing it.
+    
+    Sits between the TTS service and transport output. The first call for a
+    given voice and greeting speaks it through TTS as usual, and this
+    records the TTS audio for that utterance. Later calls push the recorded
+    audio right after the StartFrame, so the greeting costs no TTS round
+    trip; the caller checks `cached` to skip queueing the TTSSpeakFrame.
+    """
+    
+    def __init__(self, cache_key: str, **kwargs):
+        """
+        Args:
+            cache_key: Identifies the voice settings and greeting text
+        """
+        super().__init__(**kwargs)
+        self._key = cache_key
+        with _greeting_lock:
+            self._audio = _greeting_audio.get(cache_key)
+            if self._audio is not None:
+                _greeting_audio.move_to_end(cache_key)
+        # None once recording is finished (or not needed)
+        self._recording: Optional[List[Tuple[bytes, int, int]]] = None if self._audio else []
+        self._recording_started = False
+    
+    @property
+    def cached(self) -> bool:
+        """Whether this call's greeting will be replayed from cache."""
+        return self._audio is not None
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if self._recording is not None and direction == FrameDirection.DOWNSTREAM:
+            self._record(frame)
+        
+        await self.push_frame(frame, direction)
+        
+        if isinstance(frame, StartFrame) and self._audio:
+            await self.push_frame(TTSStartedFrame())
+            for audio, sample_rate, num_channels in self._audio:
+                await self.push_frame(
+                    TTSAudioRawFrame(audio=audio, sample_rate=sample_rate, num_channels=num_channels)
+                )
+            await self.push_frame(TTSStoppedFrame())
+    
+    def _record(self, frame: Frame):
+        """Capture the first TTS utterance (the greeting) into the cache."""
+        if isinstance(frame, TTSStartedFrame):
+            self._recording_started = True
+        elif not self._recording_started:
+            return
+        elif isinstance(frame, TTSAudioRawFrame):
+            self._recording.append((frame.audio, frame.sample_rate, frame.num_channels))
+        elif isinstance(frame, InterruptionFrame):
+            # Caller cut the greeting off; don't cache a partial one
+            self._recording = None
+        elif isinstance(frame, TTSStoppedFrame):
+            if self._recording:
+                with _greeting_lock:
+                    _greeting_audio[self._key] = tuple(self._recording)
+                    if len(_greeting_audio) > GREETING_CACHE_MAX_SIZE:
+                        _greeting_audio.popitem(last=False)
+                logger.debug("Cached greeting audio ({} chunks)", len(self._recording))
+            self._recording = None
@@ -0,0 +1,72 @@
+"""
+Botelier frame serializers.
+
+Twilio media streams carry every audio packet as a JSON text message, in
+both directions, for the whole call. TwilioFrameSerializer encodes and
+decodes them with the stdlib json module; the subclass here handles the
+per-packet media path with orjson and defers everything else to Pipecat.
+"""
+
+import base64
+
+import orjson
+from pipecat.audio.utils import pcm_to_ulaw, ulaw_to_pcm
+from pipecat.frames.frames import AudioRawFrame, Frame, InputAudioRawFrame, InterruptionFrame
+from pipecat.serializers.twilio import TwilioFrameSerializer
+
+
+class FastTwilioFrameSerializer(TwilioFrameSerializer):
+    """
+    TwilioFrameSerializer with orjson on the media hot path.
+    
+    Output stays a text message (str): Twilio's media stream protocol only
+    accepts JSON text frames, so encoded bytes are decoded once here rather
+    than sent as binary.
+    """
+    
+    async def serialize(self, frame: Frame) -> str | bytes | None:
+        if isinstance(frame, AudioRawFrame):
+            ulaw = await pcm_to_ulaw(
+                frame.audio, frame.sample_rate, self._twilio_sample_rate, self._output_resampler
+            )
+            if not ulaw:
+                return None
+            
+            return orjson.dumps({
+                "event": "media",
+                "streamSid": self._stream_sid,
+                "media": {"payload": base64.b64encode(ulaw).decode("ascii")},
+            }).decode()
+        
+        if isinstance(frame, InterruptionFrame):
+            return orjson.dumps({"event": "clear", "streamSid": self._stream_sid}).decode()
+        
+        # End/Cancel (hang-up) and transport messages are rare; use Pipecat's path
+        return await super().serialize(frame)
+    
+    async def deserialize(self, data: str | bytes) -> Frame | None:
+        message = orjson.loads(data)
+        
+        if message.get("event") != "media":
+            # dtmf / mark / stop: infrequent, let Pipecat handle them
+            return await super().deserialize(data)
+        
+        pcm = await ulaw_to_pcm(
+            base64.b64decode(message["media"]["payload"]),
+            self._twilio_sample_rate,
+            self._sample_rate,
+            self._input_resampler,
+        )
+        if not pcm:
+            return None
+        
+        return InputAudioRawFrame(audio=pcm, num_channels=1, sample_rate=self._sample_rate)
+    
+    def set_auto_hang_up(self, enabled: bool) -> None:
+        """
+        Turn hanging up the call on EndFrame/CancelFrame on or off.
+        
+        A transferred call keeps its call SID, so once the call has been
+        redirected the pipeline ending must no longer hang it up.
+        """
+        self._params.auto_hang_up = enabled
@@ -0,0 +1,170 @@
+"""
+Provider services tuned for call setup latency.
+
+Pipecat's OpenAI services (LLM, Whisper STT, TTS) build a new AsyncOpenAI
+client, and with it a new HTTP connection pool, for every service instance.
+Every call therefore opened fresh TLS connections to the provider before its
+first request. The subclasses here hand out one client per credential set
+for the whole process, so calls reuse warm keep-alive connections.
+
+The service instances themselves stay per call: they are FrameProcessors
+linked into one pipeline and hold per-call state. Only the clients are shared.
+
+Deepgram STT opens a streaming WebSocket per call. Pipecat opens it while
+the StartFrame is held at the STT service, so the handshake delays every
+processor downstream, TTS (and its own connect) included. The subclass
+here connects in the background and only waits for the socket when it
+first needs it.
+
+Loaded lazily by VoiceEngineFactory, like the Pipecat services it wraps.
+"""
+
+import asyncio
+import threading
+from typing import AsyncGenerator, Dict, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from pipecat.frames.frames import CancelFrame, Frame, StartFrame, UserStoppedSpeakingFrame
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.services.deepgram.stt import DeepgramSTTService
+from pipecat.services.openai.llm import OpenAILLMService
+from pipecat.services.openai.stt import OpenAISTTService
+from pipecat.services.openai.tts import OpenAITTSService
+from pipecat.services.stt_service import STTService
+
+
+# (api_key, base_url, organization, project) -> shared client
+_openai_clients: Dict[Tuple[Optional[str], ...], AsyncOpenAI] = {}
+_lock = threading.Lock()
+
+
+def shared_openai_client(
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    organization: Optional[str] = None,
+    project: Optional[str] = None,
+) -> AsyncOpenAI:
+    """Process-wide AsyncOpenAI client for a credential set."""
+    key = (api_key, base_url, organization, project)
+    with _lock:
+        client = _openai_clients.get(key)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                organization=organization,
+                project=project,
+                # Same pool limits Pipecat uses per client
+                http_client=DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=100, max_connections=1000, keepalive_expiry=None
+                    )
+                ),
+            )
+            _openai_clients[key] = client
+        return client
+
+
+async def close_openai_clients() -> None:
+    """Close every shared AsyncOpenAI client (application shutdown)."""
+    with _lock:
+        clients = list(_openai_clients.values())
+        _openai_clients.clear()
+    for client in clients:
+        await client.close()
+
+
+class PooledOpenAILLMService(OpenAILLMService):
+    """OpenAILLMService backed by the shared client for its credentials."""
+    
+    def create_client(
+        self,
+        api_key=None,
+        base_url=None,
+        organization=None,
+        project=None,
+        default_headers=None,
+        **kwargs,
+    ):
+        if default_headers:
+            # Headers are per client; don't leak them into the shared one
+            return super().create_client(
+                api_key=api_key,
+                base_url=base_url,
+                organization=organization,
+                project=project,
+                default_headers=default_headers,
+                **kwargs,
+            )
+        return shared_openai_client(api_key, base_url, organization, project)
+
+
+class PooledOpenAISTTService(OpenAISTTService):
+    """OpenAISTTService backed by the shared client for its credentials."""
+    
+    def _create_client(self, api_key: Optional[str], base_url: Optional[str]):
+        return shared_openai_client(api_key, base_url)
+
+
+class PooledOpenAITTSService(OpenAITTSService):
+    """OpenAITTSService backed by the shared client for its credentials."""
+    
+    def __init__(self, *, api_key: Optional[str] = None, base_url: Optional[str] = None, **kwargs):
+        super().__init__(api_key=api_key, base_url=base_url, **kwargs)
+        # The base class builds its own client (no connections are opened
+        # until first use); swap in the shared one
+        self._client = shared_openai_client(api_key, base_url)
+
+
+class BackgroundConnectDeepgramSTTService(DeepgramSTTService):
+    """
+    DeepgramSTTService that connects without holding up pipeline start.
+    
+    The StartFrame moves on as soon as the connect is started, so the TTS
+    service connects and the greeting plays while the Deepgram handshake
+    is in flight. Caller audio that arrives first waits in this service's
+    input queue until the socket is up.
+    """
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._connect_task: Optional[asyncio.Task] = None
+    
+    async def start(self, frame: StartFrame):
+        # STTService.start; DeepgramSTTService.start would connect inline
+        await STTService.start(self, frame)
+        self._settings["sample_rate"] = self.sample_rate
+        self._connect_task = self.create_task(self._connect())
+    
+    async def cancel(self, frame: CancelFrame):
+        if self._connect_task is not None:
+            await self.cancel_task(self._connect_task)
+            self._connect_task = None
+        if not hasattr(self, "_connection"):
+            # Cancelled before the connect began; nothing to close
+            await STTService.cancel(self, frame)
+            return
+        await super().cancel(frame)
+    
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        await self._connected()
+        async for frame in super().run_stt(audio):
+            yield frame
+    
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        if isinstance(frame, UserStoppedSpeakingFrame):
+            # Handled by sending a finalize over the socket
+            await self._connected()
+        await super().process_frame(frame, direction)
+    
+    async def _disconnect(self):
+        # Covers stop and model/language switches
+        await self._connected()
+        await super()._disconnect()
+    
+    async def _connected(self):
+        """Wait for the background connect, if it hasn't finished yet."""
+        if self._connect_task is not None:
+            task, self._connect_task = self._connect_task, None
+            await task
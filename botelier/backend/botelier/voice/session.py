@@ -4,12 +4,19 @@ Botelier Voice Session
 Represents an active conversation session between a caller and an agent.
 """
 
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, NamedTuple, Optional
 from enum import Enum
 from .agent import VoiceAgent
 
 
+# Most recent messages/events a session keeps in memory; older ones are
+# dropped so a long call's history can't grow without bound
+SESSION_HISTORY_MAX_ENTRIES = 2048
+
+
 class SessionStatus(str, Enum):
     """Voice session status"""
     INITIALIZING = "initializing"
@@ -18,6 +25,21 @@ class SessionStatus(str, Enum):
     ERROR = "error"
 
 
+class SessionMessage(NamedTuple):
+    """A conversation message; timestamp is Unix epoch seconds."""
+    role: str
+    content: str
+    timestamp: float
+    metadata: Dict[str, Any]
+
+
+class SessionEvent(NamedTuple):
+    """A session lifecycle event; timestamp is Unix epoch seconds."""
+    type: str
+    timestamp: float
+    data: Dict[str, Any]
+
+
 class VoiceSession:
     """
     Active voice conversation session
@@ -39,8 +61,13 @@ class VoiceSession:
         self.started_at = datetime.utcnow()
         self.ended_at: Optional[datetime] = None
         
-        self.messages: List[Dict[str, Any]] = []
-        self.events: List[Dict[str, Any]] = []
+        # Tuples rather than dicts: a long call records many entries.
+        # Timestamps are formatted when exporting, not when recorded.
+        self.messages: Deque[SessionMessage] = deque(maxlen=SESSION_HISTORY_MAX_ENTRIES)
+        self.events: Deque[SessionEvent] = deque(maxlen=SESSION_HISTORY_MAX_ENTRIES)
+        # Totals including entries since dropped from the deques
+        self.message_count = 0
+        self.event_count = 0
         
         self._record_event("session_created", {
             "agent_id": agent.config.agent_id,
@@ -67,22 +94,13 @@ class VoiceSession:
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """Record a message in the conversation"""
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": metadata or {}
-        }
-        self.messages.append(message)
+        self.messages.append(SessionMessage(role, content, time.time(), metadata or {}))
+        self.message_count += 1
     
     def _record_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """Record a session event"""
-        event = {
-            "type": event_type,
-            "timestamp": datetime.utcnow().isoformat(),
-            "data": data
-        }
-        self.events.append(event)
+        self.events.append(SessionEvent(event_type, time.time(), data))
+        self.event_count += 1
     
     def get_duration(self) -> Optional[int]:
         """Get session duration in seconds"""
@@ -102,6 +120,6 @@ class VoiceSession:
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "ended_at": self.ended_at.isoformat() if self.ended_at else None,
             "duration_seconds": self.get_duration(),
-            "message_count": len(self.messages),
-            "event_count": len(self.events),
+            "message_count": self.message_count,
+            "event_count": self.event_count,
         }
@@ -0,0 +1,99 @@
+"""
+Shared-model VAD and turn analyzers.
+
+Pipecat's SileroVADAnalyzer and LocalSmartTurnAnalyzerV3 each load their
+ONNX model into a new onnxruntime session per instance, so every call paid
+the model load and held its own copy of the weights. The subclasses here
+load each model once per process and share the session; only per-call state
+(Silero's recurrent state, turn audio buffers) lives on the instance.
+
+onnxruntime's InferenceSession.run is thread-safe, so concurrent calls can
+share a session. Importing this module pulls in onnxruntime.
+"""
+
+from functools import lru_cache
+from importlib import resources
+from typing import Optional
+
+import onnxruntime as ort
+from loguru import logger
+from pipecat.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn
+from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from transformers import WhisperFeatureExtractor
+
+
+def _bundled_model_path(package: str, name: str) -> str:
+    return str(resources.files(package).joinpath(name))
+
+
+@lru_cache(maxsize=None)
+def _silero_session() -> ort.InferenceSession:
+    """Process-wide Silero VAD session (same options Pipecat uses)."""
+    logger.debug("Loading shared Silero VAD model...")
+    opts = ort.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+    return ort.InferenceSession(
+        _bundled_model_path("pipecat.audio.vad.data", "silero_vad.onnx"),
+        providers=["CPUExecutionProvider"],
+        sess_options=opts,
+    )
+
+
+@lru_cache(maxsize=None)
+def _smart_turn_session() -> ort.InferenceSession:
+    """Process-wide smart-turn-v3 session (same options Pipecat uses)."""
+    logger.debug("Loading shared Smart Turn v3 model...")
+    opts = ort.SessionOptions()
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(
+        _bundled_model_path("pipecat.audio.turn.smart_turn.data", "smart-turn-v3.0.onnx"),
+        sess_options=opts,
+    )
+
+
+@lru_cache(maxsize=None)
+def _whisper_features() -> WhisperFeatureExtractor:
+    """Feature extractor for smart-turn; stateless, so one is enough."""
+    return WhisperFeatureExtractor(chunk_length=8)
+
+
+class _SharedSileroModel(SileroOnnxModel):
+    """SileroOnnxModel with per-call state over the shared session."""
+    
+    def __init__(self):
+        self.session = _silero_session()
+        self.reset_states()
+        self.sample_rates = [8000, 16000]
+
+
+class SharedSileroVADAnalyzer(SileroVADAnalyzer):
+    """SileroVADAnalyzer that reuses the process-wide ONNX session."""
+    
+    def __init__(self, *, sample_rate: Optional[int] = None, params: Optional[VADParams] = None):
+        # Skip SileroVADAnalyzer.__init__, which loads its own model
+        VADAnalyzer.__init__(self, sample_rate=sample_rate, params=params)
+        self._model = _SharedSileroModel()
+        self._last_reset_time = 0
+
+
+class SharedSmartTurnAnalyzer(LocalSmartTurnAnalyzerV3):
+    """LocalSmartTurnAnalyzerV3 that reuses the process-wide ONNX session."""
+    
+    def __init__(self, **kwargs):
+        # Skip LocalSmartTurnAnalyzerV3.__init__, which loads its own model
+        BaseSmartTurn.__init__(self, **kwargs)
+        self._feature_extractor = _whisper_features()
+        self._session = _smart_turn_session()
+
+
+def preload_models() -> None:
+    """Load the shared models ahead of the first call."""
+    _silero_session()
+    _smart_turn_session()
+    _whisper_features()
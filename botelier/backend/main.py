@@ -5,11 +5,16 @@ FastAPI application for managing hotel voice AI assistants.
 Provides REST endpoints for tools, integrations, and voice agent configuration.
 """
 
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from loguru import logger
+import asyncio
 import os
+import sys
 
-from botelier.database import init_db
+from botelier.database import async_engine, init_db
+from botelier.api.responses import ORJSONResponse
 from botelier.api import tools_router
 from botelier.api.phone_numbers import router as phone_numbers_router
 from botelier.api.assistants import router as assistants_router
@@ -17,6 +22,52 @@ from botelier.api.knowledge_bases import router as entries_router
 from botelier.api.providers import router as providers_router
 from botelier.api.calls import router as calls_router
 from botelier.api.websockets import router as websockets_router
+from botelier.voice.call_handler import preload_provider_services
+from botelier.voice.function_mapper import close_function_mapper
+from botelier.integrations.twilio.sub_accounts import close_http2_client
+
+# Hand log writes to loguru's background queue so request handlers
+# never block on stderr (e.g. during Twilio error storms). Records below
+# LOG_LEVEL are dropped before their messages are formatted.
+logger.remove()
+logger.add(sys.stderr, level=os.environ.get("LOG_LEVEL", "INFO"), enqueue=True)
+
+
+def _preload_providers():
+    try:
+        preload_provider_services()
+    except Exception as e:
+        logger.warning("Provider preload failed: {}", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the database on startup; close pooled connections on shutdown."""
+    print("🚀 Initializing Botelier backend...")
+    print(f"📊 Database: {os.environ.get('DATABASE_URL', 'Not configured')[:50]}...")
+    # DDL round-trips run in a worker thread, not on the event loop
+    await asyncio.to_thread(init_db)
+    print("✅ Database initialized")
+    
+    # Warm provider imports in the background; keep a reference so the
+    # task isn't garbage collected before it finishes
+    app.state.preload_task = asyncio.create_task(asyncio.to_thread(_preload_providers))
+    
+    yield
+    
+    # A preload still running has nothing left to warm
+    app.state.preload_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.preload_task
+    
+    await close_function_mapper()
+    await close_http2_client()
+    # Provider services are imported lazily; only close clients if a call loaded them
+    services = sys.modules.get("botelier.voice.services")
+    if services is not None:
+        await services.close_openai_clients()
+    await async_engine.dispose()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -25,14 +76,22 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    lifespan=lifespan,
+    # Routes returning plain dicts/lists are encoded with orjson too
+    default_response_class=ORJSONResponse,
 )
 
-# CORS configuration for Next.js frontend
+# CORS configuration for Next.js frontend. ALLOWED_ORIGINS is a comma-separated
+# list; with explicit origins CORSMiddleware matches a set instead of echoing
+# every request's Origin. Unset keeps the permissive development default.
+ALLOWED_ORIGINS = [
+    origin.strip() for origin in os.environ.get("ALLOWED_ORIGINS", "*").split(",") if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # TODO: Restrict in production
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
 )
 
@@ -46,15 +105,6 @@ app.include_router(calls_router)
 app.include_router(websockets_router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup."""
-    print("🚀 Initializing Botelier backend...")
-    print(f"📊 Database: {os.environ.get('DATABASE_URL', 'Not configured')[:50]}...")
-    init_db()
-    print("✅ Database initialized")
-
-
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
@@ -81,5 +131,9 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        # uvicorn[standard] ships uvloop and httptools; fail loudly rather
+        # than silently falling back to the pure-Python loop and parser
+        loop="uvloop",
+        http="httptools",
     )
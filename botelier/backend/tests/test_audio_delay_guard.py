@@ -0,0 +1,52 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from pipecat.frames.frames import InputAudioRawFrame
+
+from botelier.voice import processors
+from botelier.voice.processors import AudioDelayGuard
+
+# 20 ms of 8 kHz 16-bit mono audio, Twilio's packet size
+FRAME_SECONDS = 0.02
+
+
+def _frame() -> InputAudioRawFrame:
+    return InputAudioRawFrame(audio=bytes(320), sample_rate=8000, num_channels=1)
+
+
+class TestAudioDelayGuard(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        clock = mock.patch.object(processors, "time", SimpleNamespace(monotonic=lambda: self.now))
+        clock.start()
+        self.addCleanup(clock.stop)
+        self.guard = AudioDelayGuard(max_backlog_ms=200)
+    
+    def _admit_at(self, when: float) -> bool:
+        self.now = when
+        return self.guard._admit(_frame())
+    
+    def test_real_time_audio_passes(self):
+        results = [self._admit_at(i * FRAME_SECONDS) for i in range(50)]
+        self.assertTrue(all(results))
+    
+    def test_burst_is_dropped_until_caught_up(self):
+        self.assertTrue(self._admit_at(0.0))
+        
+        # A 1 s stall, then the queued frames arrive all at once
+        results = [self._admit_at(1.01) for _ in range(60)]
+        
+        # Frames are dropped until the audio clock is back within 200 ms
+        self.assertFalse(any(results[:40]))
+        self.assertTrue(all(results[40:]))
+        self.assertEqual(self.guard._dropped, 0)
+    
+    def test_late_at_pace_reanchors_clock(self):
+        self.assertTrue(self._admit_at(0.0))
+        
+        # Audio lost upstream: frames resume late, but at the normal pace
+        self.assertFalse(self._admit_at(1.0))
+        self.assertTrue(self._admit_at(1.0 + FRAME_SECONDS))
+        results = [self._admit_at(1.0 + i * FRAME_SECONDS) for i in range(2, 20)]
+        self.assertTrue(all(results))
@@ -0,0 +1,60 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from botelier.voice import call_cache
+from botelier.voice.call_cache import CallTarget, ToolSnapshot
+
+
+class TestCallCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        clock = mock.patch.object(call_cache, "time", SimpleNamespace(monotonic=lambda: self.now))
+        clock.start()
+        self.addCleanup(clock.stop)
+        self.addCleanup(call_cache._call_targets.clear)
+        self.addCleanup(call_cache._assistant_tools.clear)
+    
+    def _target(self, assistant_id="assistant-1"):
+        return CallTarget(assistant_id=assistant_id, assistant_name="Front Desk", config=None)
+    
+    def test_call_target_fresh_within_ttl(self):
+        target = self._target()
+        call_cache.cache_call_target("+15550100", target)
+        self.now += call_cache.CALL_LOOKUP_TTL_SECONDS - 1
+        self.assertIs(call_cache.get_call_target("+15550100"), target)
+    
+    def test_call_target_expires_after_ttl(self):
+        call_cache.cache_call_target("+15550100", self._target())
+        self.now += call_cache.CALL_LOOKUP_TTL_SECONDS
+        self.assertIsNone(call_cache.get_call_target("+15550100"))
+        self.assertNotIn("+15550100", call_cache._call_targets)
+    
+    def test_assistant_tools_expire_after_ttl(self):
+        tools = (ToolSnapshot("tool-1", "transfer", "Transfer", None, {}, None),)
+        call_cache.cache_assistant_tools("assistant-1", tools)
+        self.assertEqual(call_cache.get_assistant_tools("assistant-1"), tools)
+        self.now += call_cache.CALL_LOOKUP_TTL_SECONDS
+        self.assertIsNone(call_cache.get_assistant_tools("assistant-1"))
+    
+    def test_invalidate_phone_number(self):
+        call_cache.cache_call_target("+15550100", self._target())
+        call_cache.invalidate_phone_number("+15550100")
+        self.assertIsNone(call_cache.get_call_target("+15550100"))
+    
+    def test_invalidate_assistant_drops_only_its_numbers(self):
+        call_cache.cache_call_target("+15550100", self._target("assistant-1"))
+        call_cache.cache_call_target("+15550101", self._target("assistant-1"))
+        other = self._target("assistant-2")
+        call_cache.cache_call_target("+15550102", other)
+        
+        call_cache.invalidate_assistant("assistant-1")
+        
+        self.assertIsNone(call_cache.get_call_target("+15550100"))
+        self.assertIsNone(call_cache.get_call_target("+15550101"))
+        self.assertIs(call_cache.get_call_target("+15550102"), other)
+    
+    def test_invalidate_assistant_tools(self):
+        call_cache.cache_assistant_tools("assistant-1", ())
+        call_cache.invalidate_assistant_tools("assistant-1")
+        self.assertIsNone(call_cache.get_assistant_tools("assistant-1"))
@@ -0,0 +1,71 @@
+import unittest
+from unittest import mock
+
+import orjson
+
+from botelier.voice import call_cache
+from botelier.voice.agent import VoiceAgentConfig
+from botelier.voice.call_cache import CallTarget
+from botelier.voice.call_handler import CallHandler
+from botelier.voice.engine import VoiceEngineFactory
+
+
+def _config(**overrides) -> VoiceAgentConfig:
+    return VoiceAgentConfig(agent_id="assistant-1", hotel_id="hotel-1", name="Front Desk", **overrides)
+
+
+class FakeWebSocket:
+    """Twilio media stream socket that sends only the 'start' event."""
+    
+    def __init__(self):
+        self.closed_with = None
+    
+    async def accept(self):
+        pass
+    
+    async def receive_text(self):
+        return orjson.dumps({
+            "event": "start",
+            "streamSid": "MZ123",
+            "start": {"callSid": "CA123"},
+        }).decode()
+    
+    async def close(self, code=1000, reason=None):
+        self.closed_with = code
+
+
+class TestMissingApiKeys(unittest.TestCase):
+    def test_all_keys_present(self):
+        config = _config(stt_provider="deepgram", llm_provider="openai", tts_provider="cartesia")
+        api_keys = {"deepgram_api_key": "dg", "openai_api_key": "oa", "cartesia_api_key": "ca"}
+        self.assertEqual(VoiceEngineFactory.missing_api_keys(config, api_keys), [])
+    
+    def test_missing_and_empty_keys_are_reported(self):
+        config = _config(stt_provider="Deepgram", llm_provider="openai", tts_provider="elevenlabs")
+        api_keys = {"deepgram_api_key": "dg", "openai_api_key": ""}
+        self.assertEqual(
+            VoiceEngineFactory.missing_api_keys(config, api_keys),
+            ["elevenlabs_api_key", "openai_api_key"],
+        )
+    
+    def test_unknown_provider_needs_no_key(self):
+        config = _config(stt_provider="azure", llm_provider="openai", tts_provider="openai")
+        self.assertEqual(VoiceEngineFactory.missing_api_keys(config, {"openai_api_key": "oa"}), [])
+
+
+class TestCallRejection(unittest.IsolatedAsyncioTestCase):
+    async def test_call_rejected_when_api_keys_missing(self):
+        call_cache.cache_call_target(
+            "+15550100",
+            CallTarget(assistant_id="assistant-1", assistant_name="Front Desk", config=_config()),
+        )
+        self.addCleanup(call_cache.invalidate_phone_number, "+15550100")
+        websocket = FakeWebSocket()
+        handler = CallHandler(sessionmaker=None)
+        
+        with mock.patch.object(CallHandler, "_get_api_keys", return_value={}), \
+                mock.patch.object(VoiceEngineFactory, "create_pipeline") as create_pipeline:
+            await handler.handle_call(websocket, "+15550199", "+15550100")
+        
+        self.assertEqual(websocket.closed_with, 1011)
+        create_pipeline.assert_not_called()
@@ -0,0 +1,87 @@
+import ssl
+import unittest
+from unittest import mock
+
+import certifi
+
+from sqlalchemy import Index
+
+from botelier import database
+from botelier.database import _async_database_url
+
+
+class TestAsyncDatabaseUrl(unittest.TestCase):
+    def test_driver_and_plain_url(self):
+        url, connect_args = _async_database_url("postgresql://u:p@db.example.com:5432/botelier")
+        self.assertEqual(url.drivername, "postgresql+asyncpg")
+        self.assertEqual(url.host, "db.example.com")
+        self.assertEqual(url.database, "botelier")
+        self.assertEqual(connect_args, {})
+    
+    def test_sslmode_becomes_ssl(self):
+        url, connect_args = _async_database_url("postgresql://u:p@host/db?sslmode=require")
+        self.assertEqual(dict(url.query), {})
+        self.assertEqual(connect_args, {"ssl": "require"})
+    
+    def test_libpq_parameters_are_translated(self):
+        url, connect_args = _async_database_url(
+            "postgresql://u:p@host/db?sslmode=require&channel_binding=require"
+            "&connect_timeout=10&application_name=botelier"
+            "&options=-c%20search_path%3Dhotel%20--statement_timeout%3D5s"
+        )
+        self.assertEqual(dict(url.query), {})
+        self.assertEqual(connect_args, {
+            "ssl": "require",
+            "timeout": 10.0,
+            "server_settings": {
+                "application_name": "botelier",
+                "search_path": "hotel",
+                "statement_timeout": "5s",
+            },
+        })
+    
+    def test_asyncpg_arguments_are_coerced(self):
+        _, connect_args = _async_database_url(
+            "postgresql://u:p@host/db?command_timeout=30&statement_cache_size=0"
+        )
+        self.assertEqual(connect_args, {"command_timeout": 30.0, "statement_cache_size": 0})
+    
+    def test_root_cert_builds_ssl_context(self):
+        cafile = certifi.where()
+        _, connect_args = _async_database_url(f"postgresql://u:p@host/db?sslmode=verify-full&sslrootcert={cafile}")
+        context = connect_args["ssl"]
+        self.assertIsInstance(context, ssl.SSLContext)
+        self.assertEqual(context.verify_mode, ssl.CERT_REQUIRED)
+        self.assertTrue(context.check_hostname)
+    
+    def test_require_with_root_cert_verifies_ca_only(self):
+        cafile = certifi.where()
+        _, connect_args = _async_database_url(f"postgresql://u:p@host/db?sslmode=require&sslrootcert={cafile}")
+        context = connect_args["ssl"]
+        self.assertEqual(context.verify_mode, ssl.CERT_REQUIRED)
+        self.assertFalse(context.check_hostname)
+    
+    def test_unknown_parameter_is_rejected(self):
+        with self.assertRaises(ValueError):
+            _async_database_url("postgresql://u:p@host/db?sslmode=require&tcp_user_timeout=1000")
+    
+    def test_unsupported_options_are_rejected(self):
+        with self.assertRaises(ValueError):
+            _async_database_url("postgresql://u:p@host/db?options=-p%205432")
+
+
+class TestInitDb(unittest.TestCase):
+    def test_indexes_created_after_column_migration(self):
+        calls = []
+        
+        def record_index(index, bind, checkfirst=False):
+            calls.append((index.name, checkfirst))
+        
+        with mock.patch.object(database.Base.metadata, "create_all"), \
+                mock.patch.object(database, "_migrate_tool_columns", side_effect=lambda: calls.append("migrate")), \
+                mock.patch.object(Index, "create", autospec=True, side_effect=record_index):
+            database.init_db()
+        
+        self.assertEqual(calls[0], "migrate")
+        self.assertIn(("ix_tools_assistant_active", True), calls)
+        self.assertIn(("ix_assistants_hotel_active", True), calls)
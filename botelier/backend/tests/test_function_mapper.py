@@ -0,0 +1,90 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from botelier.models.tool import ToolType
+from botelier.voice.function_mapper import (
+    FunctionMapper,
+    _compile_response_path,
+    _compile_template,
+    bind_call,
+)
+
+
+class TestCompileTemplate(unittest.TestCase):
+    def test_static_template(self):
+        render = _compile_template("https://api.example.com/rooms")
+        self.assertEqual(render({}), "https://api.example.com/rooms")
+    
+    def test_fields_are_substituted(self):
+        render = _compile_template("https://api.example.com/rooms/{room}?date={date}")
+        self.assertEqual(
+            render({"room": 101, "date": "2025-01-01"}),
+            "https://api.example.com/rooms/101?date=2025-01-01",
+        )
+    
+    def test_format_spec_falls_back_to_format_map(self):
+        render = _compile_template("Total: {price:.2f}")
+        self.assertEqual(render({"price": 3.5}), "Total: 3.50")
+    
+    def test_index_lookup_falls_back_to_format_map(self):
+        render = _compile_template("{dates[0]}")
+        self.assertEqual(render({"dates": ["2025-01-01"]}), "2025-01-01")
+    
+    def test_missing_argument_raises(self):
+        render = _compile_template("{room}")
+        with self.assertRaises(KeyError):
+            render({})
+
+
+class TestCompileResponsePath(unittest.TestCase):
+    def test_no_path_returns_whole_response(self):
+        data = {"rooms": []}
+        self.assertIs(_compile_response_path(None)(data), data)
+    
+    def test_dotted_path_with_list_index(self):
+        extract = _compile_response_path("data.rooms.0.rate")
+        self.assertEqual(extract({"data": {"rooms": [{"rate": 120}]}}), 120)
+    
+    def test_negative_index(self):
+        extract = _compile_response_path("rooms.-1")
+        self.assertEqual(extract({"rooms": [1, 2, 3]}), 3)
+    
+    def test_unmatched_path_returns_whole_response(self):
+        data = {"data": {"rooms": []}}
+        extract = _compile_response_path("data.rooms.0")
+        self.assertIs(extract(data), data)
+
+
+class TestTransferHandler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mapper = FunctionMapper()
+        self.mapper.twilio_auth = ("AC123", "token")
+        tool = SimpleNamespace(
+            name="transfer_to_front_desk",
+            description="Transfer to the front desk",
+            tool_type=ToolType.TRANSFER_CALL,
+            config={"phone_number": "+15550123"},
+        )
+        _, self.handler = self.mapper.map_tool_to_function(tool)
+        self.llm = mock.Mock(push_frame=mock.AsyncMock())
+        self.results = []
+    
+    def _params(self) -> SimpleNamespace:
+        async def result_callback(result, properties=None):
+            self.results.append(result)
+        return SimpleNamespace(llm=self.llm, arguments={}, context=None, result_callback=result_callback)
+    
+    async def test_unbound_call_fails(self):
+        await self.handler(self._params())
+        self.assertEqual(self.results[0]["status"], "failed")
+    
+    async def test_bound_call_is_transferred_without_hang_up(self):
+        serializer = mock.Mock()
+        bind_call(self.llm, "CA123", serializer)
+        with mock.patch.object(self.mapper, "_twilio_transfer", mock.AsyncMock()) as transfer:
+            await self.handler(self._params())
+        
+        transfer.assert_awaited_once_with("CA123", "+15550123")
+        serializer.set_auto_hang_up.assert_called_once_with(False)
+        self.assertEqual(self.results[0]["status"], "transferred")
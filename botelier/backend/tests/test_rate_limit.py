@@ -0,0 +1,54 @@
+import unittest
+from unittest import mock
+
+from twilio.base.exceptions import TwilioRestException
+
+from botelier.integrations.twilio import rate_limit
+from botelier.integrations.twilio.rate_limit import (
+    ThrottledTwilioRestException,
+    TokenBucket,
+    parse_retry_after,
+    rate_limited,
+)
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_delta_seconds(self):
+        self.assertEqual(parse_retry_after("5"), 5.0)
+    
+    def test_missing_or_invalid(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+    
+    def test_past_http_date_is_zero(self):
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+
+class TestRateLimitedRetryAfter(unittest.TestCase):
+    def _throttled_then_ok(self, error):
+        calls = []
+        
+        @rate_limited(TokenBucket(rate=1000.0, capacity=10))
+        def update():
+            calls.append(None)
+            if len(calls) == 1:
+                raise error
+            return "ok"
+        
+        with mock.patch.object(rate_limit.time, "sleep") as sleep:
+            self.assertEqual(update(), "ok")
+        return sleep
+    
+    def test_waits_for_longer_retry_after(self):
+        error = ThrottledTwilioRestException(429, "uri", retry_after=7.0)
+        sleep = self._throttled_then_ok(error)
+        sleep.assert_called_once_with(7.0)
+    
+    def test_backoff_wins_over_shorter_retry_after(self):
+        error = ThrottledTwilioRestException(429, "uri", retry_after=0.1)
+        sleep = self._throttled_then_ok(error)
+        sleep.assert_called_once_with(rate_limit.THROTTLE_BACKOFF_SECONDS)
+    
+    def test_sdk_error_uses_backoff(self):
+        sleep = self._throttled_then_ok(TwilioRestException(429, "uri"))
+        sleep.assert_called_once_with(rate_limit.THROTTLE_BACKOFF_SECONDS)